@@ -56,6 +56,8 @@ class Config:
     # Trading Configuration
     DEFAULT_CURRENCIES = ['BTC', 'ETH', 'OP', 'BNB', 'SOL', 'DOGE', 'TRX', 'USDT', 
                           'XRP', 'ADA', 'NEAR', 'LTC', 'BCH', 'XLM', 'LINK', 'MATIC']
+    # Currencies that can be bought/sold against USDT (computed once)
+    TRADEABLE_CURRENCIES = tuple(c for c in DEFAULT_CURRENCIES if c != 'USDT')
     DEFAULT_TRADING_PAIRS = [
         'BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'SOL/USDT',
         'XRP/USDT', 'ADA/USDT', 'DOGE/USDT', 'TRX/USDT',
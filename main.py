@@ -3,7 +3,7 @@ import os
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QIcon
+from ui.icons import get_icon
 from ui.login_window import LoginWindow
 from ui.trading_window import TradingWindow
 from auth.google_auth import GoogleAuthManager
@@ -35,6 +35,17 @@ def check_prerequisites():
     return True
 
 
+def load_stylesheet():
+    """Read the application stylesheet from assets/styles.qss."""
+    qss_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'styles.qss')
+    try:
+        with open(qss_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError as e:
+        print(f"⚠️ Could not load stylesheet: {e}")
+        return ''
+
+
 class MainWindow(QMainWindow):
     """Main trading window (placeholder for now)."""
     
@@ -49,9 +60,9 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1400, 800)
         
         # Set window icon
-        icon_path = self.get_icon_path('app_icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = get_icon('app_icon.png')
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # Placeholder content
         central_widget = QLabel(
@@ -70,14 +81,6 @@ class MainWindow(QMainWindow):
         """)
         
         self.setCentralWidget(central_widget)
-    
-    def get_icon_path(self, icon_name):
-        """Get the absolute path to an icon file."""
-        # Get the directory of this file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Go to assets/icons
-        icon_path = os.path.join(current_dir, 'assets', 'icons', icon_name)
-        return os.path.abspath(icon_path)
 
 
 class CryptoTradingApp:
@@ -87,10 +90,15 @@ class CryptoTradingApp:
         self.app = QApplication(sys.argv)
         self.app.setStyle('Fusion')  # Modern look
         
+        # Shared stylesheet, parsed once for every window
+        stylesheet = load_stylesheet()
+        if stylesheet:
+            self.app.setStyleSheet(stylesheet)
+        
         # Set application icon
-        icon_path = self.get_icon_path('app_icon.png')
-        if os.path.exists(icon_path):
-            self.app.setWindowIcon(QIcon(icon_path))
+        app_icon = get_icon('app_icon.png')
+        if app_icon is not None:
+            self.app.setWindowIcon(app_icon)
         
         self.login_window = None
         self.main_window = None
@@ -172,12 +180,6 @@ class CryptoTradingApp:
                 "Could not load user data from database.\n\nPlease check:\n1. Database is running\n2. .env configuration is correct\n3. Run reset_neon_database.sql if needed"
             )
             sys.exit(1)
-    
-    def get_icon_path(self, icon_name):
-        """Get the absolute path to an icon file."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_path = os.path.join(current_dir, 'assets', 'icons', icon_name)
-        return os.path.abspath(icon_path)
 
 
 def main():
@@ -0,0 +1,17 @@
+-- ============================================================================
+-- Neon Database Migration: transaction history indexes
+-- Safe to run on an existing database (no data is changed)
+-- Run each statement on its own - CONCURRENTLY cannot run inside a transaction
+-- ============================================================================
+
+-- P2P trades accepted by a user, newest first (history acceptor half)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_p2p_trades_acceptor_time
+    ON "P2PTradeTransactions"(acceptor_id, created_at DESC);
+
+-- Offers created by a user (history creator half, My Offers)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trade_offers_creator_id
+    ON "TradeOffers"(creator_id);
+
+-- Join from an offer to its completed trade
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_p2p_trades_offer_id
+    ON "P2PTradeTransactions"(offer_id);
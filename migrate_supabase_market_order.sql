@@ -0,0 +1,81 @@
+-- ============================================================================
+-- Supabase Database Migration: atomic market orders
+-- Safe to run on an existing database (no data is changed)
+-- Run in the Supabase SQL editor; SupabaseDB.execute_market_order calls it
+-- ============================================================================
+
+-- Balance check, both wallet updates, the order and its transaction in one
+-- call. A function runs inside a single transaction, so a failure at any
+-- step leaves the wallets untouched.
+-- Drop the earlier signature (without p_timestamp) so only one version exists
+DROP FUNCTION IF EXISTS execute_market_order(INTEGER, TEXT, TEXT, NUMERIC, NUMERIC);
+
+CREATE OR REPLACE FUNCTION execute_market_order(
+    p_user_id INTEGER,
+    p_pair TEXT,
+    p_side TEXT,
+    p_amount NUMERIC,
+    p_price NUMERIC,
+    p_timestamp TIMESTAMP  -- client clock, like every other SupabaseDB write
+) RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_base TEXT := split_part(p_pair, '/', 1);
+    v_quote TEXT := split_part(p_pair, '/', 2);
+    v_total NUMERIC := p_amount * p_price;
+    v_fee NUMERIC := p_amount * p_price * 0.001;  -- 0.1% fee
+    v_pay_currency TEXT;
+    v_pay_amount NUMERIC;
+    v_get_currency TEXT;
+    v_get_amount NUMERIC;
+    v_balance NUMERIC;
+    v_order "Orders";
+    v_transaction "Transactions";
+BEGIN
+    IF p_side = 'buy' THEN
+        v_pay_currency := v_quote;
+        v_pay_amount := v_total + v_fee;
+        v_get_currency := v_base;
+        v_get_amount := p_amount;
+    ELSE
+        v_pay_currency := v_base;
+        v_pay_amount := p_amount;
+        v_get_currency := v_quote;
+        v_get_amount := v_total - v_fee;
+    END IF;
+
+    -- Lock both wallets (always in currency order, so concurrent orders
+    -- cannot deadlock) until the transaction ends
+    PERFORM 1 FROM "Wallets"
+        WHERE user_id = p_user_id AND currency IN (v_base, v_quote)
+        ORDER BY currency
+        FOR UPDATE;
+
+    SELECT balance INTO v_balance FROM "Wallets"
+        WHERE user_id = p_user_id AND currency = v_pay_currency;
+    IF v_balance IS NULL OR v_balance < v_pay_amount THEN
+        RETURN jsonb_build_object('success', false, 'error', 'Insufficient balance');
+    END IF;
+
+    UPDATE "Wallets" SET balance = balance - v_pay_amount
+        WHERE user_id = p_user_id AND currency = v_pay_currency;
+    UPDATE "Wallets" SET balance = balance + v_get_amount
+        WHERE user_id = p_user_id AND currency = v_get_currency;
+
+    INSERT INTO "Orders" (user_id, pair, type, side, price, amount, status, timestamp)
+        VALUES (p_user_id, p_pair, 'market', p_side, p_price, p_amount, 'filled', p_timestamp)
+        RETURNING * INTO v_order;
+
+    INSERT INTO "Transactions" (user_id, order_id, pair, type, amount, price, fee, timestamp)
+        VALUES (p_user_id, v_order.order_id, p_pair, p_side, p_amount, p_price, v_fee, p_timestamp)
+        RETURNING * INTO v_transaction;
+
+    RETURN jsonb_build_object(
+        'success', true,
+        'order', to_jsonb(v_order),
+        'transaction', to_jsonb(v_transaction),
+        'fee', v_fee
+    );
+END;
+$$;
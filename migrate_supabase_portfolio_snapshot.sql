@@ -0,0 +1,46 @@
+-- ============================================================================
+-- Supabase Database Migration: portfolio snapshot in one call
+-- Safe to run on an existing database (no data is changed)
+-- Run in the Supabase SQL editor; SupabaseDB.get_portfolio_snapshot calls it
+-- ============================================================================
+
+-- Wallets plus the transactions a portfolio refresh needs, as JSON arrays:
+--   transactions        newest p_limit rows, newest first (only without p_since)
+--   transactions_since  rows after p_since, oldest first (only with p_since)
+--   transactions_today  rows since p_today_start, newest first (only with it)
+CREATE OR REPLACE FUNCTION get_portfolio_snapshot(
+    p_user_id INTEGER,
+    p_since TIMESTAMP DEFAULT NULL,
+    p_today_start TIMESTAMP DEFAULT NULL,
+    p_limit INTEGER DEFAULT 1000
+) RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'wallets', (
+            SELECT COALESCE(jsonb_agg(w ORDER BY w.currency), '[]')
+            FROM "Wallets" w
+            WHERE w.user_id = p_user_id
+        ),
+        'transactions', CASE WHEN p_since IS NULL THEN (
+            SELECT COALESCE(jsonb_agg(t ORDER BY t.timestamp DESC), '[]')
+            FROM (
+                SELECT * FROM "Transactions"
+                WHERE user_id = p_user_id
+                ORDER BY timestamp DESC
+                LIMIT p_limit
+            ) t
+        ) END,
+        'transactions_since', CASE WHEN p_since IS NOT NULL THEN (
+            SELECT COALESCE(jsonb_agg(t ORDER BY t.timestamp), '[]')
+            FROM "Transactions" t
+            WHERE t.user_id = p_user_id AND t.timestamp > p_since
+        ) END,
+        'transactions_today', CASE WHEN p_today_start IS NOT NULL THEN (
+            SELECT COALESCE(jsonb_agg(t ORDER BY t.timestamp DESC), '[]')
+            FROM "Transactions" t
+            WHERE t.user_id = p_user_id AND t.timestamp >= p_today_start
+        ) END
+    );
+$$;
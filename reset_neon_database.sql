@@ -110,6 +110,7 @@ CREATE INDEX idx_transactions_type ON "UserTransactions"(transaction_type);
 CREATE INDEX idx_transactions_created_at ON "UserTransactions"(created_at);
 CREATE INDEX idx_p2p_trades_offer_id ON "P2PTradeTransactions"(offer_id);
 CREATE INDEX idx_p2p_trades_acceptor_id ON "P2PTradeTransactions"(acceptor_id);
+CREATE INDEX idx_p2p_trades_acceptor_time ON "P2PTradeTransactions"(acceptor_id, created_at DESC);
 
 -- ============================================================================
 -- VERIFICATION
@@ -0,0 +1,30 @@
+"""Shared icon cache for the app's windows."""
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+from PyQt6.QtGui import QIcon
+
+
+ICONS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'icons'))
+
+# Decoded icons keyed by file name (None when no icon file exists)
+_icon_cache: Dict[str, Optional[QIcon]] = {}
+
+
+@lru_cache(maxsize=64)
+def get_icon_path(icon_name: str) -> str:
+    """Get the absolute path to an icon file."""
+    return os.path.join(ICONS_DIR, icon_name)
+
+
+def get_icon(icon_name: str) -> Optional[QIcon]:
+    """Return the icon for a file name, checking the disk and decoding it only once."""
+    if icon_name not in _icon_cache:
+        icon_path = get_icon_path(icon_name)
+        _icon_cache[icon_name] = QIcon(icon_path) if os.path.exists(icon_path) else None
+    return _icon_cache[icon_name]
+
+
+def get_coin_icon(currency: str) -> Optional[QIcon]:
+    """Return the icon for a currency (None when it has no icon file)."""
+    return get_icon(f"{currency.lower()}.png")
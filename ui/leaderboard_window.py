@@ -1,15 +1,29 @@
 """Leaderboard window showing user rankings."""
-import os
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QPushButton, QTableWidget, QTableWidgetItem,
                              QHeaderView, QTabWidget, QFrame, QComboBox)
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QColor, QIcon
+from PyQt6.QtGui import QFont, QColor
 from utils.db_factory import get_database
 from utils.price_service import get_price_service
+from ui.icons import get_coin_icon
+from ui.table_models import RIGHT_ALIGN, COLOR_BUY, COLOR_MUTED
 from config import Config
 
 
+# Shared by every leaderboard row instead of being rebuilt per cell
+FONT_ASSETS = QFont("Segoe UI", 9)
+FONT_NAME = QFont("Segoe UI", 11)
+FONT_VALUE = QFont("Segoe UI", 11, QFont.Weight.Bold)
+FONT_RANK = QFont("Segoe UI", 12, QFont.Weight.Bold)
+FONT_TITLE = QFont("Segoe UI", 24, QFont.Weight.Bold)
+FONT_STAT = QFont("Segoe UI", 28, QFont.Weight.Bold)
+
+MEDAL_COLORS = (QColor("#FFD700"), QColor("#C0C0C0"), QColor("#CD7F32"))  # Gold, Silver, Bronze
+COLOR_HIGHLIGHT = QColor("#2B3139")
+COLOR_CURRENT_USER = QColor("#F0B90B")
+
+
 class LeaderboardWindow(QMainWindow):
     """Leaderboard window showing rankings and stats."""
     
@@ -40,7 +54,7 @@ class LeaderboardWindow(QMainWindow):
         # Header
         header = QLabel("🏆 Leaderboard")
         header.setObjectName("leaderboardTitle")
-        header.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        header.setFont(FONT_TITLE)
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(header)
         
@@ -57,15 +71,15 @@ class LeaderboardWindow(QMainWindow):
         tabs.addTab(self.total_table, "💰 USDT")
         
         # Coin-specific leaderboards - get all non-USDT currencies
-        self.coin_currencies = [c for c in Config.DEFAULT_CURRENCIES if c != 'USDT']
+        self.coin_currencies = Config.TRADEABLE_CURRENCIES
         for currency in self.coin_currencies:
             coin_table = self.create_leaderboard_table()
             setattr(self, f'{currency.lower()}_table', coin_table)
             
             # Add tab with coin icon
-            icon_path = self.get_icon_path(f"{currency.lower()}.png")
-            if os.path.exists(icon_path):
-                tabs.addTab(coin_table, QIcon(icon_path), currency)
+            icon = get_coin_icon(currency)
+            if icon:
+                tabs.addTab(coin_table, icon, currency)
             else:
                 tabs.addTab(coin_table, f"🪙 {currency}")
         
@@ -96,7 +110,7 @@ class LeaderboardWindow(QMainWindow):
         self.rank_label.setObjectName("rankLabel")
         self.rank_value = QLabel("#-")
         self.rank_value.setObjectName("rankValue")
-        self.rank_value.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
+        self.rank_value.setFont(FONT_STAT)
         rank_layout.addWidget(self.rank_label)
         rank_layout.addWidget(self.rank_value)
         layout.addLayout(rank_layout)
@@ -109,7 +123,7 @@ class LeaderboardWindow(QMainWindow):
         value_title.setObjectName("rankLabel")
         self.value_label = QLabel("$0.00")
         self.value_label.setObjectName("valueLabel")
-        self.value_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
+        self.value_label.setFont(FONT_STAT)
         value_layout.addWidget(value_title)
         value_layout.addWidget(self.value_label)
         layout.addLayout(value_layout)
@@ -122,7 +136,7 @@ class LeaderboardWindow(QMainWindow):
         percentile_title.setObjectName("rankLabel")
         self.percentile_label = QLabel("--%")
         self.percentile_label.setObjectName("percentileLabel")
-        self.percentile_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
+        self.percentile_label.setFont(FONT_STAT)
         percentile_layout.addWidget(percentile_title)
         percentile_layout.addWidget(self.percentile_label)
         layout.addLayout(percentile_layout)
@@ -138,6 +152,8 @@ class LeaderboardWindow(QMainWindow):
         table.setHorizontalHeaderLabels(['Rank', 'User', 'Value', 'Assets'])
         table.horizontalHeader().setStretchLastSection(True)
         table.verticalHeader().setVisible(False)
+        # Uniform row height instead of setRowHeight per row
+        table.verticalHeader().setDefaultSectionSize(50)
         table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         
@@ -181,127 +197,124 @@ class LeaderboardWindow(QMainWindow):
     
     def populate_total_table(self, leaderboard):
         """Populate total assets table."""
-        self.total_table.setRowCount(len(leaderboard))
-        
-        for i, entry in enumerate(leaderboard):
-            # Rank
-            rank_item = QTableWidgetItem(f"#{entry['rank']}")
-            rank_item.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-            rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Medal for top 3
-            if entry['rank'] == 1:
-                rank_item.setForeground(QColor("#FFD700"))  # Gold
-            elif entry['rank'] == 2:
-                rank_item.setForeground(QColor("#C0C0C0"))  # Silver
-            elif entry['rank'] == 3:
-                rank_item.setForeground(QColor("#CD7F32"))  # Bronze
-            
-            # Highlight current user
-            if entry['user_id'] == self.user_id:
-                rank_item.setBackground(QColor("#2B3139"))
-            
-            self.total_table.setItem(i, 0, rank_item)
-            
-            # User name
-            name_item = QTableWidgetItem(entry['name'])
-            name_item.setFont(QFont("Segoe UI", 11))
-            if entry['user_id'] == self.user_id:
-                name_item.setBackground(QColor("#2B3139"))
-                name_item.setForeground(QColor("#F0B90B"))
-            self.total_table.setItem(i, 1, name_item)
-            
-            # Total value
-            value_item = QTableWidgetItem(f"${entry['total_value']:,.2f}")
-            value_item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-            value_item.setForeground(QColor("#0ECB81"))
-            value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            if entry['user_id'] == self.user_id:
-                value_item.setBackground(QColor("#2B3139"))
-            self.total_table.setItem(i, 2, value_item)
-            
-            # Assets breakdown
-            assets = ", ".join([f"{b['currency']}: {b['balance']:.4f}" for b in entry['breakdown'][:3]])
-            assets_item = QTableWidgetItem(assets)
-            assets_item.setFont(QFont("Segoe UI", 9))
-            assets_item.setForeground(QColor("#848E9C"))
-            if entry['user_id'] == self.user_id:
-                assets_item.setBackground(QColor("#2B3139"))
-            self.total_table.setItem(i, 3, assets_item)
-            
-            self.total_table.setRowHeight(i, 50)
-    
-    def on_tab_changed(self, index):
-        """Handle tab change to load coin-specific leaderboard."""
-        if index == 0:
-            return  # Total assets already loaded
-        
-        # Get currency from tab (index - 1 because first tab is Total Assets)
-        if index - 1 < len(self.coin_currencies):
-            currency = self.coin_currencies[index - 1]
-            table = getattr(self, f'{currency.lower()}_table')
-            self.load_coin_leaderboard(currency, table)
-    
-    def get_icon_path(self, icon_name):
-        """Get the absolute path to an icon file."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_path = os.path.join(current_dir, '..', 'assets', 'icons', icon_name)
-        return os.path.abspath(icon_path)
-    
-    def load_coin_leaderboard(self, currency: str, table: QTableWidget):
-        """Load leaderboard for specific coin."""
+        # Fill in one batch - no repaint per row
+        table = self.total_table
+        table.setUpdatesEnabled(False)
         try:
-            # Get current price for this coin
-            pair = f"{currency}/USDT"
-            current_price = self.price_service.get_pair_price(pair) or 0
-            
-            leaderboard = self.db.get_coin_leaderboard(currency, limit=100)
             table.setRowCount(len(leaderboard))
             
             for i, entry in enumerate(leaderboard):
                 # Rank
                 rank_item = QTableWidgetItem(f"#{entry['rank']}")
-                rank_item.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+                rank_item.setFont(FONT_RANK)
                 rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
                 
-                if entry['rank'] <= 3:
-                    colors = ["#FFD700", "#C0C0C0", "#CD7F32"]
-                    rank_item.setForeground(QColor(colors[entry['rank'] - 1]))
+                # Medal for top 3
+                if 1 <= entry['rank'] <= 3:
+                    rank_item.setForeground(MEDAL_COLORS[entry['rank'] - 1])
                 
+                # Highlight current user
                 if entry['user_id'] == self.user_id:
-                    rank_item.setBackground(QColor("#2B3139"))
+                    rank_item.setBackground(COLOR_HIGHLIGHT)
                 
                 table.setItem(i, 0, rank_item)
                 
-                # User
+                # User name
                 name_item = QTableWidgetItem(entry['name'])
-                name_item.setFont(QFont("Segoe UI", 11))
+                name_item.setFont(FONT_NAME)
                 if entry['user_id'] == self.user_id:
-                    name_item.setBackground(QColor("#2B3139"))
-                    name_item.setForeground(QColor("#F0B90B"))
+                    name_item.setBackground(COLOR_HIGHLIGHT)
+                    name_item.setForeground(COLOR_CURRENT_USER)
                 table.setItem(i, 1, name_item)
                 
-                # Value in USDT
-                balance = entry['balance']
-                usdt_value = balance * current_price
-                value_item = QTableWidgetItem(f"${usdt_value:,.2f}")
-                value_item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-                value_item.setForeground(QColor("#0ECB81"))
-                value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                # Total value
+                value_item = QTableWidgetItem(f"${entry['total_value']:,.2f}")
+                value_item.setFont(FONT_VALUE)
+                value_item.setForeground(COLOR_BUY)
+                value_item.setTextAlignment(RIGHT_ALIGN)
                 if entry['user_id'] == self.user_id:
-                    value_item.setBackground(QColor("#2B3139"))
+                    value_item.setBackground(COLOR_HIGHLIGHT)
                 table.setItem(i, 2, value_item)
                 
-                # Assets (coin amount)
-                assets_item = QTableWidgetItem(f"{balance:.8f} {currency}")
-                assets_item.setFont(QFont("Segoe UI", 9))
-                assets_item.setForeground(QColor("#848E9C"))
+                # Assets breakdown
+                assets = ", ".join([f"{b['currency']}: {b['balance']:.4f}" for b in entry['breakdown'][:3]])
+                assets_item = QTableWidgetItem(assets)
+                assets_item.setFont(FONT_ASSETS)
+                assets_item.setForeground(COLOR_MUTED)
                 if entry['user_id'] == self.user_id:
-                    assets_item.setBackground(QColor("#2B3139"))
+                    assets_item.setBackground(COLOR_HIGHLIGHT)
                 table.setItem(i, 3, assets_item)
+        finally:
+            table.setUpdatesEnabled(True)
+    
+    def on_tab_changed(self, index):
+        """Handle tab change to load coin-specific leaderboard."""
+        if index == 0:
+            return  # Total assets already loaded
+        
+        # Get currency from tab (index - 1 because first tab is Total Assets)
+        if index - 1 < len(self.coin_currencies):
+            currency = self.coin_currencies[index - 1]
+            table = getattr(self, f'{currency.lower()}_table')
+            self.load_coin_leaderboard(currency, table)
+    
+    def load_coin_leaderboard(self, currency: str, table: QTableWidget):
+        """Load leaderboard for specific coin."""
+        try:
+            # Get current price for this coin
+            pair = f"{currency}/USDT"
+            current_price = self.price_service.get_pair_price(pair) or 0
+            
+            leaderboard = self.db.get_coin_leaderboard(currency, limit=100)
+            
+            # Fill in one batch - no repaint per row
+            table.setUpdatesEnabled(False)
+            try:
+                table.setRowCount(len(leaderboard))
                 
-                table.setRowHeight(i, 50)
-                
+                for i, entry in enumerate(leaderboard):
+                    # Rank
+                    rank_item = QTableWidgetItem(f"#{entry['rank']}")
+                    rank_item.setFont(FONT_RANK)
+                    rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                    
+                    if entry['rank'] <= 3:
+                        rank_item.setForeground(MEDAL_COLORS[entry['rank'] - 1])
+                    
+                    if entry['user_id'] == self.user_id:
+                        rank_item.setBackground(COLOR_HIGHLIGHT)
+                    
+                    table.setItem(i, 0, rank_item)
+                    
+                    # User
+                    name_item = QTableWidgetItem(entry['name'])
+                    name_item.setFont(FONT_NAME)
+                    if entry['user_id'] == self.user_id:
+                        name_item.setBackground(COLOR_HIGHLIGHT)
+                        name_item.setForeground(COLOR_CURRENT_USER)
+                    table.setItem(i, 1, name_item)
+                    
+                    # Value in USDT
+                    balance = entry['balance']
+                    usdt_value = balance * current_price
+                    value_item = QTableWidgetItem(f"${usdt_value:,.2f}")
+                    value_item.setFont(FONT_VALUE)
+                    value_item.setForeground(COLOR_BUY)
+                    value_item.setTextAlignment(RIGHT_ALIGN)
+                    if entry['user_id'] == self.user_id:
+                        value_item.setBackground(COLOR_HIGHLIGHT)
+                    table.setItem(i, 2, value_item)
+                    
+                    # Assets (coin amount)
+                    assets_item = QTableWidgetItem(f"{balance:.8f} {currency}")
+                    assets_item.setFont(FONT_ASSETS)
+                    assets_item.setForeground(COLOR_MUTED)
+                    if entry['user_id'] == self.user_id:
+                        assets_item.setBackground(COLOR_HIGHLIGHT)
+                    table.setItem(i, 3, assets_item)
+            finally:
+                table.setUpdatesEnabled(True)
+            
         except Exception as e:
             print(f"Error loading coin leaderboard: {e}")
     
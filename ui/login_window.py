@@ -2,9 +2,10 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QFrame, QGraphicsDropShadowEffect)
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QPixmap, QIcon, QColor
+from PyQt6.QtGui import QFont, QPixmap, QColor
 import sys
 import os
+from ui.icons import get_icon, get_icon_path
 
 
 class LoginWindow(QWidget):
@@ -23,9 +24,9 @@ class LoginWindow(QWidget):
         self.setFixedSize(450, 600)
         
         # Set window icon
-        icon_path = self.get_icon_path('app_icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = get_icon('app_icon.png')
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         self.setStyleSheet(self.get_stylesheet())
         
@@ -65,7 +66,7 @@ class LoginWindow(QWidget):
         title_layout.setSpacing(10)
         
         # Add bitcoin icon if available
-        bitcoin_icon_path = self.get_icon_path('bitcoin_icon.png')
+        bitcoin_icon_path = get_icon_path('bitcoin_icon.png')
         if os.path.exists(bitcoin_icon_path):
             icon_label = QLabel()
             icon_pixmap = QPixmap(bitcoin_icon_path).scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
@@ -117,9 +118,9 @@ class LoginWindow(QWidget):
         google_btn.setObjectName("googleButton")
         
         # Add Google icon if available
-        google_icon_path = self.get_icon_path('google_icon.png')
-        if os.path.exists(google_icon_path):
-            google_btn.setIcon(QIcon(google_icon_path))
+        google_icon = get_icon('google_icon.png')
+        if google_icon is not None:
+            google_btn.setIcon(google_icon)
             google_btn.setIconSize(QSize(24, 24))
         
         google_btn.setFixedHeight(50)
@@ -209,14 +210,6 @@ class LoginWindow(QWidget):
         from ui import styled_dialogs
         styled_dialogs.show_error(self, "Authentication Error", message)
     
-    def get_icon_path(self, icon_name):
-        """Get the absolute path to an icon file."""
-        # Get the directory of this file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Go up one level to pyqt_crypto_app, then to assets/icons
-        icon_path = os.path.join(current_dir, '..', 'assets', 'icons', icon_name)
-        return os.path.abspath(icon_path)
-    
     def center_on_screen(self):
         """Center the window on the screen."""
         from PyQt6.QtWidgets import QApplication
@@ -0,0 +1,272 @@
+"""Table models and delegates for the trading window's wallet, history and P2P offer views."""
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRectF, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPainter
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+
+
+RIGHT_ALIGN = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+COLOR_BUY = QColor("#0ECB81")   # Green
+COLOR_SELL = QColor("#F6465D")  # Red
+COLOR_P2P = QColor("#FCD535")   # Yellow
+COLOR_MUTED = QColor("#848E9C")  # Gray
+
+FONT_CELL_BOLD = QFont("Segoe UI", 10, QFont.Weight.Bold)
+FONT_CURRENCY = QFont("Segoe UI", 11, QFont.Weight.Bold)
+FONT_ACTION = QFont("Segoe UI", 8, QFont.Weight.DemiBold)
+
+
+SATS_PER_COIN = 10 ** 8
+
+
+def format_sat(amount_sat):
+    """Format an integer amount in 1e-8 units with 8 decimals (no float round-trip)."""
+    sign = '-' if amount_sat < 0 else ''
+    whole, frac = divmod(abs(amount_sat), SATS_PER_COIN)
+    return f"{sign}{whole}.{frac:08d}"
+
+
+def format_timestamp(created_at, length=19):
+    """Format a str/datetime timestamp for display."""
+    if isinstance(created_at, str):
+        return created_at[:length]
+    if not created_at:
+        return ''
+    return created_at.strftime('%Y-%m-%d %H:%M:%S' if length > 16 else '%Y-%m-%d %H:%M')
+
+
+class RowTableModel(QAbstractTableModel):
+    """Read-only model over a list of pre-formatted row tuples.
+
+    Display strings are computed once in set_rows(), so data() is a plain
+    lookup and views only ask for the rows that are actually visible.
+    """
+
+    HEADERS = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+
+    def set_rows(self, records):
+        """Replace the model contents with formatted records.
+        
+        When the row count is unchanged only the span of rows that differ
+        is signalled, so periodic refreshes repaint just what moved.
+        """
+        rows = [self.format_row(record) for record in records]
+        if len(rows) != len(self.rows):
+            self.beginResetModel()
+            self.rows = rows
+            self.endResetModel()
+            return
+        
+        changed = [row for row, values in enumerate(rows) if values != self.rows[row]]
+        if changed:
+            self.rows = rows
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], self.columnCount() - 1))
+
+    def format_row(self, record):
+        """Convert a record into a row tuple (one entry per column)."""
+        raise NotImplementedError
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.rows[index.row()][index.column()]
+        return self.cell_style(self.rows[index.row()], index.column(), role)
+
+    def cell_style(self, row, column, role):
+        """Return non-display role data (font, color, alignment)."""
+        return None
+
+
+class TxModel(RowTableModel):
+    """Full transaction history (buy/sell/P2P)."""
+
+    HEADERS = ['Time', 'Type', 'Pair/Trade', 'Amount', 'Price', 'Total', 'Fee']
+
+    TYPE_COLORS = {'BUY': COLOR_BUY, 'SELL': COLOR_SELL}
+
+    def format_row(self, tx):
+        # Rows come from refresh_transaction_history with every column
+        # present, numeric columns converted and the timestamp already
+        # formatted by Postgres, so index directly
+        return (
+            tx['ts_str'] or '',
+            tx['type'].upper(),
+            tx['pair'] or '',
+            format_sat(tx['amount_sat']),
+            f"${tx['price']:,.2f}",
+            f"${tx['total']:,.2f}",
+            f"${tx['fee']:.2f}"
+        )
+
+    def cell_style(self, row, column, role):
+        if role == Qt.ItemDataRole.ForegroundRole and column == 1:
+            return self.TYPE_COLORS.get(row[1], COLOR_P2P)
+        if role == Qt.ItemDataRole.FontRole and column in (1, 5):
+            return FONT_CELL_BOLD
+        if role == Qt.ItemDataRole.TextAlignmentRole and column >= 3:
+            return RIGHT_ALIGN
+        return None
+
+
+class TradeHistoryModel(RowTableModel):
+    """Recent market buy/sell trades for the "My Trades" panel."""
+
+    HEADERS = ['Time', 'Pair', 'Type', 'Side', 'Price', 'Amount', 'Status']
+
+    def format_row(self, tx):
+        return (
+            format_timestamp(tx.get('timestamp')),
+            tx.get('pair', ''),
+            'market',
+            tx.get('type', ''),
+            f"${float(tx.get('price', 0)):,.2f}",
+            f"{float(tx.get('amount', 0)):.8f}",
+            'filled'
+        )
+
+
+class P2POffersModel(RowTableModel):
+    """Open P2P offers; the Action column is drawn by ActionButtonDelegate."""
+
+    def __init__(self, show_accept=True, parent=None):
+        super().__init__(parent)
+        self.show_accept = show_accept
+        self.offer_ids = []
+        first_column = 'User' if show_accept else 'Time'
+        self.HEADERS = [first_column, 'Offering', 'Amount', 'Wants', 'Amount', 'Action']
+
+    def set_rows(self, records):
+        """Apply a fresh offers list, touching only rows that changed.
+        
+        Refreshes are usually no-ops or a single offer added/taken, so
+        removed and inserted rows are signalled individually instead of
+        resetting the whole model.
+        """
+        new_ids = [offer['offer_id'] for offer in records]
+        new_rows = [self.format_row(offer) for offer in records]
+        if new_ids == self.offer_ids and new_rows == self.rows:
+            return
+        
+        # Remove offers that are gone (bottom-up so indices stay valid)
+        new_id_set = set(new_ids)
+        for row in range(len(self.offer_ids) - 1, -1, -1):
+            if self.offer_ids[row] not in new_id_set:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.offer_ids[row]
+                del self.rows[row]
+                self.endRemoveRows()
+        
+        # Surviving offers must keep their relative order to insert in place
+        old_id_set = set(self.offer_ids)
+        if [offer_id for offer_id in new_ids if offer_id in old_id_set] != self.offer_ids:
+            self.beginResetModel()
+            self.offer_ids = new_ids
+            self.rows = new_rows
+            self.endResetModel()
+            return
+        
+        for row, offer_id in enumerate(new_ids):
+            if offer_id not in old_id_set:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.offer_ids.insert(row, offer_id)
+                self.rows.insert(row, new_rows[row])
+                self.endInsertRows()
+            elif self.rows[row] != new_rows[row]:
+                self.rows[row] = new_rows[row]
+                self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def format_row(self, offer):
+        if self.show_accept:
+            # All offers table - show creator name
+            first = offer.get('creator_name', 'Unknown')[:15]
+        else:
+            # My offers table - show created time
+            first = format_timestamp(offer.get('created_at', ''), 16)
+        return (
+            first,
+            offer['offering_currency'],
+            f"{float(offer['offering_amount']):.8f}",
+            offer['requesting_currency'],
+            f"{float(offer['requesting_amount']):.8f}",
+            "✓ Accept" if self.show_accept else "✕ Cancel"
+        )
+
+
+class WalletModel(RowTableModel):
+    """Wallet balances with their USDT value.
+
+    Records are (currency, icon, balance, value_usdt) tuples; the icon is
+    resolved by the caller so the model stays free of file lookups.
+    """
+
+    HEADERS = ['Currency', 'Balance', 'Value (USDT)']
+
+    def format_row(self, record):
+        currency, icon, balance, value_usdt = record
+        return (currency, f"{balance:.8f}", f"${value_usdt:.2f}", icon, value_usdt > 0)
+
+    def cell_style(self, row, column, role):
+        if column == 0:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return row[3]
+            if role == Qt.ItemDataRole.FontRole:
+                return FONT_CURRENCY
+        elif column == 2 and role == Qt.ItemDataRole.ForegroundRole and row[4]:
+            return COLOR_BUY
+        return None
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints a push button in a cell and emits the row when it is clicked.
+
+    Replaces per-row QPushButton index widgets, so refreshing a table
+    creates no widgets or signal connections.
+    """
+
+    clicked = pyqtSignal(int)
+
+    def __init__(self, color, hover_color, parent=None):
+        super().__init__(parent)
+        self.color = QColor(color)
+        self.hover_color = QColor(hover_color)
+
+    def button_rect(self, option):
+        """Button area inside the cell (padded like the old button widgets)."""
+        return QRectF(option.rect).adjusted(6, 6, -6, -6)
+
+    def paint(self, painter, option, index):
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.hover_color if hovered else self.color)
+        rect = self.button_rect(option)
+        painter.drawRoundedRect(rect, 3, 3)
+        painter.setPen(QColor("#FFFFFF"))
+        painter.setFont(FONT_ACTION)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, index.data())
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self.button_rect(option).contains(event.position())):
+            self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
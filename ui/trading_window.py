@@ -1,22 +1,194 @@
 """Main trading window with buy/sell functionality."""
 import os
+import re
+import json
+import time
+import traceback
+import webbrowser
+from datetime import datetime, timezone
 from decimal import Decimal
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+from functools import partial
+import numpy as np
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QLineEdit, QComboBox, QTableWidget,
-                             QTableWidgetItem, QHeaderView, QTabWidget, QFrame,
+                             QTableWidgetItem, QTableView, QHeaderView, QTabWidget, QFrame,
                              QSplitter, QScrollArea, QButtonGroup)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread
-from PyQt6.QtGui import QFont, QIcon, QColor
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QFont
 from utils.db_factory import get_database
 from utils.price_service import get_price_service
 from utils.freecrypto_service import get_freecrypto_service
 from utils.update_checker import UpdateChecker
+from auth.google_auth import GoogleAuthManager
+from ui.login_window import LoginWindow
 from ui.web_chart_widget import CoinGeckoChartWidget
+from ui.table_models import (TxModel, TradeHistoryModel, P2POffersModel, WalletModel,
+                             ActionButtonDelegate, COLOR_BUY, COLOR_SELL, COLOR_MUTED, RIGHT_ALIGN)
 from ui import styled_dialogs
+from ui.icons import get_coin_icon, get_icon
 from config import Config
 from version import VERSION, APP_NAME
 
 
+# Shared fonts - QFont is implicitly shared, so widgets can reuse these
+# instead of resolving a new font per setFont() call
+FONT_TINY = QFont("Segoe UI", 8)
+FONT_CAPTION = QFont("Segoe UI", 9)
+FONT_CAPTION_BOLD = QFont("Segoe UI", 9, QFont.Weight.Bold)
+FONT_SMALL = QFont("Segoe UI", 10)
+FONT_SMALL_BOLD = QFont("Segoe UI", 10, QFont.Weight.Bold)
+FONT_LABEL = QFont("Segoe UI", 11)
+FONT_LABEL_BOLD = QFont("Segoe UI", 11, QFont.Weight.Bold)
+FONT_BODY = QFont("Segoe UI", 12)
+FONT_BUTTON = QFont("Segoe UI", 12, QFont.Weight.Bold)
+FONT_HEADER = QFont("Segoe UI", 13, QFont.Weight.Bold)
+FONT_SUBHEADING = QFont("Segoe UI", 14)
+FONT_SUBHEADING_BOLD = QFont("Segoe UI", 14, QFont.Weight.Bold)
+FONT_TITLE = QFont("Segoe UI", 16, QFont.Weight.Bold)
+FONT_DISPLAY = QFont("Segoe UI", 24, QFont.Weight.Bold)
+FONT_VALUE = QFont("Segoe UI", 28, QFont.Weight.Bold)
+FONT_VALUE_LARGE = QFont("Segoe UI", 32, QFont.Weight.Bold)
+
+# Update checks run at most once per day
+UPDATE_CHECK_FILE = os.path.join(os.path.expanduser('~'), '.virtualcoin', 'update_check.json')
+UPDATE_CHECK_INTERVAL = 86400
+UPDATE_MESSAGE = """New version available!
+
+Current version: v{current}
+Latest version: v{latest}
+
+{name}
+
+Would you like to download the update?"""
+
+# Seconds between daily bonus claims (the database enforces the same window)
+DAILY_BONUS_COOLDOWN = 86400
+
+
+def set_column_widths(table, widths, resize_mode=None):
+    """Size a table's leading columns in one pass over its header."""
+    header = table.horizontalHeader()
+    if resize_mode is not None:
+        header.setSectionResizeMode(resize_mode)
+    for column, width in enumerate(widths):
+        header.resizeSection(column, width)
+
+
+# Position of USDT in the currency combos (default "wants" currency)
+USDT_INDEX = Config.DEFAULT_CURRENCIES.index('USDT') if 'USDT' in Config.DEFAULT_CURRENCIES else 0
+
+# History filter button ids -> transaction type
+HISTORY_FILTERS = ('all', 'buy', 'sell', 'p2p')
+
+# Delay that coalesces back-to-back force_refresh_all() calls
+REFRESH_DELAY_MS = 150
+
+# Delay that coalesces rapid market pair selections into one chart load
+CHART_DELAY_MS = 150
+
+# Direction of a trade's position change, for today's P&L
+TRADE_SIGNS = {'buy': 1, 'sell': -1}
+
+# Identical errors print their traceback at most once per interval (seconds)
+ERROR_REPEAT_INTERVAL = 60
+
+# (message, error type, error text) -> (last time printed, repeats suppressed since)
+_reported_errors = {}
+
+# Every base/quote symbol in the market list, fetched in one batch per tick
+PRICE_SYMBOLS = tuple(sorted({symbol for pair in Config.DEFAULT_TRADING_PAIRS for symbol in pair.split('/')}))
+
+
+# P&L label text colors
+STYLE_POSITIVE = "color: #0ECB81;"  # Green
+STYLE_NEGATIVE = "color: #F6465D;"  # Red
+STYLE_NEUTRAL = "color: #EAECEF;"   # White
+STYLE_MUTED = "color: #848E9C;"     # Gray
+
+
+def set_style(widget, style):
+    """Apply a stylesheet only if it differs (setStyleSheet always re-polishes)."""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
+def set_pnl_style(value_label, percent_label, pnl):
+    """Color a P&L value/percent label pair by the sign of pnl."""
+    if pnl > 0:
+        set_style(value_label, STYLE_POSITIVE)
+        set_style(percent_label, STYLE_POSITIVE)
+    elif pnl < 0:
+        set_style(value_label, STYLE_NEGATIVE)
+        set_style(percent_label, STYLE_NEGATIVE)
+    else:
+        set_style(value_label, STYLE_NEUTRAL)
+        set_style(percent_label, STYLE_MUTED)
+
+
+def parse_timestamp(value):
+    """Return a timezone-aware datetime for a DB timestamp (naive values are UTC)."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            # Non-ISO formats are rare; fall back to the slow general parser
+            from dateutil import parser
+            value = parser.parse(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def report_error(message, error):
+    """Print an error and its traceback, at most once per ERROR_REPEAT_INTERVAL.
+    
+    Call from inside an except block. Identical repeats (e.g. every price
+    tick while offline) are counted instead of re-formatting the traceback.
+    """
+    key = (message, type(error).__name__, str(error))
+    now = time.monotonic()
+    last_reported, repeats = _reported_errors.get(key, (None, 0))
+    if last_reported is not None and now - last_reported < ERROR_REPEAT_INTERVAL:
+        _reported_errors[key] = (last_reported, repeats + 1)
+        return
+    _reported_errors[key] = (now, 0)
+    suffix = f" (repeated {repeats} more times)" if repeats else ""
+    print(f"{message}: {error}{suffix}")
+    traceback.print_exc()
+
+
+class WorkerSignals(QObject):
+    """Signals for Worker (QRunnable is not a QObject)."""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class Worker(QRunnable):
+    """Runs a blocking call (network/DB) on the global thread pool.
+    
+    The result is delivered through signals, so connected slots run on
+    the main thread.
+    """
+    
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            report_error("Background task failed", e)
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class TradingWindow(QMainWindow):
     """Main trading interface with Binance-style layout."""
     
@@ -34,13 +206,64 @@ class TradingWindow(QMainWindow):
         self.freecrypto_service = get_freecrypto_service()
         
         # Current trading pair and chart settings
-        self.current_pair = 'BTC/USDT'
+        self.set_current_pair('BTC/USDT')
+        
+        # USDT pairs for the coins picked in the buy/sell forms
+        self.buy_pair = self.sell_pair = f"{Config.TRADEABLE_CURRENCIES[0]}/USDT"
         self.current_prices = {}
         self.chart_interval = '1h'  # Default chart interval
         
+        # Debounce: clicking quickly through pairs reloads the chart once
+        self.chart_timer = QTimer(self)
+        self.chart_timer.setSingleShot(True)
+        self.chart_timer.setInterval(CHART_DELAY_MS)
+        self.chart_timer.timeout.connect(self.update_chart)
+        
         # Price display cycling
         self.price_display_index = 0
-        self.price_display_pairs = [f"{coin}/USDT" for coin in Config.DEFAULT_CURRENCIES if coin != 'USDT']
+        self.price_display_pairs = tuple(f"{coin}/USDT" for coin in Config.TRADEABLE_CURRENCIES)
+        
+        # Background workers still running (see run_in_background)
+        self.workers = set()
+        self.price_fetch_pending = False
+        self.last_price_data = None
+        self.refresh_pending = False
+        
+        # Monotonic time the daily bonus can next be claimed (known after the first claim attempt)
+        self.bonus_available_at = 0.0
+        
+        # Prices the buy/sell totals were last calculated with
+        self.last_buy_price = None
+        self.last_sell_price = None
+        
+        # Market table (base, price item, change item) and the (price, change) shown, keyed by pair
+        self.market_items = {}
+        self.market_values = {}
+        self.last_breakdown_key = None
+        
+        # Coins shown in the profit breakdown, in row order
+        self.breakdown_currencies = None
+        
+        # Per-coin trade totals and the newest transaction folded into them;
+        # the generation bumps whenever invalidate_cost_basis() drops them
+        self.coin_data = None
+        self.last_tx_time = None
+        self.coin_data_generation = 0
+        
+        # Background portfolio refresh state (see refresh_portfolio)
+        self.portfolio_fetch_pending = False
+        self.portfolio_refresh_queued = False
+        self.portfolio_forms_stale = False
+        
+        # Wallet rows keyed by currency, reloaded by update_wallet_display
+        self.wallets = None
+        
+        # Coin icons keyed by currency (decoded once per process, see ui.icons)
+        self.coin_icons = {}
+        for currency in Config.DEFAULT_CURRENCIES:
+            icon = get_coin_icon(currency)
+            if icon:
+                self.coin_icons[currency] = icon
         
         self.init_ui()
         self.load_initial_data()
@@ -64,13 +287,13 @@ class TradingWindow(QMainWindow):
         self.setWindowTitle(f"{APP_NAME} v{VERSION} - Trading Platform")
         self.setGeometry(100, 100, 1400, 900)
         
-        # Set window icon
-        icon_path = self.get_icon_path('app_icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # Set window icon (decoded once per process)
+        app_icon = get_icon('app_icon.png')
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
-        # Apply Binance-style theme
-        self.setStyleSheet(self.get_stylesheet())
+        # Apply Binance-style theme (installed on the application once)
+        install_stylesheet()
         
         # Main widget and layout
         main_widget = QWidget()
@@ -106,6 +329,16 @@ class TradingWindow(QMainWindow):
         history_tab = self.create_history_tab()
         self.main_tabs.addTab(history_tab, "📜 History")
         
+        # Tabs whose tables refresh_all only reloads while they are shown;
+        # hidden ones are marked stale and reload when selected
+        self.tab_refreshers = {
+            trading_tab: self.update_order_history,
+            p2p_tab: self.refresh_p2p_offers,
+            history_tab: self.refresh_transaction_history,
+        }
+        self.stale_tabs = set()
+        self.main_tabs.currentChanged.connect(self.on_main_tab_changed)
+        
         main_layout.addWidget(self.main_tabs)
         
         main_widget.setLayout(main_layout)
@@ -124,14 +357,13 @@ class TradingWindow(QMainWindow):
         # Logo - Binance style
         logo_label = QLabel(f"⚡ {APP_NAME}")
         logo_label.setObjectName("logo")
-        logo_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        logo_label.setFont(FONT_TITLE)
         layout.addWidget(logo_label)
         
         # Version label (small, subtle)
         version_label = QLabel(f"v{VERSION}")
         version_label.setObjectName("versionLabel")
-        version_label.setFont(QFont("Segoe UI", 9))
-        version_label.setStyleSheet("color: #71757a; padding: 0 10px;")
+        version_label.setFont(FONT_CAPTION)
         layout.addWidget(version_label)
         
         layout.addStretch()
@@ -139,12 +371,12 @@ class TradingWindow(QMainWindow):
         # Current pair display with price
         self.header_pair_label = QLabel(self.current_pair)
         self.header_pair_label.setObjectName("headerPairLabel")
-        self.header_pair_label.setFont(QFont("Segoe UI", 13, QFont.Weight.Bold))
+        self.header_pair_label.setFont(FONT_HEADER)
         layout.addWidget(self.header_pair_label)
         
         self.header_price_label = QLabel("$0.00")
         self.header_price_label.setObjectName("headerPriceLabel")
-        self.header_price_label.setFont(QFont("Segoe UI", 13, QFont.Weight.Bold))
+        self.header_price_label.setFont(FONT_HEADER)
         layout.addWidget(self.header_price_label)
         
         layout.addSpacing(20)
@@ -152,7 +384,7 @@ class TradingWindow(QMainWindow):
         # User info with icon
         user_label = QLabel(f"👤 {self.user_info.get('name', 'User')[:15]}")
         user_label.setObjectName("userLabel")
-        user_label.setFont(QFont("Segoe UI", 11))
+        user_label.setFont(FONT_LABEL)
         layout.addWidget(user_label)
         
         # Daily Bonus button
@@ -194,7 +426,7 @@ class TradingWindow(QMainWindow):
         # Title
         title = QLabel("Markets")
         title.setObjectName("panelTitle")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(FONT_BUTTON)
         layout.addWidget(title)
         
         # Market list
@@ -210,16 +442,19 @@ class TradingWindow(QMainWindow):
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         
         # Set initial column widths
-        self.market_table.setColumnWidth(0, 120)  # Pair column
-        self.market_table.setColumnWidth(1, 140)  # Price column
+        set_column_widths(self.market_table, [120, 140])  # Pair, Price
         
         self.market_table.verticalHeader().setVisible(False)
+        # Uniform row height for better spacing (instead of per-row setRowHeight)
+        self.market_table.verticalHeader().setDefaultSectionSize(48)
         self.market_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.market_table.cellClicked.connect(self.on_pair_selected)
         
-        # Add trading pairs
-        for pair in Config.DEFAULT_TRADING_PAIRS:
-            self.add_market_row(pair)
+        # Add trading pairs (rows are never sorted, so row -> pair stays fixed)
+        self.market_pairs = tuple(Config.DEFAULT_TRADING_PAIRS)
+        self.market_table.setRowCount(len(self.market_pairs))
+        for row, pair in enumerate(self.market_pairs):
+            self.add_market_row(row, pair)
         
         layout.addWidget(self.market_table)
         
@@ -267,7 +502,7 @@ class TradingWindow(QMainWindow):
         
         portfolio_title = QLabel("💼 My Portfolio")
         portfolio_title.setObjectName("portfolioTitle")
-        portfolio_title.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        portfolio_title.setFont(FONT_DISPLAY)
         header_layout.addWidget(portfolio_title)
         
         header_layout.addStretch()
@@ -293,12 +528,12 @@ class TradingWindow(QMainWindow):
         
         value_label_title = QLabel("Total Portfolio Value")
         value_label_title.setObjectName("valueTitle")
-        value_label_title.setFont(QFont("Segoe UI", 12))
+        value_label_title.setFont(FONT_BODY)
         value_layout.addWidget(value_label_title)
         
         self.total_value_label = QLabel("$0.00")
         self.total_value_label.setObjectName("totalValue")
-        self.total_value_label.setFont(QFont("Segoe UI", 32, QFont.Weight.Bold))
+        self.total_value_label.setFont(FONT_VALUE_LARGE)
         value_layout.addWidget(self.total_value_label)
         
         value_card.setLayout(value_layout)
@@ -308,31 +543,23 @@ class TradingWindow(QMainWindow):
         pnl_card = QFrame()
         pnl_card.setObjectName("pnlCard")
         pnl_card.setMaximumHeight(140)
-        pnl_card.setStyleSheet("""
-            QFrame#pnlCard {
-                background-color: #1E2329;
-                border: 1px solid #2B3139;
-                border-radius: 8px;
-            }
-        """)
         pnl_layout = QVBoxLayout()
         pnl_layout.setContentsMargins(20, 15, 20, 15)
         
         pnl_title = QLabel("Today's Profit/Loss")
         pnl_title.setObjectName("valueTitle")
-        pnl_title.setFont(QFont("Segoe UI", 12))
-        pnl_title.setStyleSheet("color: #848E9C;")
+        pnl_title.setFont(FONT_BODY)
         pnl_layout.addWidget(pnl_title)
         
         self.today_pnl_label = QLabel("$0.00")
         self.today_pnl_label.setObjectName("pnlValue")
-        self.today_pnl_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
-        self.today_pnl_label.setStyleSheet("color: #EAECEF;")
+        self.today_pnl_label.setFont(FONT_VALUE)
+        self.today_pnl_label.setStyleSheet(STYLE_NEUTRAL)
         pnl_layout.addWidget(self.today_pnl_label)
         
         self.today_pnl_percent = QLabel("(0.00%)")
-        self.today_pnl_percent.setFont(QFont("Segoe UI", 14))
-        self.today_pnl_percent.setStyleSheet("color: #848E9C;")
+        self.today_pnl_percent.setFont(FONT_SUBHEADING)
+        self.today_pnl_percent.setStyleSheet(STYLE_MUTED)
         pnl_layout.addWidget(self.today_pnl_percent)
         
         pnl_card.setLayout(pnl_layout)
@@ -342,31 +569,23 @@ class TradingWindow(QMainWindow):
         total_pnl_card = QFrame()
         total_pnl_card.setObjectName("totalPnlCard")
         total_pnl_card.setMaximumHeight(140)
-        total_pnl_card.setStyleSheet("""
-            QFrame#totalPnlCard {
-                background-color: #1E2329;
-                border: 1px solid #2B3139;
-                border-radius: 8px;
-            }
-        """)
         total_pnl_layout = QVBoxLayout()
         total_pnl_layout.setContentsMargins(20, 15, 20, 15)
         
         total_pnl_title = QLabel("Total Profit/Loss")
         total_pnl_title.setObjectName("valueTitle")
-        total_pnl_title.setFont(QFont("Segoe UI", 12))
-        total_pnl_title.setStyleSheet("color: #848E9C;")
+        total_pnl_title.setFont(FONT_BODY)
         total_pnl_layout.addWidget(total_pnl_title)
         
         self.total_pnl_label = QLabel("$0.00")
         self.total_pnl_label.setObjectName("totalPnlValue")
-        self.total_pnl_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
-        self.total_pnl_label.setStyleSheet("color: #EAECEF;")
+        self.total_pnl_label.setFont(FONT_VALUE)
+        self.total_pnl_label.setStyleSheet(STYLE_NEUTRAL)
         total_pnl_layout.addWidget(self.total_pnl_label)
         
         self.total_pnl_percent = QLabel("(0.00%)")
-        self.total_pnl_percent.setFont(QFont("Segoe UI", 14))
-        self.total_pnl_percent.setStyleSheet("color: #848E9C;")
+        self.total_pnl_percent.setFont(FONT_SUBHEADING)
+        self.total_pnl_percent.setStyleSheet(STYLE_MUTED)
         total_pnl_layout.addWidget(self.total_pnl_percent)
         
         total_pnl_card.setLayout(total_pnl_layout)
@@ -377,7 +596,7 @@ class TradingWindow(QMainWindow):
         # Profit Breakdown section (NEW)
         profit_breakdown_title = QLabel("📊 Profit/Loss by Coin")
         profit_breakdown_title.setObjectName("assetsTitle")
-        profit_breakdown_title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        profit_breakdown_title.setFont(FONT_TITLE)
         layout.addWidget(profit_breakdown_title)
         
         # Profit breakdown table
@@ -387,28 +606,24 @@ class TradingWindow(QMainWindow):
         self.profit_breakdown_table.setHorizontalHeaderLabels(['Coin', 'Holdings', 'Current Value', 'Cost Basis', 'P&L'])
         self.profit_breakdown_table.horizontalHeader().setStretchLastSection(True)
         self.profit_breakdown_table.verticalHeader().setVisible(False)
-        self.profit_breakdown_table.setColumnWidth(0, 150)
-        self.profit_breakdown_table.setColumnWidth(1, 200)
-        self.profit_breakdown_table.setColumnWidth(2, 200)
-        self.profit_breakdown_table.setColumnWidth(3, 200)
+        set_column_widths(self.profit_breakdown_table, [150, 200, 200, 200])
         self.profit_breakdown_table.setMaximumHeight(250)
         layout.addWidget(self.profit_breakdown_table)
         
         # Assets title
         assets_title = QLabel("Your Assets")
         assets_title.setObjectName("assetsTitle")
-        assets_title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        assets_title.setFont(FONT_TITLE)
         layout.addWidget(assets_title)
         
         # Wallet table (larger, more detailed)
-        self.wallet_table = QTableWidget()
+        self.wallet_model = WalletModel(self)
+        self.wallet_table = QTableView()
         self.wallet_table.setObjectName("portfolioWalletTable")
-        self.wallet_table.setColumnCount(3)
-        self.wallet_table.setHorizontalHeaderLabels(['Currency', 'Balance', 'Value (USDT)'])
+        self.wallet_table.setModel(self.wallet_model)
         self.wallet_table.horizontalHeader().setStretchLastSection(True)
         self.wallet_table.verticalHeader().setVisible(False)
-        self.wallet_table.setColumnWidth(0, 200)
-        self.wallet_table.setColumnWidth(1, 300)
+        set_column_widths(self.wallet_table, [200, 300])
         layout.addWidget(self.wallet_table, 1)
         
         tab_widget.setLayout(layout)
@@ -442,7 +657,7 @@ class TradingWindow(QMainWindow):
         # Title
         title = QLabel("Peer-to-Peer Trading")
         title.setObjectName("panelTitle")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title.setFont(FONT_SUBHEADING_BOLD)
         layout.addWidget(title)
         
         # P2P trading content
@@ -464,7 +679,7 @@ class TradingWindow(QMainWindow):
         
         title = QLabel("📜 Transaction History")
         title.setObjectName("portfolioTitle")
-        title.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        title.setFont(FONT_DISPLAY)
         header_layout.addWidget(title)
         
         header_layout.addStretch()
@@ -482,7 +697,7 @@ class TradingWindow(QMainWindow):
         filter_layout.setSpacing(10)
         
         filter_label = QLabel("Filter:")
-        filter_label.setFont(QFont("Segoe UI", 11))
+        filter_label.setFont(FONT_LABEL)
         filter_layout.addWidget(filter_label)
         
         # Create filter button group
@@ -492,47 +707,41 @@ class TradingWindow(QMainWindow):
         all_btn.setObjectName("filterButton")
         all_btn.setCheckable(True)
         all_btn.setChecked(True)
-        all_btn.clicked.connect(lambda: self.filter_history("all"))
-        self.history_filter_group.addButton(all_btn)
+        self.history_filter_group.addButton(all_btn, 0)
         filter_layout.addWidget(all_btn)
         
         buy_btn = QPushButton("Buy")
         buy_btn.setObjectName("filterButton")
         buy_btn.setCheckable(True)
-        buy_btn.clicked.connect(lambda: self.filter_history("buy"))
-        self.history_filter_group.addButton(buy_btn)
+        self.history_filter_group.addButton(buy_btn, 1)
         filter_layout.addWidget(buy_btn)
         
         sell_btn = QPushButton("Sell")
         sell_btn.setObjectName("filterButton")
         sell_btn.setCheckable(True)
-        sell_btn.clicked.connect(lambda: self.filter_history("sell"))
-        self.history_filter_group.addButton(sell_btn)
+        self.history_filter_group.addButton(sell_btn, 2)
         filter_layout.addWidget(sell_btn)
         
         p2p_btn = QPushButton("P2P Trade")
         p2p_btn.setObjectName("filterButton")
         p2p_btn.setCheckable(True)
-        p2p_btn.clicked.connect(lambda: self.filter_history("p2p"))
-        self.history_filter_group.addButton(p2p_btn)
+        self.history_filter_group.addButton(p2p_btn, 3)
         filter_layout.addWidget(p2p_btn)
         
+        # One connection for the whole group; the button id indexes HISTORY_FILTERS
+        self.history_filter_group.idClicked.connect(self.on_history_filter_clicked)
+        
         filter_layout.addStretch()
         layout.addLayout(filter_layout)
         
         # Transaction history table
-        self.history_full_table = QTableWidget()
+        self.tx_model = TxModel(self)
+        self.history_full_table = QTableView()
         self.history_full_table.setObjectName("historyTable")
-        self.history_full_table.setColumnCount(7)
-        self.history_full_table.setHorizontalHeaderLabels(['Time', 'Type', 'Pair/Trade', 'Amount', 'Price', 'Total', 'Fee'])
+        self.history_full_table.setModel(self.tx_model)
         self.history_full_table.horizontalHeader().setStretchLastSection(True)
         self.history_full_table.verticalHeader().setVisible(False)
-        self.history_full_table.setColumnWidth(0, 150)
-        self.history_full_table.setColumnWidth(1, 80)
-        self.history_full_table.setColumnWidth(2, 120)
-        self.history_full_table.setColumnWidth(3, 150)
-        self.history_full_table.setColumnWidth(4, 120)
-        self.history_full_table.setColumnWidth(5, 120)
+        set_column_widths(self.history_full_table, [150, 80, 120, 150, 120, 120], QHeaderView.ResizeMode.Fixed)
         layout.addWidget(self.history_full_table, 1)
         
         # Store current filter
@@ -576,7 +785,7 @@ class TradingWindow(QMainWindow):
         # Title
         title = QLabel("My Trades")
         title.setObjectName("panelTitle")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(FONT_BUTTON)
         layout.addWidget(title)
         
         # Trade history table
@@ -601,7 +810,7 @@ class TradingWindow(QMainWindow):
         self.price_label_title.setObjectName("priceLabel")
         self.price_value = QLabel("$0.00")
         self.price_value.setObjectName("priceValue")
-        self.price_value.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        self.price_value.setFont(FONT_DISPLAY)
         price_layout.addWidget(self.price_label_title)
         price_layout.addWidget(self.price_value)
         layout.addLayout(price_layout)
@@ -614,7 +823,7 @@ class TradingWindow(QMainWindow):
         change_label_title.setObjectName("priceLabel")
         self.change_value = QLabel("+0.00%")
         self.change_value.setObjectName("changeValue")
-        self.change_value.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.change_value.setFont(FONT_TITLE)
         change_layout.addWidget(change_label_title)
         change_layout.addWidget(self.change_value)
         layout.addLayout(change_layout)
@@ -711,22 +920,22 @@ class TradingWindow(QMainWindow):
         # Title
         title = QLabel("BUY")
         title.setObjectName("buyTitle")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title.setFont(FONT_TITLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Coin selection with icons
         coin_layout = QHBoxLayout()
         coin_label = QLabel("Coin:")
-        coin_label.setFont(QFont("Segoe UI", 11))
+        coin_label.setFont(FONT_LABEL)
         self.buy_coin_combo = QComboBox()
         self.buy_coin_combo.setObjectName("coinCombo")
         
         # Add all coins except USDT with icons
-        for currency in [c for c in Config.DEFAULT_CURRENCIES if c != 'USDT']:
-            icon_path = self.get_icon_path(f"{currency.lower()}.png")
-            if os.path.exists(icon_path):
-                self.buy_coin_combo.addItem(QIcon(icon_path), currency)
+        for currency in Config.TRADEABLE_CURRENCIES:
+            icon = self.coin_icons.get(currency)
+            if icon:
+                self.buy_coin_combo.addItem(icon, currency)
             else:
                 self.buy_coin_combo.addItem(currency)
         
@@ -738,17 +947,22 @@ class TradingWindow(QMainWindow):
         # Current price display
         self.buy_price_display = QLabel("Price: $0.00")
         self.buy_price_display.setObjectName("priceDisplay")
-        self.buy_price_display.setFont(QFont("Segoe UI", 10))
+        self.buy_price_display.setFont(FONT_SMALL)
         layout.addWidget(self.buy_price_display)
         
         # Amount
         amount_layout = QHBoxLayout()
         amount_label = QLabel("Amount:")
-        amount_label.setFont(QFont("Segoe UI", 11))
+        amount_label.setFont(FONT_LABEL)
         self.buy_amount_input = QLineEdit()
         self.buy_amount_input.setObjectName("amountInput")
         self.buy_amount_input.setPlaceholderText("0.00000000")
-        self.buy_amount_input.textChanged.connect(lambda: self.calculate_buy_total())
+        # Debounce: recalculate once typing pauses, not on every keystroke
+        self.buy_calc_timer = QTimer(self)
+        self.buy_calc_timer.setSingleShot(True)
+        self.buy_calc_timer.setInterval(150)
+        self.buy_calc_timer.timeout.connect(self.calculate_buy_total)
+        self.buy_amount_input.textChanged.connect(self.buy_calc_timer.start)
         amount_layout.addWidget(amount_label)
         amount_layout.addWidget(self.buy_amount_input, 1)
         layout.addLayout(amount_layout)
@@ -756,10 +970,10 @@ class TradingWindow(QMainWindow):
         # Total in USDT
         total_layout = QHBoxLayout()
         total_label = QLabel("Total:")
-        total_label.setFont(QFont("Segoe UI", 11))
+        total_label.setFont(FONT_LABEL)
         self.buy_total_label = QLabel("0.00 USDT")
         self.buy_total_label.setObjectName("totalValue")
-        self.buy_total_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.buy_total_label.setFont(FONT_LABEL_BOLD)
         total_layout.addWidget(total_label)
         total_layout.addWidget(self.buy_total_label, 1)
         layout.addLayout(total_layout)
@@ -767,7 +981,7 @@ class TradingWindow(QMainWindow):
         # Available USDT balance
         self.buy_balance_label = QLabel("Available: 0.00 USDT")
         self.buy_balance_label.setObjectName("balanceLabel")
-        self.buy_balance_label.setFont(QFont("Segoe UI", 10))
+        self.buy_balance_label.setFont(FONT_SMALL)
         layout.addWidget(self.buy_balance_label)
         
         layout.addStretch()
@@ -776,7 +990,7 @@ class TradingWindow(QMainWindow):
         self.buy_submit_btn = QPushButton(f"BUY BTC")
         self.buy_submit_btn.setObjectName("buyButton")
         self.buy_submit_btn.setMinimumHeight(45)
-        self.buy_submit_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.buy_submit_btn.setFont(FONT_BUTTON)
         self.buy_submit_btn.clicked.connect(self.execute_buy)
         layout.addWidget(self.buy_submit_btn)
         
@@ -795,22 +1009,22 @@ class TradingWindow(QMainWindow):
         # Title
         title = QLabel("SELL")
         title.setObjectName("sellTitle")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title.setFont(FONT_TITLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Coin selection with icons
         coin_layout = QHBoxLayout()
         coin_label = QLabel("Coin:")
-        coin_label.setFont(QFont("Segoe UI", 11))
+        coin_label.setFont(FONT_LABEL)
         self.sell_coin_combo = QComboBox()
         self.sell_coin_combo.setObjectName("coinCombo")
         
         # Add all coins except USDT with icons
-        for currency in [c for c in Config.DEFAULT_CURRENCIES if c != 'USDT']:
-            icon_path = self.get_icon_path(f"{currency.lower()}.png")
-            if os.path.exists(icon_path):
-                self.sell_coin_combo.addItem(QIcon(icon_path), currency)
+        for currency in Config.TRADEABLE_CURRENCIES:
+            icon = self.coin_icons.get(currency)
+            if icon:
+                self.sell_coin_combo.addItem(icon, currency)
             else:
                 self.sell_coin_combo.addItem(currency)
         
@@ -822,30 +1036,21 @@ class TradingWindow(QMainWindow):
         # Current holdings card (NEW)
         holdings_card = QFrame()
         holdings_card.setObjectName("holdingsCard")
-        holdings_card.setStyleSheet("""
-            QFrame#holdingsCard {
-                background-color: #1E2329;
-                border: 1px solid #2B3139;
-                border-radius: 6px;
-                padding: 10px;
-            }
-        """)
         holdings_layout = QVBoxLayout()
         holdings_layout.setSpacing(4)
         
         holdings_title = QLabel("Your Holdings")
-        holdings_title.setFont(QFont("Segoe UI", 9))
-        holdings_title.setStyleSheet("color: #848E9C;")
+        holdings_title.setFont(FONT_CAPTION)
+        holdings_title.setObjectName("mutedLabel")
         holdings_layout.addWidget(holdings_title)
         
         self.sell_holdings_label = QLabel("0.00000000 BTC")
-        self.sell_holdings_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        self.sell_holdings_label.setStyleSheet("color: #EAECEF;")
+        self.sell_holdings_label.setFont(FONT_SUBHEADING_BOLD)
         holdings_layout.addWidget(self.sell_holdings_label)
         
         self.sell_holdings_value_label = QLabel("≈ $0.00 USDT")
-        self.sell_holdings_value_label.setFont(QFont("Segoe UI", 10))
-        self.sell_holdings_value_label.setStyleSheet("color: #848E9C;")
+        self.sell_holdings_value_label.setFont(FONT_SMALL)
+        self.sell_holdings_value_label.setObjectName("mutedLabel")
         holdings_layout.addWidget(self.sell_holdings_value_label)
         
         holdings_card.setLayout(holdings_layout)
@@ -854,17 +1059,22 @@ class TradingWindow(QMainWindow):
         # Current price display
         self.sell_price_display = QLabel("Price: $0.00")
         self.sell_price_display.setObjectName("priceDisplay")
-        self.sell_price_display.setFont(QFont("Segoe UI", 10))
+        self.sell_price_display.setFont(FONT_SMALL)
         layout.addWidget(self.sell_price_display)
         
         # Amount
         amount_layout = QHBoxLayout()
         amount_label = QLabel("Amount:")
-        amount_label.setFont(QFont("Segoe UI", 11))
+        amount_label.setFont(FONT_LABEL)
         self.sell_amount_input = QLineEdit()
         self.sell_amount_input.setObjectName("amountInput")
         self.sell_amount_input.setPlaceholderText("0.00000000")
-        self.sell_amount_input.textChanged.connect(lambda: self.calculate_sell_total())
+        # Debounce: recalculate once typing pauses, not on every keystroke
+        self.sell_calc_timer = QTimer(self)
+        self.sell_calc_timer.setSingleShot(True)
+        self.sell_calc_timer.setInterval(150)
+        self.sell_calc_timer.timeout.connect(self.calculate_sell_total)
+        self.sell_amount_input.textChanged.connect(self.sell_calc_timer.start)
         amount_layout.addWidget(amount_label)
         amount_layout.addWidget(self.sell_amount_input, 1)
         layout.addLayout(amount_layout)
@@ -872,10 +1082,10 @@ class TradingWindow(QMainWindow):
         # Total in USDT
         total_layout = QHBoxLayout()
         total_label = QLabel("Total:")
-        total_label.setFont(QFont("Segoe UI", 11))
+        total_label.setFont(FONT_LABEL)
         self.sell_total_label = QLabel("0.00 USDT")
         self.sell_total_label.setObjectName("totalValue")
-        self.sell_total_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.sell_total_label.setFont(FONT_LABEL_BOLD)
         total_layout.addWidget(total_label)
         total_layout.addWidget(self.sell_total_label, 1)
         layout.addLayout(total_layout)
@@ -883,7 +1093,7 @@ class TradingWindow(QMainWindow):
         # Available coin balance
         self.sell_balance_label = QLabel("Available: 0.00000000 BTC")
         self.sell_balance_label.setObjectName("balanceLabel")
-        self.sell_balance_label.setFont(QFont("Segoe UI", 10))
+        self.sell_balance_label.setFont(FONT_SMALL)
         layout.addWidget(self.sell_balance_label)
         
         layout.addStretch()
@@ -892,7 +1102,7 @@ class TradingWindow(QMainWindow):
         self.sell_submit_btn = QPushButton(f"SELL BTC")
         self.sell_submit_btn.setObjectName("sellButton")
         self.sell_submit_btn.setMinimumHeight(45)
-        self.sell_submit_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.sell_submit_btn.setFont(FONT_BUTTON)
         self.sell_submit_btn.clicked.connect(self.execute_sell)
         layout.addWidget(self.sell_submit_btn)
         
@@ -911,13 +1121,13 @@ class TradingWindow(QMainWindow):
         # Portfolio section
         portfolio_title = QLabel("Portfolio")
         portfolio_title.setObjectName("panelTitle")
-        portfolio_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        portfolio_title.setFont(FONT_BUTTON)
         layout.addWidget(portfolio_title)
         
         # Total value
         self.total_value_label = QLabel("Total: $0.00")
         self.total_value_label.setObjectName("totalValue")
-        self.total_value_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        self.total_value_label.setFont(FONT_SUBHEADING_BOLD)
         layout.addWidget(self.total_value_label)
         
         # Wallet table
@@ -925,6 +1135,7 @@ class TradingWindow(QMainWindow):
         self.wallet_table.setObjectName("walletTable")
         self.wallet_table.setColumnCount(2)
         self.wallet_table.setHorizontalHeaderLabels(['Currency', 'Balance'])
+        set_column_widths(self.wallet_table, [100, 220], QHeaderView.ResizeMode.Fixed)
         self.wallet_table.horizontalHeader().setStretchLastSection(True)
         self.wallet_table.verticalHeader().setVisible(False)
         layout.addWidget(self.wallet_table)
@@ -934,10 +1145,10 @@ class TradingWindow(QMainWindow):
     
     def create_history_table(self):
         """Create a table for order/trade history."""
-        table = QTableWidget()
+        table = QTableView()
         table.setObjectName("historyTable")
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(['Time', 'Pair', 'Type', 'Side', 'Price', 'Amount', 'Status'])
+        table.setModel(TradeHistoryModel(self))
+        set_column_widths(table, [140, 70, 100, 120, 120, 120, 90], QHeaderView.ResizeMode.Fixed)
         table.horizontalHeader().setStretchLastSection(True)
         table.verticalHeader().setVisible(False)
         return table
@@ -961,12 +1172,12 @@ class TradingWindow(QMainWindow):
         # Title
         create_title = QLabel("Create Offer")
         create_title.setObjectName("panelTitle")
-        create_title.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        create_title.setFont(FONT_SMALL_BOLD)
         create_layout.addWidget(create_title)
         
         # Offering section (compact)
         offer_label = QLabel("Offering:")
-        offer_label.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        offer_label.setFont(FONT_CAPTION_BOLD)
         create_layout.addWidget(offer_label)
         
         self.offer_currency_combo = QComboBox()
@@ -974,9 +1185,9 @@ class TradingWindow(QMainWindow):
         
         # Add all coins with icons
         for currency in Config.DEFAULT_CURRENCIES:
-            icon_path = self.get_icon_path(f"{currency.lower()}.png")
-            if os.path.exists(icon_path):
-                self.offer_currency_combo.addItem(QIcon(icon_path), currency)
+            icon = self.coin_icons.get(currency)
+            if icon:
+                self.offer_currency_combo.addItem(icon, currency)
             else:
                 self.offer_currency_combo.addItem(currency)
         
@@ -985,25 +1196,17 @@ class TradingWindow(QMainWindow):
         
         # Your balance card
         self.offer_balance_card = QFrame()
-        self.offer_balance_card.setStyleSheet("""
-            QFrame {
-                background-color: #1E2329;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-                padding: 6px;
-            }
-        """)
+        self.offer_balance_card.setObjectName("offerBalanceCard")
         balance_layout = QVBoxLayout()
         balance_layout.setSpacing(2)
         
         balance_title = QLabel("Your Balance")
-        balance_title.setFont(QFont("Segoe UI", 8))
-        balance_title.setStyleSheet("color: #848E9C;")
+        balance_title.setFont(FONT_TINY)
+        balance_title.setObjectName("mutedLabel")
         balance_layout.addWidget(balance_title)
         
         self.offer_balance_label = QLabel("0.00000000 BTC")
-        self.offer_balance_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        self.offer_balance_label.setStyleSheet("color: #EAECEF;")
+        self.offer_balance_label.setFont(FONT_SMALL_BOLD)
         balance_layout.addWidget(self.offer_balance_label)
         
         self.offer_balance_card.setLayout(balance_layout)
@@ -1016,7 +1219,7 @@ class TradingWindow(QMainWindow):
         
         # Requesting section (compact)
         request_label = QLabel("Want:")
-        request_label.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        request_label.setFont(FONT_CAPTION_BOLD)
         create_layout.addWidget(request_label)
         
         self.request_currency_combo = QComboBox()
@@ -1024,15 +1227,14 @@ class TradingWindow(QMainWindow):
         
         # Add all coins with icons
         for currency in Config.DEFAULT_CURRENCIES:
-            icon_path = self.get_icon_path(f"{currency.lower()}.png")
-            if os.path.exists(icon_path):
-                self.request_currency_combo.addItem(QIcon(icon_path), currency)
+            icon = self.coin_icons.get(currency)
+            if icon:
+                self.request_currency_combo.addItem(icon, currency)
             else:
                 self.request_currency_combo.addItem(currency)
         
         # Find USDT index and set as default
-        usdt_index = Config.DEFAULT_CURRENCIES.index('USDT') if 'USDT' in Config.DEFAULT_CURRENCIES else 0
-        self.request_currency_combo.setCurrentIndex(usdt_index)
+        self.request_currency_combo.setCurrentIndex(USDT_INDEX)
         create_layout.addWidget(self.request_currency_combo)
         
         self.request_amount_input = QLineEdit()
@@ -1043,11 +1245,11 @@ class TradingWindow(QMainWindow):
         create_layout.addStretch()
         
         # Create button
-        create_offer_btn = QPushButton("Create Offer")
-        create_offer_btn.setObjectName("createOfferButton")
-        create_offer_btn.setMinimumHeight(32)
-        create_offer_btn.clicked.connect(self.create_trade_offer)
-        create_layout.addWidget(create_offer_btn)
+        self.create_offer_btn = QPushButton("Create Offer")
+        self.create_offer_btn.setObjectName("createOfferButton")
+        self.create_offer_btn.setMinimumHeight(32)
+        self.create_offer_btn.clicked.connect(self.create_trade_offer)
+        create_layout.addWidget(self.create_offer_btn)
         
         create_offer_panel.setLayout(create_layout)
         layout.addWidget(create_offer_panel)
@@ -1057,33 +1259,29 @@ class TradingWindow(QMainWindow):
         offers_tabs.setObjectName("p2pOffersTabs")
         
         # All offers table (fixed columns)
-        self.all_offers_table = QTableWidget()
+        self.all_offers_table = QTableView()
         self.all_offers_table.setObjectName("p2pOffersTable")
-        self.all_offers_table.setColumnCount(6)
-        self.all_offers_table.setHorizontalHeaderLabels(['User', 'Offering', 'Amount', 'Wants', 'Amount', 'Action'])
-        self.all_offers_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.all_offers_table.setModel(P2POffersModel(show_accept=True, parent=self))
         self.all_offers_table.verticalHeader().setVisible(False)
-        self.all_offers_table.setColumnWidth(0, 120)  # User
-        self.all_offers_table.setColumnWidth(1, 100)  # Offering
-        self.all_offers_table.setColumnWidth(2, 150)  # Amount
-        self.all_offers_table.setColumnWidth(3, 100)  # Wants
-        self.all_offers_table.setColumnWidth(4, 150)  # Amount
-        self.all_offers_table.setColumnWidth(5, 100)  # Action
+        # User, Offering, Amount, Wants, Amount, Action
+        set_column_widths(self.all_offers_table, [120, 100, 150, 100, 150, 100], QHeaderView.ResizeMode.Fixed)
+        self.accept_delegate = ActionButtonDelegate("#0ECB81", "#2EE5A0", self.all_offers_table)
+        self.accept_delegate.clicked.connect(partial(self.on_offer_action_clicked, self.all_offers_table))
+        self.all_offers_table.setItemDelegateForColumn(5, self.accept_delegate)
+        self.all_offers_table.setMouseTracking(True)
         offers_tabs.addTab(self.all_offers_table, "Available")
         
         # My offers table (fixed columns)
-        self.my_offers_table = QTableWidget()
+        self.my_offers_table = QTableView()
         self.my_offers_table.setObjectName("p2pOffersTable")
-        self.my_offers_table.setColumnCount(6)
-        self.my_offers_table.setHorizontalHeaderLabels(['Time', 'Offering', 'Amount', 'Wants', 'Amount', 'Action'])
-        self.my_offers_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.my_offers_table.setModel(P2POffersModel(show_accept=False, parent=self))
         self.my_offers_table.verticalHeader().setVisible(False)
-        self.my_offers_table.setColumnWidth(0, 140)  # Time
-        self.my_offers_table.setColumnWidth(1, 100)  # Offering
-        self.my_offers_table.setColumnWidth(2, 150)  # Amount
-        self.my_offers_table.setColumnWidth(3, 100)  # Wants
-        self.my_offers_table.setColumnWidth(4, 150)  # Amount
-        self.my_offers_table.setColumnWidth(5, 80)   # Action
+        # Time, Offering, Amount, Wants, Amount, Action
+        set_column_widths(self.my_offers_table, [140, 100, 150, 100, 150, 80], QHeaderView.ResizeMode.Fixed)
+        self.cancel_delegate = ActionButtonDelegate("#F6465D", "#FF6479", self.my_offers_table)
+        self.cancel_delegate.clicked.connect(partial(self.on_offer_action_clicked, self.my_offers_table))
+        self.my_offers_table.setItemDelegateForColumn(5, self.cancel_delegate)
+        self.my_offers_table.setMouseTracking(True)
         offers_tabs.addTab(self.my_offers_table, "My Offers")
         
         layout.addWidget(offers_tabs, 1)
@@ -1114,83 +1312,80 @@ class TradingWindow(QMainWindow):
                 styled_dialogs.show_warning(self, "Invalid Trade", "You cannot trade a currency for itself.")
                 return
             
-            # Create the offer in database
-            result = self.db.create_trade_offer(
-                user_id=self.user_id,
-                offering_currency=offering_currency,
-                offering_amount=offering_amount,
-                requesting_currency=requesting_currency,
-                requesting_amount=requesting_amount
+            # Create the offer in database (off the UI thread)
+            self.create_offer_btn.setEnabled(False)
+            self.create_offer_btn.setText("Creating...")
+            self.run_in_background(
+                partial(
+                    self.db.create_trade_offer,
+                    user_id=self.user_id,
+                    offering_currency=offering_currency,
+                    offering_amount=offering_amount,
+                    requesting_currency=requesting_currency,
+                    requesting_amount=requesting_amount
+                ),
+                self.on_trade_offer_created,
+                on_failed=self.on_trade_offer_failed
             )
-            
-            if result['success']:
-                styled_dialogs.show_success(self, "Offer Created ✨", "Your trade offer has been created successfully!")
-                self.offer_amount_input.clear()
-                self.request_amount_input.clear()
-                self.refresh_p2p_offers()
-            else:
-                styled_dialogs.show_warning(self, "Failed", result.get('error', 'Failed to create offer'))
                 
         except ValueError:
             styled_dialogs.show_warning(self, "Invalid Input", "Please enter valid numbers.")
         except Exception as e:
             styled_dialogs.show_error(self, "Error", f"An error occurred: {str(e)}")
     
+    def on_trade_offer_created(self, result):
+        """Handle the create_trade_offer result (main thread)."""
+        self.create_offer_btn.setEnabled(True)
+        self.create_offer_btn.setText("Create Offer")
+        
+        if result['success']:
+            styled_dialogs.show_success(self, "Offer Created ✨", "Your trade offer has been created successfully!")
+            self.offer_amount_input.clear()
+            self.request_amount_input.clear()
+            self.refresh_p2p_offers()
+        else:
+            styled_dialogs.show_warning(self, "Failed", result.get('error', 'Failed to create offer'))
+    
+    def on_trade_offer_failed(self, error):
+        """Handle an exception raised while creating a trade offer."""
+        self.create_offer_btn.setEnabled(True)
+        self.create_offer_btn.setText("Create Offer")
+        styled_dialogs.show_error(self, "Error", f"An error occurred: {error}")
+    
     def refresh_p2p_offers(self):
-        """Refresh the P2P offers tables."""
-        try:
-            # Get all active offers
-            all_offers = self.db.get_all_trade_offers(exclude_user_id=self.user_id)
-            self.populate_p2p_offers_table(self.all_offers_table, all_offers, show_accept=True)
-            
-            # Get user's offers
-            my_offers = self.db.get_user_trade_offers(self.user_id)
-            self.populate_p2p_offers_table(self.my_offers_table, my_offers, show_accept=False)
-            
-        except Exception as e:
-            print(f"Error refreshing P2P offers: {e}")
+        """Refresh the P2P offers tables in the background."""
+        self.run_in_background(self.fetch_p2p_offers, self.apply_p2p_offers,
+                               on_failed=partial(self.on_refresh_failed, "P2P offers"))
+    
+    def fetch_p2p_offers(self):
+        """Load all active offers and the user's own offers (worker thread)."""
+        all_offers = self.db.get_all_trade_offers(exclude_user_id=self.user_id)
+        my_offers = self.db.get_user_trade_offers(self.user_id)
+        return all_offers, my_offers
     
-    def populate_p2p_offers_table(self, table, offers, show_accept=True):
+    def apply_p2p_offers(self, offers):
+        """Show the offers loaded by fetch_p2p_offers (main thread)."""
+        all_offers, my_offers = offers
+        self.populate_p2p_offers_table(self.all_offers_table, all_offers)
+        self.populate_p2p_offers_table(self.my_offers_table, my_offers)
+    
+    def on_refresh_failed(self, name, error):
+        """Log a background refresh that raised."""
+        print(f"Error refreshing {name}: {error}")
+    
+    def populate_p2p_offers_table(self, table, offers):
         """Populate P2P offers table."""
-        table.setRowCount(0)
-        
-        for offer in offers:
-            row = table.rowCount()
-            table.insertRow(row)
-            
-            if show_accept:
-                # All offers table - show creator name
-                creator_name = offer.get('creator_name', 'Unknown')[:15]
-                table.setItem(row, 0, QTableWidgetItem(creator_name))
-            else:
-                # My offers table - show created time
-                created_at = offer.get('created_at', '')
-                if isinstance(created_at, str):
-                    timestamp = created_at[:16]
-                else:
-                    # It's a datetime object
-                    timestamp = created_at.strftime('%Y-%m-%d %H:%M') if created_at else ''
-                table.setItem(row, 0, QTableWidgetItem(timestamp))
-            
-            # Offering
-            table.setItem(row, 1, QTableWidgetItem(offer['offering_currency']))
-            table.setItem(row, 2, QTableWidgetItem(f"{float(offer['offering_amount']):.8f}"))
-            
-            # Requesting
-            table.setItem(row, 3, QTableWidgetItem(offer['requesting_currency']))
-            table.setItem(row, 4, QTableWidgetItem(f"{float(offer['requesting_amount']):.8f}"))
-            
-            # Action button
-            if show_accept:
-                accept_btn = QPushButton("✓ Accept")
-                accept_btn.setObjectName("acceptOfferButton")
-                accept_btn.clicked.connect(lambda checked, offer_id=offer['offer_id']: self.accept_trade_offer(offer_id))
-                table.setCellWidget(row, 5, accept_btn)
-            else:
-                cancel_btn = QPushButton("✕ Cancel")
-                cancel_btn.setObjectName("cancelOfferButton")
-                cancel_btn.clicked.connect(lambda checked, offer_id=offer['offer_id']: self.cancel_trade_offer(offer_id))
-                table.setCellWidget(row, 5, cancel_btn)
+        table.model().set_rows(offers)
+    
+    def on_offer_action_clicked(self, table, row):
+        """Accept or cancel the offer whose action button was clicked."""
+        model = table.model()
+        if row >= len(model.offer_ids):
+            return
+        if model.show_accept:
+            self.accept_trade_offer(model.offer_ids[row])
+        else:
+            self.cancel_trade_offer(model.offer_ids[row])
     
     def accept_trade_offer(self, offer_id):
         """Accept a P2P trade offer."""
@@ -1232,81 +1427,81 @@ class TradingWindow(QMainWindow):
             styled_dialogs.show_error(self, "Error", f"An error occurred: {str(e)}")
     
     def refresh_transaction_history(self):
-        """Refresh the full transaction history."""
-        try:
-            print("🔄 Refreshing transaction history...")
-            
-            # Get regular transactions (buy/sell)
-            transactions = self.db.get_user_transactions(self.user_id, limit=200)
-            
-            # Get P2P transactions
-            p2p_transactions = self.db._execute('''
+        """Refresh the full transaction history in the background."""
+        self.run_in_background(self.fetch_transaction_history, self.apply_transaction_history,
+                               on_failed=partial(self.on_refresh_failed, "transaction history"))
+    
+    def fetch_transaction_history(self):
+        """Load the user's recent buy/sell and P2P trades (worker thread)."""
+        # Buy/sell and P2P trades in one query, merged and sorted by Postgres.
+        # The P2P side is split into acceptor/creator halves (instead of an
+        # OR across the join) so each half can use its own index.
+        return self.db._execute('''
+            WITH recent AS (
+                SELECT 
+                    created_at,
+                    type,
+                    pair,
+                    COALESCE(amount, 0)::numeric as amount,
+                    COALESCE(price, 0)::float8 as price,
+                    COALESCE(fee, 0)::float8 as fee
+                FROM "Transactions"
+                WHERE user_id = %s
+                
+                UNION ALL
+                
+                -- P2P trades this user accepted
                 SELECT 
                     pt.created_at,
-                    'p2p' as type,
-                    CASE 
-                        WHEN pt.acceptor_id = %s THEN to_creator.offering_currency || '/' || to_creator.requesting_currency
-                        ELSE to_acceptor.requesting_currency || '/' || to_acceptor.offering_currency
-                    END as pair,
-                    CASE 
-                        WHEN pt.acceptor_id = %s THEN to_creator.offering_amount
-                        ELSE to_acceptor.requesting_amount
-                    END as amount,
-                    CASE 
-                        WHEN pt.acceptor_id = %s THEN to_creator.requesting_amount / NULLIF(to_creator.offering_amount, 0)
-                        ELSE to_acceptor.offering_amount / NULLIF(to_acceptor.requesting_amount, 0)
-                    END as price,
-                    CASE 
-                        WHEN pt.acceptor_id = %s THEN to_creator.requesting_amount
-                        ELSE to_acceptor.offering_amount
-                    END as total,
-                    0.0 as fee
+                    'p2p',
+                    o.offering_currency || '/' || o.requesting_currency,
+                    o.offering_amount::numeric,
+                    COALESCE(o.requesting_amount / NULLIF(o.offering_amount, 0), 0)::float8,
+                    0.0::float8
                 FROM "P2PTradeTransactions" pt
-                JOIN "TradeOffers" to_creator ON pt.offer_id = to_creator.offer_id
-                JOIN "TradeOffers" to_acceptor ON pt.offer_id = to_acceptor.offer_id
-                WHERE pt.acceptor_id = %s OR to_creator.creator_id = %s
-                ORDER BY pt.created_at DESC
-                LIMIT 100
-            ''', (self.user_id, self.user_id, self.user_id, self.user_id, self.user_id, self.user_id))
-            
-            # Combine and sort all transactions
-            all_transactions = []
-            
-            for tx in transactions:
-                all_transactions.append({
-                    'created_at': tx.get('created_at'),
-                    'type': tx.get('type'),
-                    'pair': tx.get('pair'),
-                    'amount': float(tx.get('amount', 0)),
-                    'price': float(tx.get('price', 0)),
-                    'fee': float(tx.get('fee', 0))
-                })
-            
-            for tx in p2p_transactions:
-                all_transactions.append({
-                    'created_at': tx.get('created_at'),
-                    'type': 'p2p',
-                    'pair': tx.get('pair'),
-                    'amount': float(tx.get('amount', 0)),
-                    'price': float(tx.get('price', 0)),
-                    'fee': float(tx.get('fee', 0))
-                })
-            
-            # Sort by date (newest first)
-            all_transactions.sort(key=lambda x: x['created_at'] if x['created_at'] else '', reverse=True)
-            
-            # Store for filtering
-            self.all_transactions = all_transactions
-            
-            # Apply current filter
-            self.filter_history(self.current_history_filter)
-            
-            print(f"✅ Loaded {len(all_transactions)} transactions")
-            
-        except Exception as e:
-            print(f"Error refreshing transaction history: {e}")
-            import traceback
-            traceback.print_exc()
+                JOIN "TradeOffers" o ON pt.offer_id = o.offer_id
+                WHERE pt.acceptor_id = %s
+                
+                UNION ALL
+                
+                -- P2P trades on offers this user created
+                SELECT 
+                    pt.created_at,
+                    'p2p',
+                    o.requesting_currency || '/' || o.offering_currency,
+                    o.requesting_amount::numeric,
+                    COALESCE(o.offering_amount / NULLIF(o.requesting_amount, 0), 0)::float8,
+                    0.0::float8
+                FROM "TradeOffers" o
+                JOIN "P2PTradeTransactions" pt ON pt.offer_id = o.offer_id
+                WHERE o.creator_id = %s AND pt.acceptor_id IS DISTINCT FROM %s
+            )
+            SELECT
+                created_at,
+                to_char(created_at, 'YYYY-MM-DD HH24:MI:SS') as ts_str,
+                type,
+                pair,
+                -- Amounts as integer satoshi-style units (1e-8), formatted without floats
+                (amount * 100000000)::bigint as amount_sat,
+                price,
+                fee,
+                (amount * price::numeric)::float8 as total
+            FROM recent
+            ORDER BY created_at DESC NULLS LAST
+            LIMIT 200
+        ''', (self.user_id,) * 4)
+    
+    def apply_transaction_history(self, all_transactions):
+        """Show the trades loaded by fetch_transaction_history (main thread)."""
+        # Store for filtering
+        self.all_transactions = all_transactions
+        
+        # Apply current filter
+        self.filter_history(self.current_history_filter)
+    
+    def on_history_filter_clicked(self, button_id):
+        """Apply the history filter for the clicked filter button."""
+        self.filter_history(HISTORY_FILTERS[button_id])
     
     def filter_history(self, filter_type):
         """Filter transaction history by type."""
@@ -1326,138 +1521,114 @@ class TradingWindow(QMainWindow):
     
     def populate_full_history_table(self, transactions):
         """Populate the full transaction history table."""
-        self.history_full_table.setRowCount(0)
-        
-        for tx in transactions:
-            row = self.history_full_table.rowCount()
-            self.history_full_table.insertRow(row)
-            
-            # Time
-            created_at = tx.get('created_at', '')
-            if isinstance(created_at, str):
-                timestamp = created_at[:19]
-            else:
-                timestamp = created_at.strftime('%Y-%m-%d %H:%M:%S') if created_at else ''
-            self.history_full_table.setItem(row, 0, QTableWidgetItem(timestamp))
-            
-            # Type
-            tx_type = tx.get('type', '').upper()
-            type_item = QTableWidgetItem(tx_type)
-            type_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            
-            # Color code by type
-            if tx_type == 'BUY':
-                type_item.setForeground(QColor("#0ECB81"))  # Green
-            elif tx_type == 'SELL':
-                type_item.setForeground(QColor("#F6465D"))  # Red
-            else:
-                type_item.setForeground(QColor("#FCD535"))  # Yellow for P2P
-            
-            self.history_full_table.setItem(row, 1, type_item)
-            
-            # Pair
-            self.history_full_table.setItem(row, 2, QTableWidgetItem(tx.get('pair', '')))
-            
-            # Amount
-            amount_item = QTableWidgetItem(f"{tx.get('amount', 0):.8f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.history_full_table.setItem(row, 3, amount_item)
-            
-            # Price
-            price_item = QTableWidgetItem(f"${tx.get('price', 0):,.2f}")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.history_full_table.setItem(row, 4, price_item)
-            
-            # Total
-            total = tx.get('amount', 0) * tx.get('price', 0)
-            total_item = QTableWidgetItem(f"${total:,.2f}")
-            total_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            total_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.history_full_table.setItem(row, 5, total_item)
-            
-            # Fee
-            fee_item = QTableWidgetItem(f"${tx.get('fee', 0):.2f}")
-            fee_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.history_full_table.setItem(row, 6, fee_item)
+        self.tx_model.set_rows(transactions)
     
-    def add_market_row(self, pair):
-        """Add a row to the market table with coin icon."""
-        row = self.market_table.rowCount()
-        self.market_table.insertRow(row)
+    def add_market_row(self, row, pair):
+        """Fill a market table row with the pair, its coin icon and placeholders."""
         
         # Extract base symbol from pair (e.g., "BTC/USDT" -> "BTC")
         base_symbol = pair.split('/')[0]
         
         # Create pair item with icon
         pair_item = QTableWidgetItem(pair)
-        pair_item.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        pair_item.setFont(FONT_BUTTON)
         
-        # Try to load coin icon
-        icon_path = f"assets/icons/{base_symbol.lower()}.png"
-        if os.path.exists(icon_path):
-            pair_item.setIcon(QIcon(icon_path))
+        # Coin icon from the shared cache
+        icon = self.coin_icons.get(base_symbol)
+        if icon:
+            pair_item.setIcon(icon)
         
         self.market_table.setItem(row, 0, pair_item)
         
         # Price
         price_item = QTableWidgetItem("$0.00")
-        price_item.setFont(QFont("Segoe UI", 12))
-        price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        price_item.setFont(FONT_BODY)
+        price_item.setTextAlignment(RIGHT_ALIGN)
         self.market_table.setItem(row, 1, price_item)
         
         # 24h Change
         change_item = QTableWidgetItem("0.00%")
-        change_item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        change_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        change_item.setFont(FONT_LABEL_BOLD)
+        change_item.setTextAlignment(RIGHT_ALIGN)
         self.market_table.setItem(row, 2, change_item)
         
-        # Set row height for better spacing
-        self.market_table.setRowHeight(row, 48)
+        # Price ticks update these items in place
+        self.market_items[pair] = (base_symbol, price_item, change_item)
     
     def load_initial_data(self):
-        """Load initial data (wallets, orders, etc.)."""
+        """Load initial data (wallets, orders, etc.).
+        
+        Only what the visible forms need is loaded before the window is
+        shown; the rest is staggered onto the event loop so the window
+        becomes interactive right away.
+        """
         try:
             print("[INIT] Loading wallet display...")
             self.update_wallet_display()
-            print("[INIT] Loading order history...")
-            self.update_order_history()
-            print("[INIT] Loading chart...")
-            self.update_chart()  # Load initial chart
             
             # Initialize buy and sell forms
             print("[INIT] Initializing buy form...")
             self.on_buy_coin_changed()
             print("[INIT] Initializing sell form...")
             self.on_sell_coin_changed()
-            
-            # Initialize P2P balance display and load offers
-            print("[INIT] Initializing P2P balance...")
-            self.update_p2p_offer_balance()
-            print("[INIT] Loading P2P offers...")
-            self.refresh_p2p_offers()
-            print("[INIT] Loading transaction history...")
-            self.refresh_transaction_history()
-            print("[INIT] ✅ Initial data loaded successfully!")
         except Exception as e:
             print(f"[INIT] ⚠️ Error during initialization: {e}")
-            import traceback
             traceback.print_exc()
+        
+        # Deferred warm-up: order history, P2P offers, chart, P2P balance
+        # and transaction history
+        QTimer.singleShot(0, self.update_order_history)
+        QTimer.singleShot(0, self.refresh_p2p_offers)
+        QTimer.singleShot(50, self.update_chart)
+        QTimer.singleShot(100, self.update_p2p_offer_balance)
+        QTimer.singleShot(150, self.refresh_transaction_history)
     
     def update_prices(self):
-        """Update all cryptocurrency prices."""
+        """Fetch all cryptocurrency prices in the background."""
+        # Skip this tick if the previous fetch is still running
+        if self.price_fetch_pending:
+            return
+        self.price_fetch_pending = True
+        self.run_in_background(self.fetch_price_data, self.apply_prices,
+                               on_failed=self.on_price_fetch_failed)
+    
+    def fetch_price_data(self):
+        """Fetch prices and 24h changes (runs on a worker thread)."""
+        # Fetch prices (returns {'BTC': 98000, 'ETH': 3500, ...})
+        prices = self.price_service.get_multiple_prices(list(PRICE_SYMBOLS))
+        if not prices:
+            return {}
+        
+        # Price and 24h change for every coin in one request
+        markets = self.price_service.get_markets_bulk(list(PRICE_SYMBOLS))
+        
+        pair_prices = {}
+        changes = {}
+        for pair in Config.DEFAULT_TRADING_PAIRS:
+            # USDT pairs come straight from the batch; only crosses need a lookup
+            base, quote = pair.split('/')
+            price = prices.get(base) if quote == 'USDT' else self.price_service.get_pair_price(pair)
+            if price:
+                pair_prices[pair] = price
+                # get_markets_bulk already falls back per symbol (cached)
+                changes[base] = markets[base]['change_24h'] if base in markets else 0
+        
+        return {'prices': prices, 'pair_prices': pair_prices, 'changes': changes}
+    
+    def on_price_fetch_failed(self, error):
+        """Show a price fetch error in the UI."""
+        self.price_fetch_pending = False
+        print(f"❌ Error updating prices: {error}")
+        if hasattr(self, 'price_value'):
+            self.price_value.setText("Connection Error")
+            self.price_label_title.setText("⚠️ Check Internet Connection")
+    
+    def apply_prices(self, data):
+        """Apply fetched prices to the UI (main thread)."""
+        self.price_fetch_pending = False
         try:
-            # Get all unique symbols
-            symbols = set()
-            for pair in Config.DEFAULT_TRADING_PAIRS:
-                base, quote = pair.split('/')
-                symbols.add(base)
-                symbols.add(quote)
-            
-            # Fetch prices (returns {'BTC': 98000, 'ETH': 3500, ...})
-            prices = self.price_service.get_multiple_prices(list(symbols))
-            
             # Check if we got any prices
-            if not prices or len(prices) == 0:
+            if not data:
                 print("⚠️ Warning: No prices received from API")
                 # Show warning in price display
                 if hasattr(self, 'price_value'):
@@ -1465,6 +1636,9 @@ class TradingWindow(QMainWindow):
                     self.price_label_title.setText("⚠️ Price API Unavailable")
                 return
             
+            prices = data['prices']
+            pair_prices = data['pair_prices']
+            
             # Convert to pair format for wallet display
             # {'BTC': 98000} -> {'BTC/USDT': 98000}
             self.current_prices = {}
@@ -1472,41 +1646,28 @@ class TradingWindow(QMainWindow):
                 if symbol != 'USDT' and price:
                     self.current_prices[f"{symbol}/USDT"] = price
             
-            # Update market table
-            for row in range(self.market_table.rowCount()):
-                pair = self.market_table.item(row, 0).text()
-                price = self.price_service.get_pair_price(pair)
-                
-                if price:
-                    # Update price
-                    price_item = QTableWidgetItem(f"${price:,.2f}")
-                    price_item.setFont(QFont("Segoe UI", 12))
-                    price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                    self.market_table.setItem(row, 1, price_item)
-                    
-                    # Get real 24h change from price service
-                    change_data = self.price_service.get_24h_change(pair.split('/')[0])
-                    if change_data:
-                        change = change_data.get('price_change_percentage_24h', 0)
-                    else:
-                        change = 0
+            # Update market table (skipped when nothing changed since last tick)
+            if data != self.last_price_data:
+                self.last_price_data = data
+                for pair, (base, price_item, change_item) in self.market_items.items():
+                    price = pair_prices.get(pair)
+                    if not price:
+                        continue
                     
-                    change_item = QTableWidgetItem(f"{change:+.2f}%")
-                    change_item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-                    change_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    change = data['changes'].get(base, 0)
+                    if self.market_values.get(pair) == (price, change):
+                        continue
+                    self.market_values[pair] = (price, change)
                     
-                    # Color code the change
-                    if change >= 0:
-                        change_item.setForeground(QColor("#0ECB81"))
-                    else:
-                        change_item.setForeground(QColor("#F6465D"))
-                    
-                    self.market_table.setItem(row, 2, change_item)
+                    # Update the row's items in place
+                    price_item.setText(f"${price:,.2f}")
+                    change_item.setText(f"{change:+.2f}%")
+                    change_item.setForeground(COLOR_BUY if change >= 0 else COLOR_SELL)
             
             # Cycle through coins for price display
             if self.price_display_pairs:
                 display_pair = self.price_display_pairs[self.price_display_index]
-                display_price = self.price_service.get_pair_price(display_pair)
+                display_price = pair_prices.get(display_pair)
                 
                 if display_price:
                     self.price_label_title.setText(display_pair)
@@ -1516,20 +1677,26 @@ class TradingWindow(QMainWindow):
                 self.price_display_index = (self.price_display_index + 1) % len(self.price_display_pairs)
             
             # Update header with current trading pair
-            current_price = self.price_service.get_pair_price(self.current_pair)
+            current_price = pair_prices.get(self.current_pair)
             if current_price:
                 self.header_price_label.setText(f"${current_price:,.2f}")
-                self.calculate_total("BUY")
-                self.calculate_total("SELL")
             
-            # Update portfolio value and wallet display
-            self.update_portfolio_value()
-            self.update_wallet_display()
+            # Order totals only depend on the selected coins' prices here;
+            # amount edits recalculate through the input debounce timers
+            buy_price = self.current_prices.get(self.buy_pair)
+            if buy_price != self.last_buy_price:
+                self.last_buy_price = buy_price
+                self.calculate_buy_total()
+            sell_price = self.current_prices.get(self.sell_pair)
+            if sell_price != self.last_sell_price:
+                self.last_sell_price = sell_price
+                self.calculate_sell_total()
+            
+            # Reload wallets and portfolio data off the GUI thread
+            self.refresh_portfolio()
             
         except Exception as e:
-            print(f"❌ Error updating prices: {e}")
-            import traceback
-            traceback.print_exc()
+            report_error("❌ Error updating prices", e)
             
             # Show error in UI
             if hasattr(self, 'price_value'):
@@ -1539,94 +1706,177 @@ class TradingWindow(QMainWindow):
     def update_chart(self):
         """Update the chart with current pair."""
         try:
-            # Extract base symbol from pair (e.g., "BTC/USDT" -> "BTC")
-            base_symbol = self.current_pair.split('/')[0]
-            
-            # Load CoinGecko chart for the symbol
-            self.chart_widget.load_chart(base_symbol)
+            # Load CoinGecko chart for the base symbol (e.g., "BTC/USDT" -> "BTC")
+            self.chart_widget.load_chart(self.current_base)
                 
         except Exception as e:
             print(f"Error updating chart: {e}")
             self.chart_widget.plot_empty("Failed to load chart data")
     
     def update_wallet_display(self):
-        """Update the wallet display."""
+        """Reload wallets and update the wallet display."""
         try:
-            wallets = self.db.get_user_wallets(self.user_id)
-            
-            print(f"[DEBUG] Updating wallet display - Found {len(wallets)} wallets")
-            print(f"[DEBUG] Current prices available: {list(self.current_prices.keys())[:5]}...")
-            
-            self.wallet_table.setRowCount(0)
-            
-            for wallet in wallets:
-                row = self.wallet_table.rowCount()
-                self.wallet_table.insertRow(row)
-                
+            # One query per refresh; the order forms read balances from here
+            self.wallets = self.db.get_wallets_map(self.user_id)
+        except Exception as e:
+            print(f"Error updating wallet: {e}")
+            return
+        self.show_wallets()
+    
+    def show_wallets(self):
+        """Show self.wallets in the wallet table and order-form balance labels."""
+        try:
+            rows = []
+            for wallet in self.wallets.values():
                 currency = wallet['currency']
                 balance = float(wallet['balance'])
                 
-                # Currency column with icon
-                currency_item = QTableWidgetItem(currency)
-                currency_item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-                icon_path = self.get_icon_path(f"{currency.lower()}.png")
-                if os.path.exists(icon_path):
-                    currency_item.setIcon(QIcon(icon_path))
-                self.wallet_table.setItem(row, 0, currency_item)
-                
-                # Balance column
-                balance_item = QTableWidgetItem(f"{balance:.8f}")
-                self.wallet_table.setItem(row, 1, balance_item)
-                
-                # Value in USDT column (if exists)
-                if self.wallet_table.columnCount() == 3:
-                    value_usdt = 0.0
-                    if currency == 'USDT':
-                        value_usdt = balance
-                    elif f"{currency}/USDT" in self.current_prices:
-                        price = self.current_prices[f"{currency}/USDT"]
+                # Value in USDT column (0 until the coin has a price)
+                value_usdt = 0.0
+                if currency == 'USDT':
+                    value_usdt = balance
+                else:
+                    price = self.current_prices.get(f"{currency}/USDT")
+                    if price is not None:
                         value_usdt = balance * price
-                        print(f"[DEBUG] {currency}: {balance} * ${price} = ${value_usdt}")
-                    else:
-                        print(f"[DEBUG] No price found for {currency}/USDT")
-                    
-                    value_item = QTableWidgetItem(f"${value_usdt:.2f}")
-                    if value_usdt > 0:
-                        value_item.setForeground(QColor("#0ECB81"))
-                    self.wallet_table.setItem(row, 2, value_item)
+                
+                rows.append((currency, self.coin_icons.get(currency), balance, value_usdt))
+            
+            self.wallet_model.set_rows(rows)
             
             # Update balance labels in order forms
             self.update_balance_labels()
             
         except Exception as e:
-            print(f"Error updating wallet: {e}")
-            import traceback
-            traceback.print_exc()
+            report_error("Error updating wallet", e)
+    
+    def refresh_portfolio(self, update_forms=False):
+        """Reload wallets, portfolio value and cost basis on the thread pool.
+        
+        A request made while a fetch is running is queued and started once
+        that fetch lands, so the last refresh always sees the latest data.
+        update_forms also refreshes the buy/sell/P2P form balances.
+        """
+        self.portfolio_forms_stale = self.portfolio_forms_stale or update_forms
+        if self.portfolio_fetch_pending:
+            self.portfolio_refresh_queued = True
+            return
+        self.portfolio_fetch_pending = True
+        self.run_in_background(
+            self.fetch_portfolio_data, self.apply_portfolio_data,
+            dict(self.current_prices), self.coin_data, self.last_tx_time, self.coin_data_generation,
+            on_failed=self.on_portfolio_fetch_failed
+        )
+    
+    def fetch_portfolio_data(self, prices, coin_data, last_tx_time, generation):
+        """Query everything the portfolio views need (runs on a worker thread).
+        
+        Only reads the database and its arguments; widgets and window
+        state are updated by apply_portfolio_data() on the main thread.
+        """
+        # Past transactions never change, so after the first cost-basis load
+        # only transactions newer than last_tx_time are folded in; today's
+        # P&L only needs the transactions since midnight UTC
+        full_load = coin_data is None or last_tx_time is None
+        today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        snapshot = self.db.get_portfolio_snapshot(
+            self.user_id, prices, since=None if full_load else last_tx_time, today_start=today_start
+        )
+        transactions = snapshot['transactions'] if full_load else snapshot['transactions_since']
+        if transactions is None:
+            # The snapshot query failed; on_portfolio_fetch_failed reports it
+            raise RuntimeError("Portfolio snapshot query failed")
+        if full_load:
+            coin_data, last_tx_time = self.fold_coin_data({}, None, transactions)
+        else:
+            coin_data, last_tx_time = self.fold_coin_data(coin_data, last_tx_time, transactions)
+        return {
+            'wallets': snapshot['wallets_by_currency'],
+            'portfolio': snapshot['portfolio_value'],
+            'transactions': snapshot['transactions_today'],
+            'coin_data': coin_data,
+            'last_tx_time': last_tx_time,
+            'generation': generation
+        }
+    
+    def apply_portfolio_data(self, data):
+        """Show fetched portfolio data (main thread)."""
+        self.portfolio_fetch_pending = False
+        
+        # Keep the cost basis unless it was invalidated while fetching; a
+        # stale one is neither stored nor drawn, and a fresh fetch follows
+        current = data['generation'] == self.coin_data_generation
+        if current:
+            self.coin_data = data['coin_data']
+            self.last_tx_time = data['last_tx_time']
+        else:
+            self.portfolio_refresh_queued = True
+        
+        self.wallets = data['wallets']
+        self.show_wallets()
+        if self.portfolio_forms_stale:
+            self.portfolio_forms_stale = False
+            self.on_buy_coin_changed()
+            self.on_sell_coin_changed()
+            self.update_p2p_offer_balance()
+        self.update_portfolio_value(data['portfolio'], data['transactions'], data['coin_data'] if current else None)
+        
+        if self.portfolio_refresh_queued:
+            self.portfolio_refresh_queued = False
+            self.refresh_portfolio()
+    
+    def on_portfolio_fetch_failed(self, error):
+        """Log a failed portfolio fetch and run any queued refresh."""
+        self.portfolio_fetch_pending = False
+        print(f"Error updating portfolio value: {error}")
+        # The fold may have failed part-way, so rebuild the cost basis from
+        # scratch on the next fetch
+        self.invalidate_cost_basis()
+        if self.portfolio_refresh_queued:
+            self.portfolio_refresh_queued = False
+            self.refresh_portfolio()
+    
+    def invalidate_cost_basis(self):
+        """Drop the per-coin totals so the next fetch reloads them in full.
+        
+        Bumping the generation keeps an in-flight fetch from storing
+        totals folded on top of the dropped ones.
+        """
+        self.coin_data = None
+        self.last_tx_time = None
+        self.coin_data_generation += 1
+    
+    def get_wallets(self):
+        """Return wallet rows keyed by currency, querying only when nothing is cached."""
+        if self.wallets is None:
+            self.wallets = self.db.get_wallets_map(self.user_id)
+        return self.wallets
+    
+    def get_wallet(self, currency):
+        """Return the cached wallet row for a currency."""
+        return self.get_wallets().get(currency)
     
     def update_balance_labels(self):
         """Update available balance labels in order forms."""
         try:
-            base, quote = self.current_pair.split('/')
+            base, quote = self.current_base, self.current_quote
             
             # Buy form shows quote currency balance (e.g., USDT)
-            quote_wallet = self.db.get_wallet_balance(self.user_id, quote)
+            quote_wallet = self.get_wallet(quote)
             if quote_wallet:
                 self.buy_balance_label.setText(f"Available: {float(quote_wallet['balance']):.2f} {quote}")
             
             # Sell form shows base currency balance (e.g., BTC)
-            base_wallet = self.db.get_wallet_balance(self.user_id, base)
+            base_wallet = self.get_wallet(base)
             if base_wallet:
                 self.sell_balance_label.setText(f"Available: {float(base_wallet['balance']):.8f} {base}")
                 
         except Exception as e:
             print(f"Error updating balance labels: {e}")
     
-    def update_portfolio_value(self):
-        """Calculate and display total portfolio value with P&L."""
+    def update_portfolio_value(self, portfolio, transactions, coin_data):
+        """Display total portfolio value with P&L from fetch_portfolio_data() results."""
         try:
-            from datetime import datetime, timedelta
-            
-            portfolio = self.db.get_portfolio_value(self.user_id, self.current_prices)
             total_value = portfolio['total_value']
             
             self.total_value_label.setText(f"${total_value:,.2f}")
@@ -1641,166 +1891,134 @@ class TradingWindow(QMainWindow):
             self.total_pnl_percent.setText(f"({total_pnl_percent:+.2f}%)")
             
             # Color code total P&L
-            if total_pnl > 0:
-                self.total_pnl_label.setStyleSheet("color: #0ECB81;")  # Green
-                self.total_pnl_percent.setStyleSheet("color: #0ECB81;")
-            elif total_pnl < 0:
-                self.total_pnl_label.setStyleSheet("color: #F6465D;")  # Red
-                self.total_pnl_percent.setStyleSheet("color: #F6465D;")
-            else:
-                self.total_pnl_label.setStyleSheet("color: #EAECEF;")  # White
-                self.total_pnl_percent.setStyleSheet("color: #848E9C;")  # Gray
+            set_pnl_style(self.total_pnl_label, self.total_pnl_percent, total_pnl)
             
             # Calculate today's P&L (based on transactions from today)
-            from datetime import timezone
             today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-            transactions = self.db.get_user_transactions(self.user_id, limit=1000)
             
-            # Calculate portfolio value at start of today
-            today_transactions = []
+            # One pass over today's transactions collects the P&L columns;
+            # they come newest first, so stop at the first one before today
+            columns = []  # (amount, price, fee, sign, current price) per transaction
             for tx in transactions:
-                tx_time = tx.get('created_at')
-                if isinstance(tx_time, str):
-                    from dateutil import parser
-                    tx_time = parser.parse(tx_time)
-                
-                # Make both timezone-aware for comparison
-                if tx_time.tzinfo is None:
-                    tx_time = tx_time.replace(tzinfo=timezone.utc)
-                
-                if tx_time >= today_start:
-                    today_transactions.append(tx)
-            
-            # Calculate value change from today's transactions
-            today_pnl = 0.0
-            for tx in today_transactions:
-                tx_type = tx.get('type', '').lower()
-                pair = tx.get('pair', '')
-                amount = float(tx.get('amount', 0))
+                tx_time = parse_timestamp(tx.get('created_at'))
+                if tx_time is None or tx_time < today_start:
+                    break
                 price = float(tx.get('price', 0))
-                fee = float(tx.get('fee', 0))
-                
-                if tx_type == 'buy':
-                    # Money spent (negative)
-                    today_pnl -= (amount * price + fee)
-                    # Current value of bought coins (positive)
-                    current_price = self.current_prices.get(pair, price)
-                    today_pnl += (amount * current_price)
-                elif tx_type == 'sell':
-                    # Money received (positive)
-                    today_pnl += (amount * price - fee)
-                    # Value of sold coins at current price (negative - what we lost)
-                    current_price = self.current_prices.get(pair, price)
-                    today_pnl -= (amount * current_price)
+                columns.append((
+                    float(tx.get('amount', 0)),
+                    price,
+                    float(tx.get('fee', 0)),
+                    TRADE_SIGNS.get(tx.get('type', '').lower(), 0),
+                    self.current_prices.get(tx.get('pair', ''), price)
+                ))
+            
+            # Value change from today's transactions: a buy gains
+            # (current - price) per coin, a sell loses it, and both pay
+            # their fee; other transaction types don't count
+            today_count = len(columns)
+            if today_count:
+                amounts, prices, fees, signs, current = np.array(columns, dtype=np.float64).T
+                today_pnl = float((signs * amounts * (current - prices) - np.abs(signs) * fees).sum())
+            else:
+                today_pnl = 0.0
             
             # Update today's P&L
-            if len(today_transactions) > 0:
+            if today_count > 0:
                 self.today_pnl_label.setText(f"${today_pnl:+,.2f}")
                 today_base = total_value - today_pnl if (total_value - today_pnl) > 0 else initial_balance
                 today_pnl_percent = (today_pnl / today_base) * 100 if today_base > 0 else 0
                 self.today_pnl_percent.setText(f"({today_pnl_percent:+.2f}%)")
                 
                 # Color code today's P&L
-                if today_pnl > 0:
-                    self.today_pnl_label.setStyleSheet("color: #0ECB81;")  # Green
-                    self.today_pnl_percent.setStyleSheet("color: #0ECB81;")
-                elif today_pnl < 0:
-                    self.today_pnl_label.setStyleSheet("color: #F6465D;")  # Red
-                    self.today_pnl_percent.setStyleSheet("color: #F6465D;")
-                else:
-                    self.today_pnl_label.setStyleSheet("color: #EAECEF;")
-                    self.today_pnl_percent.setStyleSheet("color: #848E9C;")
+                set_pnl_style(self.today_pnl_label, self.today_pnl_percent, today_pnl)
             else:
                 self.today_pnl_label.setText("$0.00")
                 self.today_pnl_percent.setText("(No trades today)")
-                self.today_pnl_label.setStyleSheet("color: #848E9C;")
-                self.today_pnl_percent.setStyleSheet("color: #848E9C;")
+                set_style(self.today_pnl_label, STYLE_MUTED)
+                set_style(self.today_pnl_percent, STYLE_MUTED)
             
-            # Update profit breakdown by coin
-            self.update_profit_breakdown()
+            # Update profit breakdown by coin (None: wait for the next fetch)
+            if coin_data is not None:
+                self.update_profit_breakdown(coin_data)
             
         except Exception as e:
-            print(f"Error updating portfolio value: {e}")
-            import traceback
-            traceback.print_exc()
+            report_error("Error updating portfolio value", e)
+    
+    def fold_coin_data(self, coin_data, last_tx_time, transactions):
+        """Return per-coin trade totals with transactions added, and the newest transaction time.
+        
+        The passed-in totals are copied, never modified.
+        """
+        coin_data = {currency: dict(data) for currency, data in coin_data.items()}
+        
+        # {currency: {'total_bought': amount, 'total_cost': usd, 'total_sold': amount, 'total_revenue': usd}}
+        
+        if transactions:
+            # Aggregate buys and sells per base coin in one groupby each
+            import pandas as pd
+            df = pd.DataFrame(transactions, columns=['type', 'pair', 'amount', 'price', 'fee'])
+            df = df[df['pair'].fillna('').str.contains('/', regex=False)]
+            amount = df['amount'].astype(float).fillna(0)
+            gross = amount * df['price'].astype(float).fillna(0)
+            fee = df['fee'].astype(float).fillna(0)
+            df = df.assign(
+                base=df['pair'].str.split('/').str[0],
+                type=df['type'].fillna('').str.lower(),
+                amount=amount,
+                cost=gross + fee,
+                revenue=gross - fee
+            )
+            buys = df[df['type'] == 'buy'].groupby('base')
+            sells = df[df['type'] == 'sell'].groupby('base')
+            totals = pd.DataFrame({
+                'total_bought': buys['amount'].sum(),
+                'total_cost': buys['cost'].sum(),
+                'total_sold': sells['amount'].sum(),
+                'total_revenue': sells['revenue'].sum()
+            }).fillna(0)
+            
+            # Fold into the running totals
+            for currency, values in totals.to_dict('index').items():
+                data = coin_data.setdefault(currency, {'total_bought': 0, 'total_cost': 0, 'total_sold': 0, 'total_revenue': 0})
+                for key, value in values.items():
+                    data[key] += float(value)
+        
+        # Remember the newest transaction so the next call only fetches later ones
+        tx_times = [tx['created_at'] for tx in transactions if tx.get('created_at')]
+        if tx_times:
+            last_tx_time = max(tx_times + ([last_tx_time] if last_tx_time else []))
+        
+        return coin_data, last_tx_time
     
-    def update_profit_breakdown(self):
+    def update_profit_breakdown(self, coin_data):
         """Update the profit breakdown table showing P&L for each coin."""
         try:
-            # Get all transactions to calculate cost basis
-            transactions = self.db.get_user_transactions(self.user_id, limit=1000)
-            
-            # Calculate cost basis for each coin
-            coin_data = {}  # {currency: {'total_bought': amount, 'total_cost': usd, 'total_sold': amount, 'total_revenue': usd}}
-            
-            for tx in transactions:
-                tx_type = tx.get('type', '').lower()
-                pair = tx.get('pair', '')
-                amount = float(tx.get('amount', 0))
-                price = float(tx.get('price', 0))
-                fee = float(tx.get('fee', 0))
-                
-                if '/' not in pair:
-                    continue
-                    
-                base_currency, quote_currency = pair.split('/')
-                
-                if tx_type == 'buy':
-                    # Buying base currency with quote currency
-                    if base_currency not in coin_data:
-                        coin_data[base_currency] = {'total_bought': 0, 'total_cost': 0, 'total_sold': 0, 'total_revenue': 0}
-                    coin_data[base_currency]['total_bought'] += amount
-                    coin_data[base_currency]['total_cost'] += (amount * price + fee)
-                    
-                elif tx_type == 'sell':
-                    # Selling base currency for quote currency
-                    if base_currency not in coin_data:
-                        coin_data[base_currency] = {'total_bought': 0, 'total_cost': 0, 'total_sold': 0, 'total_revenue': 0}
-                    coin_data[base_currency]['total_sold'] += amount
-                    coin_data[base_currency]['total_revenue'] += (amount * price - fee)
-            
             # Get current wallet balances
-            wallets = self.db.get_all_wallets(self.user_id)
-            
-            # Clear and populate table
-            self.profit_breakdown_table.setRowCount(0)
+            wallets = self.get_wallets().values()
             
+            # Skip coins with a zero balance and no trading history
+            holdings = []
             for wallet in wallets:
-                currency = wallet['currency']
                 balance = float(wallet['balance'])
-                
-                # Skip if balance is 0 and no trading history
-                if balance == 0 and currency not in coin_data:
-                    continue
-                
-                row = self.profit_breakdown_table.rowCount()
-                self.profit_breakdown_table.insertRow(row)
-                
-                # Coin name with icon
-                coin_item = QTableWidgetItem(currency)
-                coin_item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-                icon_path = self.get_icon_path(f"{currency.lower()}.png")
-                if os.path.exists(icon_path):
-                    coin_item.setIcon(QIcon(icon_path))
-                self.profit_breakdown_table.setItem(row, 0, coin_item)
-                
-                # Holdings
-                holdings_item = QTableWidgetItem(f"{balance:.8f}")
-                holdings_item.setFont(QFont("Segoe UI", 10))
-                self.profit_breakdown_table.setItem(row, 1, holdings_item)
-                
-                # Current value
-                if currency == 'USDT':
-                    current_value = balance
-                else:
-                    pair = f"{currency}/USDT"
-                    current_price = self.current_prices.get(pair, 0)
-                    current_value = balance * current_price
-                
-                value_item = QTableWidgetItem(f"${current_value:,.2f}")
-                value_item.setFont(QFont("Segoe UI", 10))
-                value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.profit_breakdown_table.setItem(row, 2, value_item)
+                if balance != 0 or wallet['currency'] in coin_data:
+                    holdings.append((wallet['currency'], balance))
+            
+            # Nothing to redraw if balances, prices and trade totals are unchanged
+            prices = tuple(self.current_prices.get(f"{currency}/USDT") for currency, _ in holdings)
+            breakdown_key = (
+                tuple(holdings),
+                prices,
+                tuple(sorted((currency, tuple(data.values())) for currency, data in coin_data.items()))
+            )
+            if breakdown_key == self.last_breakdown_key:
+                return
+            self.last_breakdown_key = breakdown_key
+            
+            rows = []
+            for row_index, (currency, balance) in enumerate(holdings):
+                # Current value (one lookup, shared with the change check above)
+                current_price = 1.0 if currency == 'USDT' else prices[row_index] or 0
+                current_value = balance * current_price
                 
                 # Cost basis and P&L
                 if currency in coin_data:
@@ -1828,87 +2046,104 @@ class TradingWindow(QMainWindow):
                     
                     # Total P&L = realized + unrealized
                     total_coin_pnl = realized_pnl + unrealized_pnl
-                    
+                
                 else:
                     # No trading history (probably USDT from initial balance)
                     cost_basis = current_value
                     total_coin_pnl = 0
                 
-                # Cost basis
-                cost_item = QTableWidgetItem(f"${cost_basis:,.2f}")
-                cost_item.setFont(QFont("Segoe UI", 10))
-                cost_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.profit_breakdown_table.setItem(row, 3, cost_item)
-                
-                # P&L with color coding
-                pnl_text = f"${total_coin_pnl:+,.2f}"
-                pnl_item = QTableWidgetItem(pnl_text)
-                pnl_item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-                pnl_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                
                 if total_coin_pnl > 0:
-                    pnl_item.setForeground(QColor("#0ECB81"))  # Green
+                    pnl_color = COLOR_BUY  # Green
                 elif total_coin_pnl < 0:
-                    pnl_item.setForeground(QColor("#F6465D"))  # Red
+                    pnl_color = COLOR_SELL  # Red
                 else:
-                    pnl_item.setForeground(QColor("#848E9C"))  # Gray
+                    pnl_color = COLOR_MUTED  # Gray
+                
+                rows.append((currency, (
+                    f"{balance:.8f}",
+                    f"${current_value:,.2f}",
+                    f"${cost_basis:,.2f}",
+                    f"${total_coin_pnl:+,.2f}"
+                ), pnl_color))
+            
+            table = self.profit_breakdown_table
+            currencies = [currency for currency, _, _ in rows]
+            
+            # Same coins in the same order: update the existing items in place
+            if currencies == self.breakdown_currencies:
+                for row, (_, texts, pnl_color) in enumerate(rows):
+                    for column, text in enumerate(texts, start=1):
+                        item = table.item(row, column)
+                        if item.text() != text:
+                            item.setText(text)
+                    table.item(row, 4).setForeground(pnl_color)
+                return
+            self.breakdown_currencies = currencies
+            
+            # Size the table once and fill it with repaints suspended
+            table.setUpdatesEnabled(False)
+            try:
+                table.setRowCount(len(rows))
                 
-                self.profit_breakdown_table.setItem(row, 4, pnl_item)
+                for row, (currency, texts, pnl_color) in enumerate(rows):
+                    holdings_text, value_text, cost_text, pnl_text = texts
+                    
+                    # Coin name with icon
+                    coin_item = QTableWidgetItem(currency)
+                    coin_item.setFont(FONT_LABEL_BOLD)
+                    icon = self.coin_icons.get(currency)
+                    if icon:
+                        coin_item.setIcon(icon)
+                    table.setItem(row, 0, coin_item)
+                    
+                    # Holdings
+                    holdings_item = QTableWidgetItem(holdings_text)
+                    holdings_item.setFont(FONT_SMALL)
+                    table.setItem(row, 1, holdings_item)
+                    
+                    # Current value
+                    value_item = QTableWidgetItem(value_text)
+                    value_item.setFont(FONT_SMALL)
+                    value_item.setTextAlignment(RIGHT_ALIGN)
+                    table.setItem(row, 2, value_item)
+                    
+                    # Cost basis
+                    cost_item = QTableWidgetItem(cost_text)
+                    cost_item.setFont(FONT_SMALL)
+                    cost_item.setTextAlignment(RIGHT_ALIGN)
+                    table.setItem(row, 3, cost_item)
+                    
+                    # P&L with color coding
+                    pnl_item = QTableWidgetItem(pnl_text)
+                    pnl_item.setFont(FONT_LABEL_BOLD)
+                    pnl_item.setTextAlignment(RIGHT_ALIGN)
+                    pnl_item.setForeground(pnl_color)
+                    table.setItem(row, 4, pnl_item)
+            finally:
+                table.setUpdatesEnabled(True)
         
         except Exception as e:
-            print(f"Error updating profit breakdown: {e}")
-            import traceback
-            traceback.print_exc()
+            report_error("Error updating profit breakdown", e)
     
     def update_order_history(self):
-        """Update order history tables."""
-        try:
-            # Get transactions
-            transactions = self.db.get_user_transactions(self.user_id, limit=50)
-            self.populate_transaction_table(self.trade_history_table, transactions)
-            
-            # Update P2P offers
-            self.refresh_p2p_offers()
-            
-        except Exception as e:
-            print(f"Error updating order history: {e}")
-    
-    def populate_history_table(self, table, orders):
-        """Populate a history table with orders."""
-        table.setRowCount(0)
-        
-        for order in orders:
-            row = table.rowCount()
-            table.insertRow(row)
-            
-            # Parse timestamp
-            timestamp = order.get('timestamp', '')[:19] if order.get('timestamp') else ''
-            
-            table.setItem(row, 0, QTableWidgetItem(timestamp))
-            table.setItem(row, 1, QTableWidgetItem(order.get('pair', '')))
-            table.setItem(row, 2, QTableWidgetItem(order.get('type', '')))
-            table.setItem(row, 3, QTableWidgetItem(order.get('side', '')))
-            table.setItem(row, 4, QTableWidgetItem(f"${float(order.get('price', 0)):,.2f}"))
-            table.setItem(row, 5, QTableWidgetItem(f"{float(order.get('amount', 0)):.8f}"))
-            table.setItem(row, 6, QTableWidgetItem(order.get('status', '')))
+        """Update the trade history table in the background."""
+        self.run_in_background(partial(self.db.get_user_transactions, self.user_id, limit=50),
+                               partial(self.populate_transaction_table, self.trade_history_table),
+                               on_failed=partial(self.on_refresh_failed, "order history"))
     
     def populate_transaction_table(self, table, transactions):
         """Populate a history table with transactions."""
-        table.setRowCount(0)
+        table.model().set_rows(transactions)
+    
+    def get_tick_price(self, pair):
+        """Return the pair price from the last price tick (0 if unknown).
         
-        for tx in transactions:
-            row = table.rowCount()
-            table.insertRow(row)
-            
-            timestamp = tx.get('timestamp', '')[:19] if tx.get('timestamp') else ''
-            
-            table.setItem(row, 0, QTableWidgetItem(timestamp))
-            table.setItem(row, 1, QTableWidgetItem(tx.get('pair', '')))
-            table.setItem(row, 2, QTableWidgetItem('market'))
-            table.setItem(row, 3, QTableWidgetItem(tx.get('type', '')))
-            table.setItem(row, 4, QTableWidgetItem(f"${float(tx.get('price', 0)):,.2f}"))
-            table.setItem(row, 5, QTableWidgetItem(f"{float(tx.get('amount', 0)):.8f}"))
-            table.setItem(row, 6, QTableWidgetItem('filled'))
+        Falls back to the price service until the first tick has landed.
+        """
+        price = self.current_prices.get(pair)
+        if price is None:
+            price = self.price_service.get_pair_price(pair)
+        return price or 0
     
     def calculate_buy_total(self):
         """Calculate total USDT needed for buy order."""
@@ -1919,10 +2154,7 @@ class TradingWindow(QMainWindow):
                 return
             
             amount = float(amount_text)
-            coin = self.buy_coin_combo.currentText()
-            pair = f"{coin}/USDT"
-            
-            price = self.price_service.get_pair_price(pair) or 0
+            price = self.get_tick_price(self.buy_pair)
             total = amount * price
             
             self.buy_total_label.setText(f"{total:.2f} USDT")
@@ -1939,10 +2171,7 @@ class TradingWindow(QMainWindow):
                 return
             
             amount = float(amount_text)
-            coin = self.sell_coin_combo.currentText()
-            pair = f"{coin}/USDT"
-            
-            price = self.price_service.get_pair_price(pair) or 0
+            price = self.get_tick_price(self.sell_pair)
             total = amount * price
             
             self.sell_total_label.setText(f"{total:.2f} USDT")
@@ -1953,17 +2182,17 @@ class TradingWindow(QMainWindow):
     def on_buy_coin_changed(self):
         """Handle buy coin selection change."""
         coin = self.buy_coin_combo.currentText()
-        pair = f"{coin}/USDT"
+        self.buy_pair = pair = f"{coin}/USDT"
         
         # Update button text
         self.buy_submit_btn.setText(f"BUY {coin}")
         
         # Update price display
-        price = self.price_service.get_pair_price(pair) or 0
+        price = self.get_tick_price(pair)
         self.buy_price_display.setText(f"Price: ${price:,.8f}")
         
         # Update USDT balance
-        usdt_wallet = self.db.get_wallet_balance(self.user_id, 'USDT')
+        usdt_wallet = self.get_wallet('USDT')
         if usdt_wallet:
             self.buy_balance_label.setText(f"Available: {float(usdt_wallet['balance']):.2f} USDT")
         
@@ -1973,17 +2202,17 @@ class TradingWindow(QMainWindow):
     def on_sell_coin_changed(self):
         """Handle sell coin selection change."""
         coin = self.sell_coin_combo.currentText()
-        pair = f"{coin}/USDT"
+        self.sell_pair = pair = f"{coin}/USDT"
         
         # Update button text
         self.sell_submit_btn.setText(f"SELL {coin}")
         
         # Update price display
-        price = self.price_service.get_pair_price(pair) or 0
+        price = self.get_tick_price(pair)
         self.sell_price_display.setText(f"Price: ${price:,.8f}")
         
         # Update coin balance (old label - keep for compatibility)
-        coin_wallet = self.db.get_wallet_balance(self.user_id, coin)
+        coin_wallet = self.get_wallet(coin)
         coin_balance = 0.0
         if coin_wallet:
             coin_balance = float(coin_wallet['balance'])
@@ -2004,7 +2233,7 @@ class TradingWindow(QMainWindow):
         coin = self.offer_currency_combo.currentText()
         
         # Get coin balance
-        coin_wallet = self.db.get_wallet_balance(self.user_id, coin)
+        coin_wallet = self.get_wallet(coin)
         coin_balance = 0.0
         if coin_wallet:
             coin_balance = float(coin_wallet['balance'])
@@ -2129,36 +2358,43 @@ class TradingWindow(QMainWindow):
             styled_dialogs.show_error(self, "Error", f"An error occurred: {str(e)}")
     
     def force_refresh_all(self):
-        """Force refresh all displays after trading."""
-        print("🔄 Refreshing all displays...")
-        try:
-            # Update wallet and balances
-            self.update_wallet_display()
-            
-            # Update portfolio value and profit breakdown
-            self.update_portfolio_value()
-            
-            # Update order history
-            self.update_order_history()
-            
-            # Update form balances
-            self.on_buy_coin_changed()
-            self.on_sell_coin_changed()
-            
-            # Update P2P balance
-            self.update_p2p_offer_balance()
-            
-            # Refresh P2P offers
-            self.refresh_p2p_offers()
-            
-            # Refresh transaction history
-            self.refresh_transaction_history()
-            
-            print("✅ All displays refreshed!")
-        except Exception as e:
-            print(f"⚠️ Error during refresh: {e}")
-            import traceback
-            traceback.print_exc()
+        """Force refresh all displays after trading.
+        
+        Calls within REFRESH_DELAY_MS (e.g. several quick trades) collapse
+        into a single refresh_all().
+        """
+        # The cost basis is kept: the next portfolio fetch folds in the
+        # trade's transactions through the last_tx_time cursor
+        if self.refresh_pending:
+            return
+        self.refresh_pending = True
+        QTimer.singleShot(REFRESH_DELAY_MS, self.refresh_all)
+    
+    def refresh_all(self):
+        """Refresh wallets, portfolio, history and P2P displays."""
+        self.refresh_pending = False
+        # Each refresh queries on the thread pool and fills its views when
+        # its result lands, so the queries overlap instead of running back
+        # to back on the GUI thread
+        
+        # Update wallets, portfolio value, profit breakdown and form balances
+        self.refresh_portfolio(update_forms=True)
+        
+        # Order history, P2P offers and transaction history: reload the
+        # visible tab now, the rest when they are next shown
+        current_tab = self.main_tabs.currentWidget()
+        for tab, refresh in self.tab_refreshers.items():
+            if tab is current_tab:
+                refresh()
+            else:
+                self.stale_tabs.add(tab)
+    
+    def on_main_tab_changed(self, index):
+        """Reload a tab that went stale while it was hidden."""
+        tab = self.main_tabs.widget(index)
+        if tab in self.stale_tabs:
+            self.stale_tabs.discard(tab)
+            self.tab_refreshers[tab]()
     
     def calculate_total(self, side):
         """Legacy method - redirects to new methods."""
@@ -2174,19 +2410,26 @@ class TradingWindow(QMainWindow):
         else:
             self.execute_sell()
     
+    def set_current_pair(self, pair):
+        """Select the header/chart pair and cache its base and quote symbols."""
+        self.current_pair = pair
+        self.current_base, self.current_quote = pair.split('/')
+    
     def on_pair_selected(self, row, col):
         """Handle market pair selection."""
-        pair = self.market_table.item(row, 0).text()
-        self.current_pair = pair
+        if row >= len(self.market_pairs):
+            return
+        pair = self.market_pairs[row]
+        if pair == self.current_pair:
+            return
+        self.set_current_pair(pair)
         self.header_pair_label.setText(pair)
         
-        # Update chart for new pair
-        self.update_chart()
+        # Update chart for new pair once the selection settles
+        self.chart_timer.start()
     
     def logout(self):
         """Handle logout."""
-        from auth.google_auth import GoogleAuthManager
-        
         if styled_dialogs.show_question(
             self,
             "Logout",
@@ -2198,16 +2441,26 @@ class TradingWindow(QMainWindow):
             # Close this window and show login
             self.close()
             
-            from ui.login_window import LoginWindow
             self.login_window = LoginWindow()
             self.login_window.show()
     
     def claim_daily_bonus(self):
         """Claim daily login bonus."""
+        # Answer repeat clicks during the cooldown without a database round trip
+        seconds_remaining = self.bonus_available_at - time.monotonic()
+        if seconds_remaining > 0:
+            styled_dialogs.show_info(
+                self,
+                "Daily Bonus",
+                f"Bonus already claimed. Next bonus in {seconds_remaining / 3600:.1f} hours"
+            )
+            return
+        
         try:
             result = self.db.claim_daily_bonus(self.user_id)
             
             if result['success']:
+                self.bonus_available_at = time.monotonic() + DAILY_BONUS_COOLDOWN
                 styled_dialogs.show_success(
                     self,
                     "Daily Bonus Claimed! 🎉",
@@ -2216,6 +2469,8 @@ class TradingWindow(QMainWindow):
                 # Refresh wallet display
                 self.update_wallet_display()
             else:
+                if result.get('hours_remaining'):
+                    self.bonus_available_at = time.monotonic() + result['hours_remaining'] * 3600
                 styled_dialogs.show_info(
                     self,
                     "Daily Bonus",
@@ -2233,740 +2488,745 @@ class TradingWindow(QMainWindow):
         except Exception as e:
             styled_dialogs.show_error(self, "Error", f"Failed to open leaderboard: {e}")
     
-    def get_icon_path(self, icon_name):
-        """Get the absolute path to an icon file."""
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        icon_path = os.path.join(current_dir, 'assets', 'icons', icon_name)
-        return os.path.abspath(icon_path)
-    
-    def get_stylesheet(self):
-        """Return Binance-style dark theme stylesheet matching official design."""
-        return """
-            /* Main Window - Dark Background */
-            QMainWindow {
-                background-color: #0B0E11;
-            }
-            
-            /* Header - Top Navigation Bar */
-            #header {
-                background-color: #181A20;
-                border-bottom: 1px solid #2B3139;
-            }
-            
-            #logo {
-                color: #F0B90B;
-                font-weight: 700;
-            }
-            
-            #navButton {
-                background-color: transparent;
-                color: #848E9C;
-                border: none;
-                padding: 8px 12px;
-                font-size: 13px;
-                font-weight: 500;
-            }
-            
-            #navButton:hover {
-                color: #EAECEF;
-            }
-            
-            #headerPairLabel {
-                color: #EAECEF;
-                font-weight: 600;
-            }
-            
-            #headerPriceLabel {
-                color: #0ECB81;
-                font-weight: 700;
-            }
-            
-            #currentPair {
-                color: #EAECEF;
-                font-weight: 600;
-            }
-            
-            #userLabel {
-                color: #848E9C;
-                font-size: 11px;
-            }
-            
-            #depositButton {
-                background-color: #F0B90B;
-                color: #181A20;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            
-            #depositButton:hover {
-                background-color: #F8D12F;
-            }
-            
-            #bonusButton {
-                background-color: #0ECB81;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            
-            #bonusButton:hover {
-                background-color: #2EE5A0;
-            }
-            
-            #leaderboardButton {
-                background-color: #2B3139;
-                color: #F0B90B;
-                border: 1px solid #F0B90B;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            
-            #leaderboardButton:hover {
-                background-color: #F0B90B;
-                color: #181A20;
-            }
-            
-            #logoutButton {
-                background-color: #2B3139;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-                padding: 6px 14px;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            
-            #logoutButton:hover {
-                background-color: #F0B90B;
-                color: #181A20;
-                border: 1px solid #F0B90B;
-            }
-            
-            /* Main Tabs - Market, Trading, P2P */
-            #mainTabs {
-                background-color: #0B0E11;
-                border: none;
-            }
-            
-            #mainTabs::pane {
-                background-color: #0B0E11;
-                border: none;
-                border-top: 1px solid #2B3139;
-            }
-            
-            #mainTabs::tab-bar {
-                background-color: #181A20;
-                border-bottom: 1px solid #2B3139;
-            }
-            
-            #mainTabs QTabBar::tab {
-                background-color: #181A20;
-                color: #848E9C;
-                border: none;
-                border-bottom: 2px solid transparent;
-                padding: 12px 24px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 120px;
-            }
-            
-            #mainTabs QTabBar::tab:hover {
-                color: #EAECEF;
-                background-color: #1E2329;
-            }
-            
-            #mainTabs QTabBar::tab:selected {
-                color: #F0B90B;
-                border-bottom: 2px solid #F0B90B;
-                background-color: #0B0E11;
-            }
-            
-            /* Side Panels - Market List & Portfolio */
-            #marketPanel, #infoPanel {
-                background-color: #181A20;
-                border: none;
-                border-right: 1px solid #2B3139;
-            }
-            
-            /* Chart Panel */
-            #chartPanel {
-                background-color: #0B0E11;
-                border: none;
-            }
-            
-            /* Trading Panel - Center Chart Area */
-            #tradingPanel {
-                background-color: #0B0E11;
-                border: none;
-            }
-            
-            /* History Panel - Bottom Orders */
-            #historyPanel {
-                background-color: #181A20;
-                border-top: 1px solid #2B3139;
-            }
-            
-            #panelTitle {
-                color: #EAECEF;
-                padding: 8px 0px;
-                font-weight: 600;
-            }
-            
-            /* Price Display at Top of Chart */
-            #priceDisplay {
-                background-color: transparent;
-                border: none;
-                padding: 10px 0px;
-            }
-            
-            #priceLabel {
-                color: #707A8A;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            
-            #priceValue {
-                color: #EAECEF;
-                font-size: 20px;
-                font-weight: 600;
-            }
-            
-            #changeValue {
-                color: #0ECB81;
-                font-size: 13px;
-                font-weight: 600;
-            }
-            
-            /* Chart Controls - Time Interval Buttons */
-            #chartControls {
-                background-color: transparent;
-                border: none;
-                padding: 5px 0px;
-            }
-            
-            #intervalLabel {
-                color: #707A8A;
-                font-size: 12px;
-                padding: 0px 8px;
-                font-weight: 500;
-            }
-            
-            #intervalButton {
-                background-color: transparent;
-                color: #707A8A;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 12px;
-                font-weight: 500;
-                min-width: 32px;
-            }
-            
-            #intervalButton:hover {
-                background-color: #2B3139;
-                color: #EAECEF;
-            }
-            
-            #intervalButton:checked {
-                background-color: transparent;
-                color: #F0B90B;
-                border: none;
-                font-weight: 600;
-            }
-            
-            /* Buy & Sell Forms - Trading Panels */
-            #buyForm, #sellForm {
-                background-color: #181A20;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-            }
-            
-            #buyTitle {
-                color: #0ECB81;
-                font-size: 16px;
-                font-weight: 700;
-                padding: 10px 0px;
-            }
-            
-            #sellTitle {
-                color: #F6465D;
-                font-size: 16px;
-                font-weight: 700;
-                padding: 10px 0px;
-            }
-            
-            /* Labels - General Text */
-            QLabel {
-                color: #EAECEF;
-                font-size: 12px;
-            }
-            
-            /* Input Fields */
-            QLineEdit {
-                background-color: #1E2329;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-                padding: 10px 12px;
-                font-size: 13px;
-                selection-background-color: #F0B90B;
-            }
-            
-            QLineEdit:hover {
-                border: 1px solid #474D57;
-            }
-            
-            QLineEdit:focus {
-                border: 1px solid #F0B90B;
-                background-color: #1E2329;
-            }
-            
-            QLineEdit::placeholder {
-                color: #5E6673;
-            }
-            
-            /* Combo Box - Dropdowns */
-            QComboBox {
-                background-color: #1E2329;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 13px;
-            }
-            
-            QComboBox:hover {
-                border: 1px solid #474D57;
-            }
-            
-            QComboBox:focus {
-                border: 1px solid #F0B90B;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid #707A8A;
-                margin-right: 8px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #1E2329;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                selection-background-color: #2B3139;
-                selection-color: #F0B90B;
-                outline: none;
-            }
-            
-            /* Coin Combo - Special styling for coin selector */
-            #coinCombo {
-                background-color: #1E2329;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-                padding: 10px 12px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            
-            #coinCombo:hover {
-                border: 1px solid #F0B90B;
-            }
-            
-            #coinCombo QAbstractItemView {
-                background-color: #1E2329;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                selection-background-color: #2B3139;
-                selection-color: #F0B90B;
-                outline: none;
-                padding: 8px;
-            }
-            
-            #coinCombo QAbstractItemView::item {
-                padding: 8px;
-                min-height: 30px;
-            }
-            
-            /* Price Display */
-            #priceDisplay {
-                color: #848E9C;
-                background-color: transparent;
-            }
-            
-            /* Buy Button - Green */
-            #buyButton {
-                background-color: #0ECB81;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 4px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 12px;
-            }
-            
-            #buyButton:hover {
-                background-color: #2EE5A0;
-            }
-            
-            #buyButton:pressed {
-                background-color: #0AA66E;
-            }
-            
-            /* Sell Button - Red */
-            #sellButton {
-                background-color: #F6465D;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 4px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 12px;
-            }
-            
-            #sellButton:hover {
-                background-color: #FF6479;
-            }
-            
-            #sellButton:pressed {
-                background-color: #D93A50;
-            }
-            
-            /* Tables - Market List, Order History */
-            QTableWidget {
-                background-color: transparent;
-                color: #EAECEF;
-                gridline-color: #2B3139;
-                border: none;
-                font-size: 12px;
-            }
-            
-            QTableWidget::item {
-                padding: 8px 6px;
-                border-bottom: 1px solid #2B3139;
-            }
-            
-            QTableWidget::item:selected {
-                background-color: #2B3139;
-                color: #EAECEF;
-            }
-            
-            QTableWidget::item:hover {
-                background-color: #1E2329;
-            }
-            
-            QHeaderView::section {
-                background-color: #181A20;
-                color: #707A8A;
-                padding: 10px 6px;
-                border: none;
-                border-bottom: 1px solid #2B3139;
-                font-weight: 600;
-                font-size: 11px;
-                text-transform: uppercase;
-            }
-            
-            /* Tabs - Order History Tabs */
-            QTabWidget::pane {
-                border: none;
-                background-color: transparent;
-                border-top: 1px solid #2B3139;
-            }
-            
-            QTabBar::tab {
-                background-color: transparent;
-                color: #707A8A;
-                padding: 10px 20px;
-                border: none;
-                font-size: 13px;
-                font-weight: 500;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: transparent;
-                color: #F0B90B;
-                border-bottom: 2px solid #F0B90B;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                color: #EAECEF;
-            }
-            
-            /* Special Labels */
-            #totalValue {
-                color: #F0B90B;
-                font-weight: 700;
-            }
-            
-            #balanceLabel {
-                color: #707A8A;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            
-            /* Scrollbars */
-            QScrollBar:vertical {
-                background-color: transparent;
-                width: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #2B3139;
-                border-radius: 3px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #474D57;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            
-            QScrollBar:horizontal {
-                background-color: transparent;
-                height: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:horizontal {
-                background-color: #2B3139;
-                border-radius: 3px;
-                min-width: 30px;
-            }
-            
-            QScrollBar::handle:horizontal:hover {
-                background-color: #474D57;
-            }
-            
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            
-            /* P2P Trading Styles */
-            #p2pCreatePanel {
-                background-color: #181A20;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-            }
-            
-            #p2pCombo {
-                background-color: #1E2329;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                border-radius: 3px;
-                padding: 6px;
-                font-size: 11px;
-            }
-            
-            #p2pInput {
-                background-color: #1E2329;
-                color: #EAECEF;
-                border: 1px solid #2B3139;
-                border-radius: 3px;
-                padding: 6px;
-                font-size: 11px;
-            }
-            
-            #createOfferButton {
-                background-color: #F0B90B;
-                color: #181A20;
-                border: none;
-                border-radius: 3px;
-                font-weight: 600;
-                font-size: 12px;
-                padding: 8px;
-            }
-            
-            #createOfferButton:hover {
-                background-color: #F8D12F;
-            }
-            
-            #p2pOffersTable {
-                background-color: transparent;
-                color: #EAECEF;
-                gridline-color: #2B3139;
-                border: none;
-                font-size: 11px;
-            }
-            
-            #p2pOffersTable::item {
-                padding: 4px;
-            }
-            
-            #p2pOffersTabs {
-                background-color: transparent;
-            }
-            
-            #p2pOffersTabs::pane {
-                border: none;
-                background-color: transparent;
-            }
-            
-            #p2pOffersTabs QTabBar::tab {
-                background-color: transparent;
-                color: #707A8A;
-                padding: 8px 16px;
-                border: none;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            
-            #p2pOffersTabs QTabBar::tab:selected {
-                background-color: transparent;
-                color: #F0B90B;
-                border-bottom: 2px solid #F0B90B;
-            }
-            
-            #acceptOfferButton {
-                background-color: #0ECB81;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 3px;
-                font-weight: 600;
-                font-size: 10px;
-                padding: 5px 10px;
-                min-width: 70px;
-            }
-            
-            #acceptOfferButton:hover {
-                background-color: #2EE5A0;
-            }
-            
-            #cancelOfferButton {
-                background-color: #F6465D;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 3px;
-                font-weight: 600;
-                font-size: 10px;
-                padding: 5px 10px;
-                min-width: 70px;
-            }
-            
-            #cancelOfferButton:hover {
-                background-color: #FF6479;
-            }
-            
-            /* Portfolio Tab Styles */
-            #portfolioTitle {
-                color: #F0B90B;
-                font-size: 24px;
-                font-weight: 700;
-            }
-            
-            #portfolioValueCard {
-                background-color: #1E2329;
-                border: 1px solid #2B3139;
-                border-radius: 8px;
-            }
-            
-            #valueTitle {
-                color: #848E9C;
-                font-size: 12px;
-            }
-            
-            #totalValue {
-                color: #0ECB81;
-                font-size: 32px;
-                font-weight: 700;
-            }
-            
-            #assetsTitle {
-                color: #EAECEF;
-                font-size: 16px;
-                font-weight: 600;
-            }
-            
-            #portfolioWalletTable {
-                background-color: #1E2329;
-                color: #EAECEF;
-                gridline-color: #2B3139;
-                border: 1px solid #2B3139;
-                border-radius: 4px;
-                font-size: 13px;
-            }
-            
-            #portfolioWalletTable::item {
-                padding: 12px;
-                border-bottom: 1px solid #2B3139;
-            }
-            
-            #portfolioWalletTable QHeaderView::section {
-                background-color: #181A20;
-                color: #848E9C;
-                border: none;
-                border-bottom: 1px solid #2B3139;
-                padding: 12px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            
-            #refreshButton {
-                background-color: #2B3139;
-                color: #EAECEF;
-                border: 1px solid #474D57;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            
-            #refreshButton:hover {
-                background-color: #474D57;
-                border: 1px solid #F0B90B;
-                color: #F0B90B;
-            }
-        """
+    def run_in_background(self, fn, on_finished, *args, on_failed=None):
+        """Run fn(*args) on the thread pool and pass its result to on_finished."""
+        worker = Worker(fn, *args)
+        worker.signals.finished.connect(on_finished)
+        if on_failed:
+            worker.signals.failed.connect(on_failed)
+        # Keep a reference so the signals object outlives the runnable
+        self.workers.add(worker)
+        worker.signals.finished.connect(lambda _result: self.workers.discard(worker))
+        worker.signals.failed.connect(lambda _error: self.workers.discard(worker))
+        QThreadPool.globalInstance().start(worker)
+        return worker
     
     def check_for_updates(self):
-        """Check for app updates from GitHub."""
+        """Check for app updates from GitHub in the background (once per day)."""
+        try:
+            with open(UPDATE_CHECK_FILE, 'r') as f:
+                last_checked = json.load(f).get('last_checked', 0)
+            if time.time() - last_checked < UPDATE_CHECK_INTERVAL:
+                print("Update check skipped (checked within the last 24h)")
+                return
+        except (OSError, ValueError):
+            pass  # No record yet - check now
+        
+        self.run_in_background(UpdateChecker.check_for_updates, self.on_update_check_finished)
+    
+    def on_update_check_finished(self, result):
+        """Handle the update check result on the main thread."""
         try:
-            result = UpdateChecker.check_for_updates()
-            
             if result.get('error'):
                 # Silent fail - don't bother user with network errors
                 print(f"Update check failed: {result['error']}")
                 return
             
+            try:
+                os.makedirs(os.path.dirname(UPDATE_CHECK_FILE), exist_ok=True)
+                with open(UPDATE_CHECK_FILE, 'w') as f:
+                    json.dump({'last_checked': time.time()}, f)
+            except OSError as e:
+                print(f"Could not save update check time: {e}")
+            
             if result.get('update_available'):
                 # Show update notification
-                message = f"""New version available!
-
-Current version: v{result['current_version']}
-Latest version: v{result['latest_version']}
-
-{result.get('release_name', 'New Release')}
-
-Would you like to download the update?"""
+                message = UPDATE_MESSAGE.format(
+                    current=result['current_version'],
+                    latest=result['latest_version'],
+                    name=result.get('release_name', 'New Release')
+                )
                 
                 if styled_dialogs.show_question(self, "Update Available 🚀", message):
                     # Open download URL in browser
-                    import webbrowser
                     webbrowser.open(result['download_url'])
             else:
                 print(f"App is up to date (v{result['current_version']})")
                 
         except Exception as e:
             print(f"Error checking for updates: {e}")
+
+
+def compact_qss(qss):
+    """Strip comments and indentation so Qt tokenizes a smaller stylesheet."""
+    return re.sub(r'\s+', ' ', re.sub(r'/\*.*?\*/', '', qss, flags=re.S)).strip()
+
+
+def scope_qss(qss, scope):
+    """Prefix every selector with a widget class so app-level rules stay inside it.
+    
+    The class's own rule (QMainWindow in the original sheet) becomes the
+    bare scope selector.
+    """
+    def scope_rule(match):
+        selectors = (selector.strip() for selector in match.group(1).split(','))
+        return ', '.join(scope if selector == 'QMainWindow' else f"{scope} {selector}"
+                         for selector in selectors) + ' {'
+    return re.sub(r'([^{}]+)\{', scope_rule, qss)
+
+
+def install_stylesheet():
+    """Append the trading window theme to the application stylesheet (once per process).
+    
+    Qt then parses and caches the rules once for every TradingWindow
+    instead of re-polishing each window against its own copy.
+    """
+    global _stylesheet_installed
+    if _stylesheet_installed:
+        return
+    app = QApplication.instance()
+    app.setStyleSheet(app.styleSheet() + ' ' + _TRADING_WINDOW_QSS)
+    _stylesheet_installed = True
+
+
+# Whether install_stylesheet() has run
+_stylesheet_installed = False
+
+# Built once at import and scoped to TradingWindow for the application stylesheet
+_TRADING_WINDOW_QSS = scope_qss(compact_qss("""
+    /* Main Window - Dark Background */
+    QMainWindow {
+        background-color: #0B0E11;
+    }
+    
+    /* Header - Top Navigation Bar */
+    #header {
+        background-color: #181A20;
+        border-bottom: 1px solid #2B3139;
+    }
+    
+    #logo {
+        color: #F0B90B;
+        font-weight: 700;
+    }
+    
+    #navButton {
+        background-color: transparent;
+        color: #848E9C;
+        border: none;
+        padding: 8px 12px;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    
+    #navButton:hover {
+        color: #EAECEF;
+    }
+    
+    #headerPairLabel {
+        color: #EAECEF;
+        font-weight: 600;
+    }
+    
+    #headerPriceLabel {
+        color: #0ECB81;
+        font-weight: 700;
+    }
+    
+    #currentPair {
+        color: #EAECEF;
+        font-weight: 600;
+    }
+    
+    #userLabel {
+        color: #848E9C;
+        font-size: 11px;
+    }
+    
+    #depositButton {
+        background-color: #F0B90B;
+        color: #181A20;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 600;
+    }
+    
+    #depositButton:hover {
+        background-color: #F8D12F;
+    }
+    
+    #bonusButton {
+        background-color: #0ECB81;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 600;
+    }
+    
+    #bonusButton:hover {
+        background-color: #2EE5A0;
+    }
+    
+    #leaderboardButton {
+        background-color: #2B3139;
+        color: #F0B90B;
+        border: 1px solid #F0B90B;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 600;
+    }
+    
+    #leaderboardButton:hover {
+        background-color: #F0B90B;
+        color: #181A20;
+    }
+    
+    #logoutButton {
+        background-color: #2B3139;
+        color: #EAECEF;
+        border: 1px solid #2B3139;
+        border-radius: 4px;
+        padding: 6px 14px;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    
+    #logoutButton:hover {
+        background-color: #F0B90B;
+        color: #181A20;
+        border: 1px solid #F0B90B;
+    }
+    
+    /* Main Tabs - Market, Trading, P2P */
+    #mainTabs {
+        background-color: #0B0E11;
+        border: none;
+    }
+    
+    #mainTabs::pane {
+        background-color: #0B0E11;
+        border: none;
+        border-top: 1px solid #2B3139;
+    }
+    
+    #mainTabs::tab-bar {
+        background-color: #181A20;
+        border-bottom: 1px solid #2B3139;
+    }
+    
+    #mainTabs QTabBar::tab {
+        background-color: #181A20;
+        color: #848E9C;
+        border: none;
+        border-bottom: 2px solid transparent;
+        padding: 12px 24px;
+        font-size: 13px;
+        font-weight: 600;
+        min-width: 120px;
+    }
+    
+    #mainTabs QTabBar::tab:hover {
+        color: #EAECEF;
+        background-color: #1E2329;
+    }
+    
+    #mainTabs QTabBar::tab:selected {
+        color: #F0B90B;
+        border-bottom: 2px solid #F0B90B;
+        background-color: #0B0E11;
+    }
+    
+    /* Side Panels - Market List & Portfolio */
+    #marketPanel, #infoPanel {
+        background-color: #181A20;
+        border: none;
+        border-right: 1px solid #2B3139;
+    }
+    
+    /* Chart Panel */
+    #chartPanel {
+        background-color: #0B0E11;
+        border: none;
+    }
+    
+    /* Trading Panel - Center Chart Area */
+    #tradingPanel {
+        background-color: #0B0E11;
+        border: none;
+    }
+    
+    /* History Panel - Bottom Orders */
+    #historyPanel {
+        background-color: #181A20;
+        border-top: 1px solid #2B3139;
+    }
+    
+    #panelTitle {
+        color: #EAECEF;
+        padding: 8px 0px;
+        font-weight: 600;
+    }
+    
+    /* Price Display at Top of Chart */
+    #priceDisplay {
+        color: #848E9C;
+        background-color: transparent;
+        border: none;
+        padding: 10px 0px;
+    }
+    
+    #priceLabel, #balanceLabel {
+        color: #707A8A;
+        font-size: 11px;
+        font-weight: 500;
+    }
+    
+    #priceValue {
+        color: #EAECEF;
+        font-size: 20px;
+        font-weight: 600;
+    }
+    
+    #changeValue {
+        color: #0ECB81;
+        font-size: 13px;
+        font-weight: 600;
+    }
+    
+    /* Chart Controls - Time Interval Buttons */
+    #chartControls {
+        background-color: transparent;
+        border: none;
+        padding: 5px 0px;
+    }
+    
+    #intervalLabel {
+        color: #707A8A;
+        font-size: 12px;
+        padding: 0px 8px;
+        font-weight: 500;
+    }
+    
+    #intervalButton {
+        background-color: transparent;
+        color: #707A8A;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 12px;
+        font-weight: 500;
+        min-width: 32px;
+    }
+    
+    #intervalButton:hover {
+        background-color: #2B3139;
+        color: #EAECEF;
+    }
+    
+    #intervalButton:checked {
+        background-color: transparent;
+        color: #F0B90B;
+        border: none;
+        font-weight: 600;
+    }
+    
+    /* Buy & Sell Forms - Trading Panels */
+    #buyForm, #sellForm {
+        background-color: #181A20;
+        border: 1px solid #2B3139;
+        border-radius: 4px;
+    }
+    
+    #buyTitle {
+        color: #0ECB81;
+        font-size: 16px;
+        font-weight: 700;
+        padding: 10px 0px;
+    }
+    
+    #sellTitle {
+        color: #F6465D;
+        font-size: 16px;
+        font-weight: 700;
+        padding: 10px 0px;
+    }
+    
+    /* Labels - General Text */
+    QLabel {
+        color: #EAECEF;
+        font-size: 12px;
+    }
+    
+    /* Input Fields */
+    QLineEdit {
+        background-color: #1E2329;
+        color: #EAECEF;
+        border: 1px solid #2B3139;
+        border-radius: 4px;
+        padding: 10px 12px;
+        font-size: 13px;
+        selection-background-color: #F0B90B;
+    }
+    
+    QLineEdit:hover {
+        border: 1px solid #474D57;
+    }
+    
+    QLineEdit:focus {
+        border: 1px solid #F0B90B;
+        background-color: #1E2329;
+    }
+    
+    QLineEdit::placeholder {
+        color: #5E6673;
+    }
+    
+    /* Combo Box - Dropdowns */
+    QComboBox {
+        background-color: #1E2329;
+        color: #EAECEF;
+        border: 1px solid #2B3139;
+        border-radius: 4px;
+        padding: 8px 12px;
+        font-size: 13px;
+    }
+    
+    QComboBox:hover {
+        border: 1px solid #474D57;
+    }
+    
+    QComboBox:focus {
+        border: 1px solid #F0B90B;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 5px solid #707A8A;
+        margin-right: 8px;
+    }
+    
+    QComboBox QAbstractItemView {
+        background-color: #1E2329;
+        color: #EAECEF;
+        border: 1px solid #2B3139;
+        selection-background-color: #2B3139;
+        selection-color: #F0B90B;
+        outline: none;
+    }
+    
+    /* Coin Combo - Special styling for coin selector */
+    #coinCombo {
+        background-color: #1E2329;
+        color: #EAECEF;
+        border: 1px solid #2B3139;
+        border-radius: 4px;
+        padding: 10px 12px;
+        font-size: 14px;
+        font-weight: 600;
+    }
+    
+    #coinCombo:hover {
+        border: 1px solid #F0B90B;
+    }
+    
+    #coinCombo QAbstractItemView {
+        background-color: #1E2329;
+        color: #EAECEF;
+        border: 1px solid #2B3139;
+        selection-background-color: #2B3139;
+        selection-color: #F0B90B;
+        outline: none;
+        padding: 8px;
+    }
+    
+    #coinCombo QAbstractItemView::item {
+        padding: 8px;
+        min-height: 30px;
+    }
+    
+    /* Buy Button - Green */
+    #buyButton {
+        background-color: #0ECB81;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 4px;
+        font-weight: 600;
+        font-size: 14px;
+        padding: 12px;
+    }
+    
+    #buyButton:hover {
+        background-color: #2EE5A0;
+    }
+    
+    #buyButton:pressed {
+        background-color: #0AA66E;
+    }
+    
+    /* Sell Button - Red */
+    #sellButton {
+        background-color: #F6465D;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 4px;
+        font-weight: 600;
+        font-size: 14px;
+        padding: 12px;
+    }
+    
+    #sellButton:hover {
+        background-color: #FF6479;
+    }
+    
+    #sellButton:pressed {
+        background-color: #D93A50;
+    }
+    
+    /* Tables - Market List, Order History */
+    QTableView {
+        background-color: transparent;
+        color: #EAECEF;
+        gridline-color: #2B3139;
+        border: none;
+        font-size: 12px;
+    }
+    
+    QTableView::item {
+        padding: 8px 6px;
+        border-bottom: 1px solid #2B3139;
+    }
+    
+    QTableView::item:selected {
+        background-color: #2B3139;
+        color: #EAECEF;
+    }
+    
+    QTableView::item:hover {
+        background-color: #1E2329;
+    }
+    
+    QHeaderView::section {
+        background-color: #181A20;
+        color: #707A8A;
+        padding: 10px 6px;
+        border: none;
+        border-bottom: 1px solid #2B3139;
+        font-weight: 600;
+        font-size: 11px;
+        text-transform: uppercase;
+    }
+    
+    /* Tabs - Order History Tabs */
+    QTabWidget::pane {
+        border: none;
+        background-color: transparent;
+        border-top: 1px solid #2B3139;
+    }
+    
+    QTabBar::tab {
+        background-color: transparent;
+        color: #707A8A;
+        padding: 10px 20px;
+        border: none;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: transparent;
+        color: #F0B90B;
+        border-bottom: 2px solid #F0B90B;
+    }
+    
+    QTabBar::tab:hover:!selected {
+        color: #EAECEF;
+    }
+    
+    /* Scrollbars */
+    QScrollBar:vertical {
+        background-color: transparent;
+        width: 6px;
+        margin: 0px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #2B3139;
+        border-radius: 3px;
+        min-height: 30px;
+    }
+    
+    QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {
+        background-color: #474D57;
+    }
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+    
+    QScrollBar:horizontal {
+        background-color: transparent;
+        height: 6px;
+        margin: 0px;
+    }
+    
+    QScrollBar::handle:horizontal {
+        background-color: #2B3139;
+        border-radius: 3px;
+        min-width: 30px;
+    }
+    
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+    
+    /* P2P Trading Styles */
+    #p2pCreatePanel {
+        background-color: #181A20;
+        border: 1px solid #2B3139;
+        border-radius: 4px;
+    }
+    
+    #p2pCombo, #p2pInput {
+        background-color: #1E2329;
+        color: #EAECEF;
+        border: 1px solid #2B3139;
+        border-radius: 3px;
+        padding: 6px;
+        font-size: 11px;
+    }
+    
+    #createOfferButton {
+        background-color: #F0B90B;
+        color: #181A20;
+        border: none;
+        border-radius: 3px;
+        font-weight: 600;
+        font-size: 12px;
+        padding: 8px;
+    }
+    
+    #createOfferButton:hover {
+        background-color: #F8D12F;
+    }
+    
+    #p2pOffersTable {
+        background-color: transparent;
+        color: #EAECEF;
+        gridline-color: #2B3139;
+        border: none;
+        font-size: 11px;
+    }
+    
+    #p2pOffersTable::item {
+        padding: 4px;
+    }
+    
+    #p2pOffersTabs {
+        background-color: transparent;
+    }
+    
+    #p2pOffersTabs::pane {
+        border: none;
+        background-color: transparent;
+    }
+    
+    #p2pOffersTabs QTabBar::tab {
+        background-color: transparent;
+        color: #707A8A;
+        padding: 8px 16px;
+        border: none;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    
+    #p2pOffersTabs QTabBar::tab:selected {
+        background-color: transparent;
+        color: #F0B90B;
+        border-bottom: 2px solid #F0B90B;
+    }
+    
+    /* Portfolio Tab Styles */
+    #portfolioTitle {
+        color: #F0B90B;
+        font-size: 24px;
+        font-weight: 700;
+    }
+    
+    #portfolioValueCard {
+        background-color: #1E2329;
+        border: 1px solid #2B3139;
+        border-radius: 8px;
+    }
+    
+    #valueTitle {
+        color: #848E9C;
+        font-size: 12px;
+    }
+    
+    #mutedLabel {
+        color: #848E9C;
+    }
+    
+    #versionLabel {
+        color: #71757a;
+        padding: 0 10px;
+    }
+    
+    #totalValue {
+        color: #0ECB81;
+        font-size: 32px;
+        font-weight: 700;
+    }
+    
+    #assetsTitle {
+        color: #EAECEF;
+        font-size: 16px;
+        font-weight: 600;
+    }
+    
+    #portfolioWalletTable {
+        background-color: #1E2329;
+        color: #EAECEF;
+        gridline-color: #2B3139;
+        border: 1px solid #2B3139;
+        border-radius: 4px;
+        font-size: 13px;
+    }
+    
+    #portfolioWalletTable::item {
+        padding: 12px;
+        border-bottom: 1px solid #2B3139;
+    }
+    
+    #portfolioWalletTable QHeaderView::section {
+        background-color: #181A20;
+        color: #848E9C;
+        border: none;
+        border-bottom: 1px solid #2B3139;
+        padding: 12px;
+        font-weight: 600;
+        font-size: 12px;
+    }
+    
+    #refreshButton {
+        background-color: #2B3139;
+        color: #EAECEF;
+        border: 1px solid #474D57;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 600;
+    }
+    
+    #refreshButton:hover {
+        background-color: #474D57;
+        border: 1px solid #F0B90B;
+        color: #F0B90B;
+    }
+"""), 'TradingWindow')
@@ -1,11 +1,115 @@
 """Web-based chart widget using TradingView lightweight charts."""
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QComboBox, QHBoxLayout, QLabel
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QComboBox, QHBoxLayout, QLabel
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineSettings
+from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEnginePage
 from PyQt6.QtCore import QUrl, Qt
 from PyQt6.QtGui import QFont
+import json
 import os
-import tempfile
+from functools import lru_cache
+
+
+# Base URL for pages loaded with setHtml, so the embed resolves like a web page
+CHART_BASE_URL = QUrl("https://s.tradingview.com/")
+
+
+# TradingView embed URL, filled in per symbol and interval
+CHART_URL = "https://s.tradingview.com/embed-widget/advanced-chart/?symbol={symbol}&interval={interval}&theme=dark&style=1&locale=en&toolbar_bg=%230B0E11&enable_publishing=false&hide_side_toolbar=false&allow_symbol_change=false&watchlist=&details=false&hotlist=false&calendar=false&studies=%5B%5D&support_host=https%3A%2F%2Fwww.tradingview.com"
+
+
+# On-disk HTTP cache for the TradingView scripts and styles, kept across runs
+WEB_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.virtualcoin', 'webcache')
+
+_chart_profile = None
+
+
+def get_chart_profile():
+    """Return the web profile shared by every chart view.
+    
+    Created on first use (it needs the QApplication) with a persistent disk
+    cache, so cold starts load the chart assets from disk instead of the
+    network. Cookies are not persisted.
+    """
+    global _chart_profile
+    if _chart_profile is None:
+        _chart_profile = QWebEngineProfile("virtualcoin_charts", QApplication.instance())
+        _chart_profile.setCachePath(WEB_CACHE_DIR)
+        _chart_profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        _chart_profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies)
+    return _chart_profile
+
+
+@lru_cache(maxsize=64)
+def build_chart_url(symbol, interval):
+    """Build the TradingView embed URL for a symbol and interval (bounded cache shared by all widgets)."""
+    return CHART_URL.format(symbol=symbol, interval=interval)
+
+
+# Page hosting TradingView's simple iframe embed (id "tv", more reliable than
+# the JS widget). It is loaded once, when the widget is built, and
+# update_chart points the iframe at each chart; the preconnect hints start
+# the TradingView handshakes while the window lays out.
+CHART_PAGE_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <link rel="preconnect" href="https://s.tradingview.com" crossorigin>
+    <link rel="dns-prefetch" href="https://www.tradingview.com">
+    <style>
+        body {
+            margin: 0;
+            padding: 0;
+            background-color: #0B0E11;
+            overflow: hidden;
+        }
+        iframe {
+            border: none;
+            width: 100%;
+            height: 100vh;
+        }
+    </style>
+</head>
+<body>
+    <iframe id="tv"
+            src="about:blank" 
+            width="100%" 
+            height="100%" 
+            frameborder="0" 
+            allowtransparency="true" 
+            scrolling="no">
+    </iframe>
+</body>
+</html>
+"""
+
+
+# Placeholder page for plot_empty (braces doubled for str.format)
+EMPTY_PAGE_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body {{
+            margin: 0;
+            padding: 0;
+            background-color: #0B0E11;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            height: 100vh;
+            font-family: 'Segoe UI', sans-serif;
+            color: #8e99a8;
+            font-size: 14px;
+        }}
+    </style>
+</head>
+<body>
+    <div>{message}</div>
+</body>
+</html>
+"""
 
 
 class CoinGeckoChartWidget(QWidget):
@@ -31,6 +135,17 @@ class CoinGeckoChartWidget(QWidget):
         'USDT': 'USDTUSD'
     }
     
+    # Interval combo text -> TradingView interval value
+    INTERVALS = {
+        '1m': '1',
+        '5m': '5',
+        '15m': '15',
+        '1h': '60',
+        '4h': '240',
+        '1D': 'D',
+        '1W': 'W'
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -84,6 +199,7 @@ class CoinGeckoChartWidget(QWidget):
         
         # Web view for embedded chart
         self.web_view = QWebEngineView()
+        self.web_view.setPage(QWebEnginePage(get_chart_profile(), self.web_view))
         self.web_view.setStyleSheet("background-color: #0B0E11;")
         
         # Enable JavaScript
@@ -97,7 +213,18 @@ class CoinGeckoChartWidget(QWidget):
         
         # Current coin
         self.current_symbol = 'BTCUSD'
-        self.temp_file_path = None
+        
+        # (symbol, interval) of the chart currently shown, and whether the
+        # chart page is loaded (so later charts only swap its iframe)
+        self.chart_key = None
+        self.chart_page_ready = False
+        self.chart_page_pending = False
+        # Message of the empty-state page currently shown (None while charting)
+        self.empty_message = None
+        self.web_view.loadFinished.connect(self.on_load_finished)
+        
+        # Warm up the page (and the TradingView connections) before the first chart
+        self.load_chart_page()
         
     def load_chart(self, symbol: str):
         """Load TradingView chart for the given symbol."""
@@ -108,66 +235,45 @@ class CoinGeckoChartWidget(QWidget):
     def update_chart(self):
         """Update the chart with current settings."""
         # Map display text to TradingView interval values
-        interval_text = self.interval_combo.currentText()
-        interval_map = {
-            '1m': '1',
-            '5m': '5',
-            '15m': '15',
-            '1h': '60',
-            '4h': '240',
-            '1D': 'D',
-            '1W': 'W'
-        }
-        interval = interval_map.get(interval_text, '60')
-        
-        # Use TradingView's simple iframe embed (more reliable)
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            background-color: #0B0E11;
-            overflow: hidden;
-        }}
-        iframe {{
-            border: none;
-            width: 100%;
-            height: 100vh;
-        }}
-    </style>
-</head>
-<body>
-    <iframe src="https://s.tradingview.com/embed-widget/advanced-chart/?symbol={self.current_symbol}&interval={interval}&theme=dark&style=1&locale=en&toolbar_bg=%230B0E11&enable_publishing=false&hide_side_toolbar=false&allow_symbol_change=false&watchlist=&details=false&hotlist=false&calendar=false&studies=%5B%5D&support_host=https%3A%2F%2Fwww.tradingview.com" 
-            width="100%" 
-            height="100%" 
-            frameborder="0" 
-            allowtransparency="true" 
-            scrolling="no">
-    </iframe>
-</body>
-</html>
-        """
-        
-        # Save to temporary file and load
-        if self.temp_file_path and os.path.exists(self.temp_file_path):
-            try:
-                os.remove(self.temp_file_path)
-            except:
-                pass
+        interval = self.INTERVALS.get(self.interval_combo.currentText(), '60')
         
-        # Create temp file
-        temp_dir = tempfile.gettempdir()
-        self.temp_file_path = os.path.join(temp_dir, f'tradingview_chart_{id(self)}.html')
+        # Same symbol and interval as the page already shown - nothing to reload
+        key = (self.current_symbol, interval)
+        if key == self.chart_key:
+            return
+        self.chart_key = key
+        self.empty_message = None
         
-        with open(self.temp_file_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        if self.chart_page_ready:
+            self.show_current_chart()
+        elif not self.chart_page_pending:
+            # on_load_finished shows the chart once the page is up
+            self.load_chart_page()
+    
+    def load_chart_page(self):
+        """Load the page hosting the chart iframe."""
+        self.chart_page_pending = True
+        self.show_html(CHART_PAGE_HTML)
+    
+    def show_current_chart(self):
+        """Point the loaded page's iframe at the current chart.
         
-        # Load the file
-        self.web_view.setUrl(QUrl.fromLocalFile(self.temp_file_path))
+        Only the iframe navigates; the page itself is never torn down and
+        reloaded.
+        """
+        url = build_chart_url(*self.chart_key)
+        self.web_view.page().runJavaScript(f"document.getElementById('tv').src = {json.dumps(url)};")
+    
+    def on_load_finished(self, ok):
+        """Note whether the page that just loaded is the chart page."""
+        self.chart_page_ready = ok and self.chart_page_pending
+        self.chart_page_pending = False
+        if self.chart_page_ready and self.chart_key:
+            self.show_current_chart()
+    
+    def show_html(self, html):
+        """Load an HTML page into the web view straight from memory."""
+        self.web_view.setHtml(html, CHART_BASE_URL)
     
     def plot_candlestick(self, data, title=""):
         """Compatibility method - redirects to TradingView chart."""
@@ -178,51 +284,14 @@ class CoinGeckoChartWidget(QWidget):
     
     def plot_empty(self, message=""):
         """Display empty state."""
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            background-color: #0B0E11;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            height: 100vh;
-            font-family: 'Segoe UI', sans-serif;
-            color: #8e99a8;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <div>{message or "Select a trading pair to view chart"}</div>
-</body>
-</html>
-        """
+        message = message or "Select a trading pair to view chart"
+        # Already showing this message - skip reloading the same page
+        if message == self.empty_message:
+            return
+        self.empty_message = message
         
-        if self.temp_file_path and os.path.exists(self.temp_file_path):
-            try:
-                os.remove(self.temp_file_path)
-            except:
-                pass
-        
-        temp_dir = tempfile.gettempdir()
-        self.temp_file_path = os.path.join(temp_dir, f'tradingview_empty_{id(self)}.html')
-        
-        with open(self.temp_file_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-        
-        self.web_view.setUrl(QUrl.fromLocalFile(self.temp_file_path))
-    
-    def __del__(self):
-        """Cleanup temp file on destruction."""
-        if hasattr(self, 'temp_file_path') and self.temp_file_path and os.path.exists(self.temp_file_path):
-            try:
-                os.remove(self.temp_file_path)
-            except:
-                pass
+        # The chart page is gone, so the next update_chart must reload it
+        self.chart_key = None
+        self.chart_page_ready = self.chart_page_pending = False
+        self.show_html(EMPTY_PAGE_HTML.format(message=message))
 
@@ -4,6 +4,7 @@ Pulls latest code from GitHub and rebuilds the application
 """
 import os
 import sys
+import hashlib
 import subprocess
 import shutil
 from pathlib import Path
@@ -16,6 +17,9 @@ class AutoUpdater:
         self.repo_path = Path(__file__).parent
         self.backup_path = self.repo_path / "DuckyTrading.exe.backup"
         self.exe_path = self.repo_path / "dist" / "DuckyTrading" / "DuckyTrading.exe"
+        self.requirements_hash_path = self.repo_path / ".requirements_hash"
+        # Incoming commits (git log --oneline), None if they could not be listed
+        self.changelog = None
         
     def print_header(self, text):
         """Print a formatted header."""
@@ -42,39 +46,56 @@ class AutoUpdater:
             return False
         return True
         
-    def check_for_updates(self):
-        """Check if updates are available."""
-        print("[1/5] 🔍 Checking for updates...")
+    def start_fetch(self):
+        """Start fetching origin/master in the background.
         
-        # Fetch latest from origin
+        The fetch is the slow network step, so it is started before the
+        prechecks and collected in check_for_updates().
+        """
         try:
-            subprocess.run(
+            return subprocess.Popen(
                 ["git", "fetch", "origin", "master"],
                 cwd=self.repo_path,
-                capture_output=True,
-                check=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
             )
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to fetch updates: {e}")
+        except OSError:
+            return None
+        
+    def check_for_updates(self, fetch):
+        """Check if updates are available."""
+        print("[1/5] 🔍 Checking for updates...")
+        
+        # Wait for the fetch started by start_fetch()
+        if fetch is None:
+            print("❌ Failed to fetch updates: could not start git")
+            return False
+        _, error = fetch.communicate()
+        if fetch.returncode != 0:
+            print(f"❌ Failed to fetch updates: {error.strip() or f'git exited with {fetch.returncode}'}")
             return False
             
-        # Check if there are differences
+        # List incoming commits; the same output is the changelog, so one
+        # git call answers both "anything new?" and "what's new?"
         try:
             result = subprocess.run(
-                ["git", "diff", "--quiet", "HEAD", "origin/master"],
+                ["git", "log", "HEAD..origin/master", "--oneline", "--decorate"],
                 cwd=self.repo_path,
-                capture_output=True
+                capture_output=True,
+                text=True,
+                check=True
             )
-            
-            if result.returncode == 0:
-                print("✅ You already have the latest version!")
-                return False
-            else:
-                print("🆕 Updates available!")
-                return True
-                
         except subprocess.CalledProcessError:
+            self.changelog = None
             return True
+        
+        self.changelog = result.stdout.strip()
+        if not self.changelog:
+            print("✅ You already have the latest version!")
+            return False
+        print("🆕 Updates available!")
+        return True
             
     def show_changelog(self):
         """Show what's new in the update."""
@@ -82,22 +103,13 @@ class AutoUpdater:
         print("   What's New:")
         print("=" * 50)
         
-        try:
-            result = subprocess.run(
-                ["git", "log", "HEAD..origin/master", "--oneline", "--decorate"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if result.stdout.strip():
-                print(result.stdout)
-            else:
-                print("No commit messages available.")
-                
-        except subprocess.CalledProcessError:
+        # Collected by check_for_updates
+        if self.changelog is None:
             print("Could not retrieve changelog.")
+        elif self.changelog:
+            print(self.changelog)
+        else:
+            print("No commit messages available.")
             
     def confirm_update(self):
         """Ask user to confirm update."""
@@ -158,14 +170,29 @@ class AutoUpdater:
         if not requirements_file.exists():
             print("⚠️  requirements.txt not found, skipping...")
             return True
+        
+        # Skip pip's resolver entirely when requirements.txt is unchanged
+        # since the last successful install
+        requirements_hash = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+        try:
+            if self.requirements_hash_path.read_text().strip() == requirements_hash:
+                print("✅ Dependencies unchanged, skipping")
+                return True
+        except OSError:
+            pass  # No record yet - install
             
         try:
             subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r", "requirements.txt", "--quiet"],
+                [sys.executable, "-m", "pip", "install", "-r", "requirements.txt",
+                 "--prefer-binary", "--no-warn-script-location", "--quiet"],
                 cwd=self.repo_path,
                 check=True
             )
             print("✅ Dependencies updated")
+            try:
+                self.requirements_hash_path.write_text(requirements_hash)
+            except OSError as e:
+                print(f"⚠️  Could not save requirements hash: {e}")
             return True
             
         except subprocess.CalledProcessError as e:
@@ -201,15 +228,18 @@ class AutoUpdater:
         """Run the update process."""
         self.print_header("DuckyTrading Auto-Updater")
         
+        # Fetch while the prechecks run
+        fetch = self.start_fetch()
+        
         # Prechecks
-        if not self.check_git_installed():
-            return False
-            
-        if not self.check_is_git_repo():
+        if not self.check_git_installed() or not self.check_is_git_repo():
+            if fetch is not None:
+                fetch.kill()
+                fetch.wait()
             return False
             
         # Check for updates
-        if not self.check_for_updates():
+        if not self.check_for_updates(fetch):
             return True  # Already up to date
             
         # Show changelog
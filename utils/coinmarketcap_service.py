@@ -1,12 +1,68 @@
 """CoinMarketCap API integration for real-time cryptocurrency data."""
-import requests
+import threading
+import time
+from functools import lru_cache
+from urllib.parse import urlencode
+import numpy as np
+from array import array
+from collections import OrderedDict
 from typing import Dict, Optional, List
 from decimal import Decimal
 import os
 from dotenv import load_dotenv
+from utils.price_service import create_session, loads_json
 
 load_dotenv()
 
+# Seconds a quotes response is reused, and how many responses are kept
+QUOTES_CACHE_TTL = 5.0
+QUOTES_CACHE_SIZE = 256
+
+# Price/volume columns returned by get_ohlcv (float64 keeps full price precision)
+OHLCV_PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@lru_cache(maxsize=256)
+def quotes_query(ids: str, convert: str) -> str:
+    """Encoded query string for a quotes/latest request (the same few coin sets repeat)."""
+    return urlencode({'id': ids, 'convert': convert})
+
+
+class OHLCVColumns:
+    """Candles stored column-wise: one contiguous array per field.
+    
+    ``candles['close']`` is a plain float64 array ready for vectorized
+    indicator math (``candles['timestamp']`` is datetime64[ms]). Integer
+    indices, slices and iteration give the old list-of-dicts candles:
+    the API's ISO timestamp string plus float prices.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], timestamps: List[str]):
+        self.columns = columns
+        # Original timestamp strings for the per-candle dicts
+        self.timestamps = timestamps
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, slice):
+            return [self.candle(row) for row in range(*key.indices(len(self)))]
+        return self.candle(key)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self.candle(row)
+
+    def candle(self, row: int) -> Dict:
+        """One candle as a dict, in the types get_ohlcv used to return."""
+        candle = {'timestamp': self.timestamps[row]}
+        for field in OHLCV_PRICE_FIELDS:
+            candle[field] = float(self.columns[field][row])
+        return candle
+
 
 class CoinMarketCapService:
     """Fetches real-time cryptocurrency data from CoinMarketCap API."""
@@ -31,6 +87,10 @@ class CoinMarketCapService:
         'LINK': 1975,
         'MATIC': 3890
     }
+    ALL_SYMBOLS = tuple(COIN_MAP)
+    
+    # Response data is keyed by the ID as a string
+    ID_TO_SYMBOL = {str(coin_id): symbol for symbol, coin_id in COIN_MAP.items()}
     
     def __init__(self):
         """Initialize CoinMarketCap service."""
@@ -38,14 +98,41 @@ class CoinMarketCapService:
         if not self.api_key:
             raise ValueError("COINMARKETCAP_API_KEY not found in environment variables")
         
-        self.session = requests.Session()
+        # Pooled keep-alive connections with retries, shared setup with the price service
+        self.session = create_session()
         self.session.headers.update({
             'Accepts': 'application/json',
             'X-CMC_PRO_API_KEY': self.api_key,
         })
-        self.cache = {}
+        # Request URL -> (parsed JSON, expires_at), oldest first
+        self.cache = OrderedDict()
+        # Callers may share the service across worker threads
+        self.cache_lock = threading.Lock()
         self.last_update = {}
     
+    def _cached_get(self, url: str, ttl: float = QUOTES_CACHE_TTL, timeout: int = 10) -> Dict:
+        """GET url (query string included) and return the parsed JSON,
+        reusing a response younger than ttl.
+        
+        Back-to-back lookups for the same coin (e.g. get_price right after
+        get_market_data) share one request and one unit of API quota.
+        """
+        with self.cache_lock:
+            entry = self.cache.get(url)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        
+        response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        data = loads_json(response.content)
+        
+        with self.cache_lock:
+            self.cache[url] = (data, time.monotonic() + ttl)
+            self.cache.move_to_end(url)
+            if len(self.cache) > QUOTES_CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return data
+    
     def get_price(self, symbol: str, vs_currency: str = 'USD') -> Optional[float]:
         """
         Get current price for a cryptocurrency.
@@ -60,30 +147,18 @@ class CoinMarketCapService:
         if symbol == 'USDT' and vs_currency.upper() == 'USD':
             return 1.0
         
-        try:
-            coin_id = self.COIN_MAP.get(symbol)
-            if not coin_id:
-                return None
-            
-            url = f"{self.BASE_URL}/cryptocurrency/quotes/latest"
-            params = {
-                'id': coin_id,
-                'convert': vs_currency.upper()
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data.get('status', {}).get('error_code') == 0:
-                coin_data = data['data'][str(coin_id)]
-                price = coin_data['quote'][vs_currency.upper()]['price']
-                return float(price)
-            
-            return None
-        except Exception as e:
-            print(f"Error fetching price for {symbol}: {e}")
+        if symbol not in self.COIN_MAP:
             return None
+        
+        # Quote every mapped coin in one request: it costs the same API
+        # credit as a single coin, and the cached response then answers
+        # lookups for the other symbols until it expires
+        price = self.get_multiple_prices(self.ALL_SYMBOLS, vs_currency).get(symbol)
+        if price is None:
+            # One bad id fails (or drops out of) the whole batch; ask for
+            # this coin alone so the others can't take it down with them
+            price = self.get_multiple_prices([symbol], vs_currency).get(symbol)
+        return price
     
     def get_multiple_prices(self, symbols: List[str], vs_currency: str = 'USD') -> Dict[str, float]:
         """
@@ -103,26 +178,16 @@ class CoinMarketCapService:
             if not valid_ids:
                 return {}
             
-            url = f"{self.BASE_URL}/cryptocurrency/quotes/latest"
-            params = {
-                'id': ','.join(map(str, valid_ids)),
-                'convert': vs_currency.upper()
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            convert = vs_currency.upper()
+            url = f"{self.BASE_URL}/cryptocurrency/quotes/latest?{quotes_query(','.join(map(str, valid_ids)), convert)}"
+            data = self._cached_get(url)
             
-            data = response.json()
             prices = {}
-            
             if data.get('status', {}).get('error_code') == 0:
                 for coin_id, coin_data in data['data'].items():
-                    # Find symbol for this ID
-                    for symbol, cid in self.COIN_MAP.items():
-                        if cid == int(coin_id):
-                            price = coin_data['quote'][vs_currency.upper()]['price']
-                            prices[symbol] = float(price)
-                            break
+                    symbol = self.ID_TO_SYMBOL.get(coin_id)
+                    if symbol:
+                        prices[symbol] = float(coin_data['quote'][convert]['price'])
             
             return prices
         except Exception as e:
@@ -163,16 +228,8 @@ class CoinMarketCapService:
             if not coin_id:
                 return None
             
-            url = f"{self.BASE_URL}/cryptocurrency/quotes/latest"
-            params = {
-                'id': coin_id,
-                'convert': vs_currency.upper()
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            url = f"{self.BASE_URL}/cryptocurrency/quotes/latest?{quotes_query(str(coin_id), vs_currency.upper())}"
+            data = self._cached_get(url)
             if data.get('status', {}).get('error_code') == 0:
                 coin_data = data['data'][str(coin_id)]
                 quote = coin_data['quote'][vs_currency.upper()]
@@ -192,7 +249,7 @@ class CoinMarketCapService:
             print(f"Error fetching market data for {symbol}: {e}")
             return None
     
-    def get_ohlcv(self, symbol: str, interval: str = 'daily', limit: int = 100, vs_currency: str = 'USD') -> Optional[List[Dict]]:
+    def get_ohlcv(self, symbol: str, interval: str = 'daily', limit: int = 100, vs_currency: str = 'USD') -> Optional[OHLCVColumns]:
         """
         Get OHLCV (Open, High, Low, Close, Volume) data.
         
@@ -203,7 +260,7 @@ class CoinMarketCapService:
             vs_currency: Quote currency
         
         Returns:
-            List of OHLCV candles
+            OHLCVColumns of candles (timestamp plus OHLCV_PRICE_FIELDS), oldest first
         """
         try:
             coin_id = self.COIN_MAP.get(symbol)
@@ -221,25 +278,28 @@ class CoinMarketCapService:
             response = self.session.get(url, params=params, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             if data.get('status', {}).get('error_code') == 0:
                 quotes = data['data'][str(coin_id)]['quotes']
+                convert = vs_currency.upper()
                 
-                ohlcv_data = []
+                # Fill one buffer per column instead of a dict per candle
+                timestamps = []
+                buffers = {field: array('d') for field in OHLCV_PRICE_FIELDS}
+                opens, highs, lows, closes, volumes = buffers.values()
                 for quote in quotes:
-                    timestamp = quote['timestamp']
-                    ohlc = quote['quote'][vs_currency.upper()]
-                    
-                    ohlcv_data.append({
-                        'timestamp': timestamp,
-                        'open': float(ohlc['open']),
-                        'high': float(ohlc['high']),
-                        'low': float(ohlc['low']),
-                        'close': float(ohlc['close']),
-                        'volume': float(ohlc.get('volume', 0))
-                    })
+                    ohlc = quote['quote'][convert]
+                    timestamps.append(quote['timestamp'])
+                    opens.append(ohlc['open'])
+                    highs.append(ohlc['high'])
+                    lows.append(ohlc['low'])
+                    closes.append(ohlc['close'])
+                    volumes.append(ohlc.get('volume') or 0)
                 
-                return ohlcv_data
+                columns = {'timestamp': np.array([ts.rstrip('Z') for ts in timestamps], dtype='datetime64[ms]')}
+                for field, buffer in buffers.items():
+                    columns[field] = np.frombuffer(buffer, dtype=np.float64)
+                return OHLCVColumns(columns, timestamps)
             
             return None
         except Exception as e:
@@ -1,10 +1,42 @@
 """Supabase database client for crypto trading app."""
+import threading
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
+from collections import defaultdict
 from config import Config
 
 
+# Rows per request when reading whole tables (the API caps responses at 1000)
+WALLETS_PAGE_SIZE = 1000
+
+# Seconds before a database / storage request gives up
+POSTGREST_TIMEOUT = 30
+STORAGE_TIMEOUT = 20
+
+# One client per process, shared by every SupabaseDB so its keep-alive
+# connections (and auth setup) are reused
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> Client:
+    """Return the shared Supabase client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = create_client(
+                Config.SUPABASE_URL,
+                Config.SUPABASE_KEY,
+                options=ClientOptions(
+                    postgrest_client_timeout=POSTGREST_TIMEOUT,
+                    storage_client_timeout=STORAGE_TIMEOUT
+                )
+            )
+        return _client
+
+
 class SupabaseDB:
     """Database manager for Supabase operations."""
     
@@ -13,7 +45,7 @@ class SupabaseDB:
         if not Config.is_configured():
             raise ValueError("Supabase configuration is missing. Please set up .env file.")
         
-        self.client: Client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+        self.client: Client = get_client()
     
     # ==================== USER OPERATIONS ====================
     
@@ -108,6 +140,23 @@ class SupabaseDB:
             print(f"Error getting wallets: {e}")
             return []
     
+    def _get_all_wallets(self) -> List[Dict[str, Any]]:
+        """Get every user's wallets, paging past the API's row limit."""
+        wallets = []
+        while True:
+            # Stable order (one wallet per user and currency) so pages don't overlap
+            response = (self.client.table('Wallets').select('user_id, currency, balance')
+                        .order('user_id').order('currency')
+                        .range(len(wallets), len(wallets) + WALLETS_PAGE_SIZE - 1).execute())
+            page = response.data or []
+            wallets.extend(page)
+            if len(page) < WALLETS_PAGE_SIZE:
+                return wallets
+    
+    def get_wallets_map(self, user_id: int) -> Dict[str, Dict[str, Any]]:
+        """Get all wallets for a user keyed by currency (one query)."""
+        return {wallet['currency']: wallet for wallet in self.get_user_wallets(user_id)}
+    
     def get_wallet_balance(self, user_id: int, currency: str) -> Optional[Dict[str, Any]]:
         """Get balance for a specific currency."""
         try:
@@ -214,7 +263,7 @@ class SupabaseDB:
             return None
     
     def get_user_transactions(self, user_id: int, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get transaction history for a user."""
+        """Get transaction history for a user, newest first."""
         try:
             response = (self.client.table('Transactions')
                        .select('*')
@@ -227,6 +276,20 @@ class SupabaseDB:
             print(f"Error getting transactions: {e}")
             return []
     
+    def get_user_transactions_since(self, user_id: int, since) -> List[Dict[str, Any]]:
+        """Get a user's transactions created after a timestamp, oldest first."""
+        try:
+            response = (self.client.table('Transactions')
+                       .select('*')
+                       .eq('user_id', user_id)
+                       .gt('timestamp', since)
+                       .order('timestamp')
+                       .execute())
+            return response.data or []
+        except Exception as e:
+            print(f"Error getting transactions: {e}")
+            return []
+    
     def get_transactions_by_pair(self, user_id: int, pair: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get transactions for a specific trading pair."""
         try:
@@ -257,75 +320,25 @@ class SupabaseDB:
             current_price: Current market price
         
         Returns:
-            Dict with success status and details
+            Dict with success status and details (order, transaction, fee)
         """
         try:
-            # Parse trading pair
-            base_currency, quote_currency = pair.split('/')
-            
-            # Calculate total cost (including 0.1% fee)
-            fee_rate = 0.001
-            total_cost = amount * current_price
-            fee = total_cost * fee_rate
-            
-            # Get user wallets
-            if side == 'buy':
-                # Check if user has enough quote currency (e.g., USDT)
-                quote_wallet = self.get_wallet_balance(user_id, quote_currency)
-                if not quote_wallet or quote_wallet['balance'] < (total_cost + fee):
-                    return {'success': False, 'error': 'Insufficient balance'}
-                
-                # Update wallets
-                new_quote_balance = quote_wallet['balance'] - total_cost - fee
-                self.update_wallet_balance(user_id, quote_currency, new_quote_balance)
-                
-                base_wallet = self.get_wallet_balance(user_id, base_currency)
-                new_base_balance = (base_wallet['balance'] if base_wallet else 0.0) + amount
-                self.update_wallet_balance(user_id, base_currency, new_base_balance)
-                
-            else:  # sell
-                # Check if user has enough base currency (e.g., BTC)
-                base_wallet = self.get_wallet_balance(user_id, base_currency)
-                if not base_wallet or base_wallet['balance'] < amount:
-                    return {'success': False, 'error': 'Insufficient balance'}
-                
-                # Update wallets
-                new_base_balance = base_wallet['balance'] - amount
-                self.update_wallet_balance(user_id, base_currency, new_base_balance)
-                
-                quote_wallet = self.get_wallet_balance(user_id, quote_currency)
-                new_quote_balance = (quote_wallet['balance'] if quote_wallet else 0.0) + total_cost - fee
-                self.update_wallet_balance(user_id, quote_currency, new_quote_balance)
-            
-            # Create order record
-            order = self.create_order(
-                user_id=user_id,
-                pair=pair,
-                order_type='market',
-                side=side,
-                price=current_price,
-                amount=amount,
-                status='filled'
-            )
-            
-            # Create transaction record
-            if order:
-                transaction = self.create_transaction(
-                    user_id=user_id,
-                    order_id=order['order_id'],
-                    pair=pair,
-                    transaction_type=side,
-                    amount=amount,
-                    price=current_price,
-                    fee=fee
-                )
-            
-            return {
-                'success': True,
-                'order': order,
-                'transaction': transaction,
-                'fee': fee
-            }
+            # Balance check, both wallet updates and the order/transaction
+            # inserts run in one Postgres transaction (see
+            # migrate_supabase_market_order.sql)
+            response = self.client.rpc('execute_market_order', {
+                'p_user_id': user_id,
+                'p_pair': pair,
+                'p_side': side,
+                'p_amount': amount,
+                'p_price': current_price,
+                'p_timestamp': datetime.now().isoformat()
+            }).execute()
+            
+            result = response.data or {'success': False, 'error': 'No response from database'}
+            if result.get('success'):
+                result['fee'] = float(result['fee'])
+            return result
             
         except Exception as e:
             print(f"Error executing market order: {e}")
@@ -345,36 +358,88 @@ class SupabaseDB:
             Dict with total value and breakdown by currency
         """
         try:
-            wallets = self.get_user_wallets(user_id)
-            total_value = 0.0
-            breakdown = []
-            
-            for wallet in wallets:
-                currency = wallet['currency']
-                balance = wallet['balance']
-                
-                # USDT is already in USDT, others need conversion
-                if currency == 'USDT':
-                    value_in_usdt = balance
-                else:
-                    price = prices.get(currency, 0.0)
-                    value_in_usdt = balance * price
-                
-                total_value += value_in_usdt
-                breakdown.append({
-                    'currency': currency,
-                    'balance': balance,
-                    'value_usdt': value_in_usdt
-                })
-            
-            return {
-                'total_value': total_value,
-                'breakdown': breakdown
-            }
+            return self._portfolio_value(self.get_user_wallets(user_id), prices)
         except Exception as e:
             print(f"Error calculating portfolio value: {e}")
             return {'total_value': 0.0, 'breakdown': []}
     
+    def get_portfolio_snapshot(self, user_id: int, prices: Dict[str, float], since=None,
+                               today_start=None, limit: int = 1000) -> Dict[str, Any]:
+        """
+        Get wallets, transactions and portfolio value in one round trip
+        (the get_portfolio_snapshot function in
+        migrate_supabase_portfolio_snapshot.sql).
+        
+        Args:
+            user_id: User ID
+            prices: Dict of current prices {currency: price_in_usdt}
+            since: Return transactions created after this timestamp instead
+                of the recent history (the history is only needed once)
+            today_start: Also return transactions created since this time
+            limit: Number of recent transactions to return without `since`
+        
+        Returns:
+            Dict with wallets, wallets_by_currency, portfolio_value,
+            transactions (newest first, None with `since`),
+            transactions_since (oldest first, None without `since`) and
+            transactions_today (newest first, None without `today_start`)
+        """
+        try:
+            response = self.client.rpc('get_portfolio_snapshot', {
+                'p_user_id': user_id,
+                'p_since': since.isoformat() if hasattr(since, 'isoformat') else since,
+                'p_today_start': today_start.isoformat() if today_start else None,
+                'p_limit': limit
+            }).execute()
+            snapshot = response.data or {}
+        except Exception as e:
+            print(f"Error getting portfolio snapshot: {e}")
+            snapshot = {}
+        
+        wallets = snapshot.get('wallets') or []
+        try:
+            portfolio_value = self._portfolio_value(wallets, prices)
+        except Exception as e:
+            print(f"Error calculating portfolio value: {e}")
+            portfolio_value = {'total_value': 0.0, 'breakdown': []}
+        return {
+            'wallets': wallets,
+            'wallets_by_currency': {wallet['currency']: wallet for wallet in wallets},
+            'transactions': snapshot.get('transactions'),
+            'transactions_since': snapshot.get('transactions_since'),
+            'transactions_today': snapshot.get('transactions_today'),
+            'portfolio_value': portfolio_value
+        }
+    
+    @staticmethod
+    def _portfolio_value(wallets: List[Dict[str, Any]], prices: Dict[str, float]) -> Dict[str, Any]:
+        """Value wallets in USDT using {currency: price} prices."""
+        total_value = 0.0
+        breakdown = []
+        
+        for wallet in wallets:
+            currency = wallet['currency']
+            balance = wallet['balance']
+            
+            # USDT is already in USDT, others need conversion
+            if currency == 'USDT':
+                value_in_usdt = balance
+            else:
+                price = prices.get(currency, 0.0)
+                value_in_usdt = balance * price
+            
+            total_value += value_in_usdt
+            breakdown.append({
+                'currency': currency,
+                'balance': balance,
+                'value_usdt': value_in_usdt
+            })
+        
+        return {
+            'total_value': total_value,
+            'breakdown': breakdown
+        }
+    
     # ==================== DAILY LOGIN BONUS ====================
     
     def claim_daily_bonus(self, user_id: int) -> Dict[str, Any]:
@@ -464,13 +529,17 @@ class SupabaseDB:
             List of users ranked by total assets
         """
         try:
-            # Get all users
+            # Get all users and all wallets (two queries instead of one
+            # wallet query per user)
             users = self.client.table('Users').select('user_id, name, email').execute()
+            wallets_by_user = defaultdict(list)
+            for wallet in self._get_all_wallets():
+                wallets_by_user[wallet['user_id']].append(wallet)
             
             leaderboard = []
             for user in users.data:
                 user_id = user['user_id']
-                portfolio = self.get_portfolio_value(user_id, prices)
+                portfolio = self._portfolio_value(wallets_by_user[user_id], prices)
                 
                 leaderboard.append({
                     'rank': 0,  # Will be set later
@@ -506,33 +575,26 @@ class SupabaseDB:
             List of users ranked by holdings of specific coin
         """
         try:
-            # Get all wallets for this currency
-            wallets = self.client.table('Wallets').select('user_id, balance').eq('currency', currency).execute()
+            # Top wallets for this currency with their owners joined in,
+            # sorted and limited by Postgres
+            wallets = self.client.table('Wallets').select(
+                'user_id, balance, Users!Wallets_user_id_fkey(name, email)'
+            ).eq('currency', currency).order('balance', desc=True).limit(limit).execute()
             
-            # Get user details
             leaderboard = []
             for wallet in wallets.data:
-                user_id = wallet['user_id']
-                user = self.client.table('Users').select('name, email').eq('user_id', user_id).execute()
-                
-                if user.data:
+                user = wallet.get('Users')
+                if isinstance(user, dict):
                     leaderboard.append({
-                        'rank': 0,
-                        'user_id': user_id,
-                        'name': user.data[0]['name'],
-                        'email': user.data[0]['email'],
+                        'rank': len(leaderboard) + 1,
+                        'user_id': wallet['user_id'],
+                        'name': user['name'],
+                        'email': user['email'],
                         'balance': wallet['balance'],
                         'currency': currency
                     })
             
-            # Sort by balance descending
-            leaderboard.sort(key=lambda x: x['balance'], reverse=True)
-            
-            # Assign ranks
-            for i, entry in enumerate(leaderboard[:limit]):
-                entry['rank'] = i + 1
-            
-            return leaderboard[:limit]
+            return leaderboard
             
         except Exception as e:
             print(f"Error getting coin leaderboard: {e}")
@@ -4,6 +4,7 @@ import os
 from typing import Optional, List, Dict
 from datetime import datetime, timedelta
 from config import Config
+from utils.price_service import create_session, loads_json
 import time
 
 
@@ -25,7 +26,8 @@ class FreeCryptoAPIService:
         self.mode = 'api'
         self.base_url = Config.FREECRYPTO_BASE_URL
         self.api_key = Config.FREECRYPTO_API_KEY
-        self.session = requests.Session()
+        # Own session (not shared) since it carries the FreeCrypto auth header
+        self.session = create_session()
         
         # Caching to reduce API calls
         self.cache = {}  # Cache stored data
@@ -130,10 +132,10 @@ class FreeCryptoAPIService:
                 'limit': limit
             }
             
-            response = self.session.get(endpoint, params=params, timeout=10)
+            response = self.session.get(endpoint, params=params, timeout=(3, 10))
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             
             # Parse response based on FreeCryptoAPI format
             if isinstance(data, dict) and 'data' in data:
@@ -347,7 +349,7 @@ class FreeCryptoAPIService:
                 'Accept': 'application/json'
             }
             
-            response = self.session.get(url, params=params, headers=headers, timeout=15)
+            response = self.session.get(url, params=params, headers=headers, timeout=(3, 15))
             
             # If 401, try alternative approach with historical database
             if response.status_code == 401:
@@ -355,7 +357,7 @@ class FreeCryptoAPIService:
                 return self._get_ohlcv_from_historical_db(symbol, interval, limit)
             
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response.content)
             
             # Determine what interval we actually got based on days
             if days == 1:
@@ -77,6 +77,10 @@ class NeonDB:
         """Get all wallets for a user (alias for get_user_wallets)."""
         return self.get_user_wallets(user_id)
     
+    def get_wallets_map(self, user_id: int) -> Dict[str, Dict]:
+        """Get all wallets for a user keyed by currency (one query)."""
+        return {wallet['currency']: wallet for wallet in self.get_user_wallets(user_id)}
+    
     def get_wallet_balance(self, user_id: int, currency: str) -> Optional[Dict]:
         """Get wallet balance for specific currency."""
         query = 'SELECT * FROM "Wallets" WHERE user_id = %s AND currency = %s'
@@ -184,7 +188,7 @@ class NeonDB:
         return self._execute(query, (user_id, limit))
     
     def get_user_transactions(self, user_id: int, limit: int = 100) -> List[Dict]:
-        """Get transaction history for a user."""
+        """Get transaction history for a user, newest first."""
         query = '''
             SELECT * FROM "Transactions" 
             WHERE user_id = %s 
@@ -193,9 +197,63 @@ class NeonDB:
         '''
         return self._execute(query, (user_id, limit))
     
+    def get_user_transactions_since(self, user_id: int, since) -> List[Dict]:
+        """Get a user's transactions created after a timestamp, oldest first."""
+        query = '''
+            SELECT * FROM "Transactions" 
+            WHERE user_id = %s AND created_at > %s 
+            ORDER BY created_at
+        '''
+        return self._execute(query, (user_id, since))
+    
     def get_portfolio_value(self, user_id: int, prices: Dict) -> Dict:
         """Calculate total portfolio value."""
-        wallets = self.get_user_wallets(user_id)
+        return self._portfolio_value(self.get_user_wallets(user_id), prices)
+    
+    def get_portfolio_snapshot(self, user_id: int, prices: Dict, since=None, today_start=None, limit: int = 1000) -> Dict:
+        """Get wallets, transactions and portfolio value in one round trip.
+        
+        One statement returns every list as a JSON array, so rows come back
+        with JSON types (floats, ISO timestamp strings). The wallets are
+        reused for the portfolio value. Without `since`, transactions holds
+        the newest `limit` transactions (newest first); with it,
+        transactions is None and transactions_since holds only those
+        created after `since` (oldest first). transactions_today holds
+        those created since `today_start`, newest first (None without it).
+        """
+        columns = [
+            '''(SELECT COALESCE(json_agg(w ORDER BY w.currency), '[]') FROM "Wallets" w
+                WHERE w.user_id = %(user_id)s) AS wallets'''
+        ]
+        if since is None:
+            columns.append('''(SELECT COALESCE(json_agg(t ORDER BY t.created_at DESC), '[]') FROM (
+                    SELECT * FROM "Transactions" WHERE user_id = %(user_id)s
+                    ORDER BY created_at DESC LIMIT %(limit)s
+                ) t) AS transactions''')
+        else:
+            columns.append('''(SELECT COALESCE(json_agg(t ORDER BY t.created_at), '[]') FROM "Transactions" t
+                WHERE t.user_id = %(user_id)s AND t.created_at > %(since)s) AS transactions_since''')
+        if today_start is not None:
+            columns.append('''(SELECT COALESCE(json_agg(t ORDER BY t.created_at DESC), '[]') FROM "Transactions" t
+                WHERE t.user_id = %(user_id)s AND t.created_at >= %(today_start)s) AS transactions_today''')
+        
+        row = self._execute_one(
+            'SELECT ' + ', '.join(columns),
+            {'user_id': user_id, 'since': since, 'today_start': today_start, 'limit': limit}
+        ) or {}
+        wallets = row.get('wallets') or []
+        return {
+            'wallets': wallets,
+            'wallets_by_currency': {wallet['currency']: wallet for wallet in wallets},
+            'transactions': row.get('transactions'),
+            'transactions_since': row.get('transactions_since'),
+            'transactions_today': row.get('transactions_today'),
+            'portfolio_value': self._portfolio_value(wallets, prices)
+        }
+    
+    @staticmethod
+    def _portfolio_value(wallets: List[Dict], prices: Dict) -> Dict:
+        """Value wallets in USDT using {pair: price} prices."""
         total = 0.0
         breakdown = []
         
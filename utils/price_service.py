@@ -1,12 +1,48 @@
 """Real-time cryptocurrency price service with CoinMarketCap fallback."""
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional, List
-from datetime import datetime
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# orjson decodes API payloads several times faster; fall back to stdlib json
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    import json
+    loads_json = json.loads
+
+# (connect, read) timeout for outbound API calls
+REQUEST_TIMEOUT = (3, 8)
+
+# Seconds a /coins/markets snapshot (price + 24h change) stays fresh
+MARKETS_CACHE_DURATION = 60
+
+
+def create_session() -> requests.Session:
+    """Create a keep-alive session with pooled connections, retries and gzip."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+    session.mount('https://', adapter)
+    session.headers.update({
+        # Browser user-agent avoids 401 errors from some endpoints
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    return session
+
 
 class PriceService:
     """Fetches real-time cryptocurrency prices from CoinMarketCap with CoinGecko fallback or uses simulator."""
@@ -72,13 +108,8 @@ class PriceService:
         # API mode
         self.mode = 'api'
         self.simulator = None
-        self.session = requests.Session()
-        # Add user-agent to avoid 401 errors
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        self.cache = {}
-        self.cache_timestamp = {}
+        self.session = create_session()
+        self.cache = {}  # {cache_key: (value, expires_at)}
         self.cache_duration = 180  # Cache for 3 minutes (optimized for multi-user)
         
         # Rate limiting tracking for CoinMarketCap Basic Plan
@@ -139,8 +170,9 @@ class PriceService:
         
         # Check cache
         cache_key = f"{symbol}_{vs_currency}"
-        if self._is_cached(cache_key):
-            return self.cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
         
         # Try CoinMarketCap first if available
         if self.use_cmc:
@@ -175,13 +207,13 @@ class PriceService:
                 'convert': vs_currency.upper()
             }
             
-            response = self.session.get(url, params=params, headers=self.cmc_headers, timeout=8)
+            response = self.session.get(url, params=params, headers=self.cmc_headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Track API call
             self._track_api_call()
             
-            data = response.json()
+            data = loads_json(response.content)
             if data.get('status', {}).get('error_code') == 0:
                 coin_data = data['data'][str(coin_id)]
                 price = coin_data['quote'][vs_currency.upper()]['price']
@@ -205,10 +237,10 @@ class PriceService:
                 'vs_currencies': vs_currency
             }
             
-            response = self.session.get(url, params=params, timeout=8)
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             price = data.get(coin_id, {}).get(vs_currency)
             
             return float(price) if price else None
@@ -216,10 +248,9 @@ class PriceService:
             print(f"CoinGecko API error for {symbol}: {e}")
             return None
     
-    def _cache_price(self, cache_key: str, price: float):
-        """Cache a price."""
-        self.cache[cache_key] = price
-        self.cache_timestamp[cache_key] = datetime.now()
+    def _cache_price(self, cache_key: str, price, ttl: Optional[float] = None):
+        """Cache a price (or any value) for ttl seconds (default cache_duration)."""
+        self.cache[cache_key] = (price, time.monotonic() + (ttl or self.cache_duration))
     
     
     def get_multiple_prices(self, symbols: List[str], vs_currency: str = 'usd') -> Dict[str, float]:
@@ -279,10 +310,10 @@ class PriceService:
                 'convert': vs_currency.upper()
             }
             
-            response = self.session.get(url, params=params, headers=self.cmc_headers, timeout=10)
+            response = self.session.get(url, params=params, headers=self.cmc_headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             prices = {}
             
             if data.get('status', {}).get('error_code') == 0:
@@ -306,9 +337,9 @@ class PriceService:
         
         # Check cache first
         for symbol in symbols:
-            cache_key = f"{symbol}_{vs_currency}"
-            if self._is_cached(cache_key):
-                prices[symbol] = self.cache[cache_key]
+            cached = self._get_cached(f"{symbol}_{vs_currency}")
+            if cached is not None:
+                prices[symbol] = cached
         
         # Get uncached symbols
         uncached = [s for s in symbols if s not in prices]
@@ -326,10 +357,10 @@ class PriceService:
                 'vs_currencies': vs_currency
             }
             
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             
             for symbol in uncached:
                 coin_id = self.COINGECKO_COIN_IDS.get(symbol)
@@ -354,10 +385,10 @@ class PriceService:
                 'vs_currencies': vs_currency
             }
             
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             
             # Map results back to symbols
             for symbol in other_symbols:
@@ -367,9 +398,7 @@ class PriceService:
                     if price:
                         prices[symbol] = price
                         # Cache individual prices
-                        cache_key = f"{symbol}_{vs_currency}"
-                        self.cache[cache_key] = price
-                        self.cache_timestamp[cache_key] = datetime.now()
+                        self._cache_price(f"{symbol}_{vs_currency}", price)
             
             return prices
             
@@ -380,7 +409,7 @@ class PriceService:
                 for symbol in other_symbols:
                     cache_key = f"{symbol}_{vs_currency}"
                     if cache_key in self.cache:
-                        prices[symbol] = self.cache[cache_key]
+                        prices[symbol] = self.cache[cache_key][0]
             else:
                 print(f"Error fetching multiple prices: {e}")
             return prices
@@ -390,7 +419,7 @@ class PriceService:
             for symbol in other_symbols:
                 cache_key = f"{symbol}_{vs_currency}"
                 if cache_key in self.cache:
-                    prices[symbol] = self.cache[cache_key]
+                    prices[symbol] = self.cache[cache_key][0]
             return prices
     
     def get_pair_price(self, pair: str) -> Optional[float]:
@@ -446,8 +475,9 @@ class PriceService:
         
         # Check if we have cached 24h change data
         cache_key = f"{symbol}_24h_change"
-        if self._is_cached(cache_key):
-            return self.cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
         
         # Try to calculate from historical data in database
         try:
@@ -470,9 +500,7 @@ class PriceService:
                         'current_price': current_price
                     }
                     
-                    # Cache for 5 minutes
-                    self.cache[cache_key] = result
-                    self.cache_timestamp[cache_key] = datetime.now()
+                    self._cache_price(cache_key, result)
                     
                     return result
         except:
@@ -490,6 +518,147 @@ class PriceService:
         
         return None
     
+    def get_markets_bulk(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Get price and 24h change for several symbols in bulk.
+        Tries one CoinMarketCap quotes request first when available, then
+        CoinGecko's /coins/markets endpoint (up to 250 coins per call) for
+        the rest.
+        
+        Args:
+            symbols: List of crypto symbols
+        
+        Returns:
+            Dict mapping symbol to {'price': ..., 'change_24h': ...}; symbols
+            that could not be fetched are left out
+        """
+        # Simulator mode
+        if self.mode == 'simulator':
+            markets = {}
+            for symbol in symbols:
+                change_data = self.simulator.get_24h_change(symbol)
+                if change_data:
+                    markets[symbol] = {
+                        'price': change_data['current_price'],
+                        'change_24h': change_data['price_change_percentage_24h']
+                    }
+            return markets
+        
+        markets = {}
+        missing = []
+        for symbol in symbols:
+            cached = self._get_cached(f"{symbol}_market")
+            if cached is None:
+                missing.append(symbol)
+            elif cached:
+                # An empty dict marks a symbol no source could provide
+                markets[symbol] = cached
+        if not missing:
+            return markets
+        
+        cached_count = len(markets)
+        
+        # Try CoinMarketCap first if available
+        if self.use_cmc:
+            markets.update(self._get_markets_from_cmc(missing))
+            missing = [s for s in missing if s not in markets]
+        
+        # Fallback to CoinGecko for remaining symbols
+        if missing:
+            markets.update(self._get_markets_from_coingecko(missing))
+            missing = [s for s in missing if s not in markets]
+        
+        # Both bulk requests failed (e.g. offline): retry them next tick
+        if len(markets) == cached_count:
+            return markets
+        
+        # Coins the bulk responses left out: ask per symbol, and remember
+        # the answer (or its absence) so the next ticks don't ask again
+        for symbol in missing:
+            change_data = self.get_24h_change(symbol)
+            market = {}
+            if change_data and change_data.get('current_price'):
+                market = {
+                    'price': float(change_data['current_price']),
+                    'change_24h': float(change_data.get('price_change_percentage_24h') or 0)
+                }
+                markets[symbol] = market
+            self._cache_price(f"{symbol}_market", market, MARKETS_CACHE_DURATION)
+        
+        return markets
+    
+    def _get_markets_from_cmc(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """Get price and 24h change for several symbols from CoinMarketCap."""
+        ids = {self.CMC_COIN_MAP[s]: s for s in symbols if s in self.CMC_COIN_MAP}
+        if not ids or not self._check_rate_limit():
+            return {}
+        
+        try:
+            url = f"{self.CMC_BASE_URL}/cryptocurrency/quotes/latest"
+            params = {
+                'id': ','.join(map(str, ids)),
+                'convert': 'USD'
+            }
+            
+            response = self.session.get(url, params=params, headers=self.cmc_headers, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            self._track_api_call()
+            
+            data = loads_json(response.content)
+            markets = {}
+            if data.get('status', {}).get('error_code') == 0:
+                for coin_id, coin_data in data['data'].items():
+                    symbol = ids.get(int(coin_id))
+                    quote = coin_data['quote']['USD']
+                    if symbol and quote.get('price'):
+                        market = {
+                            'price': float(quote['price']),
+                            'change_24h': float(quote.get('percent_change_24h') or 0)
+                        }
+                        markets[symbol] = market
+                        self._cache_price(f"{symbol}_market", market, MARKETS_CACHE_DURATION)
+            return markets
+        except Exception as e:
+            print(f"CoinMarketCap markets API error: {e}")
+            return {}
+    
+    def _get_markets_from_coingecko(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """Get price and 24h change for several symbols from CoinGecko /coins/markets."""
+        symbols_by_id = {
+            self.COINGECKO_COIN_IDS[s]: s
+            for s in symbols
+            if s in self.COINGECKO_COIN_IDS
+        }
+        if not symbols_by_id:
+            return {}
+        
+        markets = {}
+        try:
+            url = f"{self.COINGECKO_BASE_URL}/coins/markets"
+            params = {
+                'vs_currency': 'usd',
+                'ids': ','.join(symbols_by_id),
+                'per_page': 250,
+                'price_change_percentage': '24h'
+            }
+            
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            
+            for coin in loads_json(response.content):
+                symbol = symbols_by_id.get(coin.get('id'))
+                if symbol and coin.get('current_price'):
+                    market = {
+                        'price': float(coin['current_price']),
+                        'change_24h': float(coin.get('price_change_percentage_24h') or 0)
+                    }
+                    markets[symbol] = market
+                    self._cache_price(f"{symbol}_market", market, MARKETS_CACHE_DURATION)
+        except Exception as e:
+            print(f"CoinGecko markets API error: {e}")
+        
+        return markets
+    
     def _get_24h_change_from_cmc(self, symbol: str) -> Optional[Dict[str, float]]:
         """Get 24h change from CoinMarketCap API."""
         # Check rate limit
@@ -507,13 +676,13 @@ class PriceService:
                 'convert': 'USD'
             }
             
-            response = self.session.get(url, params=params, headers=self.cmc_headers, timeout=8)
+            response = self.session.get(url, params=params, headers=self.cmc_headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Track API call
             self._track_api_call()
             
-            data = response.json()
+            data = loads_json(response.content)
             if data.get('status', {}).get('error_code') == 0:
                 coin_data = data['data'][str(coin_id)]
                 quote = coin_data['quote']['USD']
@@ -546,10 +715,10 @@ class PriceService:
                 'sparkline': 'false'
             }
             
-            response = self.session.get(url, params=params, timeout=8)
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = loads_json(response.content)
             market_data = data.get('market_data', {})
             
             return {
@@ -562,17 +731,12 @@ class PriceService:
             print(f"CoinGecko 24h change error for {symbol}: {e}")
             return None
     
-    def _is_cached(self, cache_key: str) -> bool:
-        """Check if cached value is still valid."""
-        if cache_key not in self.cache:
-            return False
-        
-        timestamp = self.cache_timestamp.get(cache_key)
-        if not timestamp:
-            return False
-        
-        age = (datetime.now() - timestamp).total_seconds()
-        return age < self.cache_duration
+    def _get_cached(self, cache_key: str):
+        """Return the cached value if it has not expired, else None."""
+        entry = self.cache.get(cache_key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
     
     def _check_rate_limit(self) -> bool:
         """
@@ -660,7 +824,6 @@ class PriceService:
     def clear_cache(self):
         """Clear the price cache."""
         self.cache = {}
-        self.cache_timestamp = {}
 
 
 # Singleton instance